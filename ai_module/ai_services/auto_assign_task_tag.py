@@ -1,107 +1,170 @@
 import re
-import spacy
-from transformers import pipeline
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
-import warnings
-warnings.filterwarnings('ignore')
-
-# Initialize models (load once, use many times)
-try:
-    nlp = spacy.load("en_core_web_sm")
-except OSError:
-    print("⚠️ spaCy model not found. Install with: python -m spacy download en_core_web_sm")
-    nlp = None
-
-try:
-    # Initialize Hugging Face classifier
-    classifier = pipeline("zero-shot-classification",
-                         model="facebook/bart-large-mnli",
-                         device=-1)  # Use CPU
-except Exception as e:
-    print(f"⚠️ Transformers model loading failed: {e}")
-    classifier = None
-
-# Download NLTK data if not present
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
-    nltk.download('stopwords')
+
+from ai_module.ai_services.model_registry import ModelRegistry, NLP, STOPWORDS
+from tasks.services.metrics import track_inference
+from tasks.services.server_timing import span
 
 # =============================================================================
 # CONSTANTS
 # =============================================================================
 MAX_TEXT_LENGTH = 1024  # Limit text length for NLP processing to optimize performance
+SPACY_BATCH_SIZE = 64
+
+PREDEFINED_TAGS = {
+    'work': ['work', 'job', 'office', 'meeting', 'project', 'client', 'deadline', 'presentation'],
+    'learning': ['learn', 'study', 'course', 'tutorial', 'book', 'research', 'practice'],
+    'health': ['doctor', 'gym', 'exercise', 'medical', 'appointment', 'fitness', 'diet'],
+    'personal': ['personal', 'family', 'friend', 'home', 'hobby', 'vacation'],
+    'finance': ['bank', 'money', 'budget', 'bill', 'payment', 'insurance', 'tax'],
+    'shopping': ['buy', 'purchase', 'shop', 'order', 'store', 'market'],
+    'urgent': ['urgent', 'asap', 'critical', 'important', 'emergency'],
+    'ai': ['ai', 'ml', 'machine learning', 'artificial intelligence', 'data science'],
+    'backend': ['backend', 'server', 'database', 'api', 'django', 'python'],
+    'frontend': ['frontend', 'ui', 'ux', 'react', 'javascript', 'css', 'html']
+}
+
+# Keywords match whole words only, so "ai" does not hit "maintain", "ui" does not hit
+# "build" and "home" does not hit "homework". Every keyword also matches its plural;
+# the verbs below also match their -ed/-ing forms ("learning", "shopping"), the
+# nouns do not ("booking a flight" is not about a book, "ordering pizza" is not shopping).
+VERB_KEYWORDS = frozenset({
+    'work', 'learn', 'study', 'practice', 'exercise', 'buy', 'purchase', 'shop',
+})
+
+VOWELS = frozenset('aeiou')
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def _inflections(keyword):
+    """`keyword` and the inflected forms it matches (only the last word of a phrase is inflected)."""
+    forms = {keyword, keyword + 's', keyword + 'es'}
+    if keyword.endswith('y') and keyword[-2:-1] not in VOWELS:
+        forms.add(keyword[:-1] + 'ies')
+    if keyword in VERB_KEYWORDS:
+        if keyword.endswith('e'):
+            forms.update({keyword + 'd', keyword[:-1] + 'ing'})
+        elif keyword.endswith('y') and keyword[-2:-1] not in VOWELS:
+            forms.update({keyword[:-1] + 'ied', keyword + 'ing'})
+        else:
+            forms.update({keyword + 'ed', keyword + 'ing'})
+            # consonant-vowel-consonant: shop -> shopped, shopping
+            if (len(keyword) >= 3 and keyword[-1] not in VOWELS | {'w', 'x', 'y'}
+                    and keyword[-2] in VOWELS and keyword[-3] not in VOWELS):
+                forms.update({keyword + keyword[-1] + 'ed', keyword + keyword[-1] + 'ing'})
+    return forms
+
+
+def _trie_pattern(keywords):
+    """
+    Regex alternation of `keywords` factored into a prefix trie ("a(?:i|pi)" rather
+    than "ai|api"), so the regex engine follows a single branch per character.
+    A space inside a keyword matches any run of whitespace.
+    """
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def _node_pattern(node):
+        branches = [
+            (r"\s+" if char == " " else re.escape(char)) + _node_pattern(child)
+            for char, child in sorted(node.items()) if char
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        # a keyword ends here: the longer continuations are optional
+        return f"(?:{body})?" if "" in node else body
+
+    return _node_pattern(trie)
+
+
+def _compile_keyword_matcher(tag_table):
+    """
+    One regex for every form of every keyword of every tag, compiled once at import.
+    Group 1 captures the matched word (or phrase).
+    Returns: (compiled pattern, {form: tag})
+    """
+    keyword_tags = {}
+    for tag, keywords in tag_table.items():
+        for keyword in keywords:
+            for form in _inflections(keyword):
+                keyword_tags.setdefault(form, tag)
+
+    pattern = re.compile(rf"(?<!\w)({_trie_pattern(keyword_tags)})(?!\w)")
+    return pattern, keyword_tags
+
+
+KEYWORD_PATTERN, KEYWORD_TAGS = _compile_keyword_matcher(PREDEFINED_TAGS)
+
 
 # =============================================================================
 # 1. EXTRACT TAGS FROM TEXT
 # =============================================================================
-def extract_tags_from_text(title, description):
+def _tag_source_text(title, description):
+    # original case on purpose: spaCy NER relies on capitalisation
+    return f"{title} {description[:MAX_TEXT_LENGTH]}"
+
+
+def match_predefined_tags(text):
+    """Predefined tags whose keywords occur in `text` (lower-case), in PREDEFINED_TAGS order."""
+    matched = set()
+    for match in KEYWORD_PATTERN.finditer(text):
+        keyword = " ".join(match.group(1).split())
+        matched.add(KEYWORD_TAGS[keyword])
+        if len(matched) == len(PREDEFINED_TAGS):
+            break
+    return [tag for tag in PREDEFINED_TAGS if tag in matched]
+
+
+def extract_tags_from_text(title, description, doc=None, use_nlp=True):
     """
     Extract relevant tags from task title and description
+    `doc` is an already parsed spaCy doc of the text (see extract_tags_from_texts)
+    `use_nlp=False` skips spaCy: the rule-based tier of the tiered enrichment
+    The text is tokenized once: by spaCy when it is available, by a regex otherwise.
     Returns: comma-separated string of tags
     """
-    trimmed_description = description[:MAX_TEXT_LENGTH]
-    text = f"{title} {description[:MAX_TEXT_LENGTH]}".lower()
-
+    text = _tag_source_text(title, description)
+    lower_text = text.lower()
 
     # Method 1: Rule-based keyword extraction
-    predefined_tags = {
-        'work': ['work', 'job', 'office', 'meeting', 'project', 'client', 'deadline', 'presentation'],
-        'learning': ['learn', 'study', 'course', 'tutorial', 'book', 'research', 'practice'],
-        'health': ['doctor', 'gym', 'exercise', 'medical', 'appointment', 'fitness', 'diet'],
-        'personal': ['personal', 'family', 'friend', 'home', 'hobby', 'vacation'],
-        'finance': ['bank', 'money', 'budget', 'bill', 'payment', 'insurance', 'tax'],
-        'shopping': ['buy', 'purchase', 'shop', 'order', 'store', 'market'],
-        'urgent': ['urgent', 'asap', 'critical', 'important', 'emergency'],
-        'ai': ['ai', 'ml', 'machine learning', 'artificial intelligence', 'data science'],
-        'backend': ['backend', 'server', 'database', 'api', 'django', 'python'],
-        'frontend': ['frontend', 'ui', 'ux', 'react', 'javascript', 'css', 'html']
-    }
-
-    found_tags = []
-
-    # Check for predefined tags
-    for tag, keywords in predefined_tags.items():
-        if any(keyword in text for keyword in keywords):
-            found_tags.append(tag)
+    found_tags = match_predefined_tags(lower_text)
 
     # Method 2: NLP-based extraction using spaCy
+    nlp = ModelRegistry().get_model(NLP) if use_nlp else None
     if nlp:
         try:
-            doc = nlp(text)
-
-            # Extract entities
-            entities = [ent.text.lower() for ent in doc.ents
-                        if ent.label_ in ['ORG', 'PRODUCT', 'EVENT', 'WORK_OF_ART']]
-            print(f"Onion_entities: {entities}")
-            found_tags.extend(entities[:3])  # Limit to 3 entities
-
-            # Extract important nouns
-            important_nouns = [token.lemma_.lower() for token in doc
-                               if token.pos_ == 'NOUN' and len(token.text) > 3
-                               and not token.is_stop][:5]
-            print(f"Onion_important_nouns: {important_nouns}")
-
-            found_tags.extend(important_nouns)
-            print(f"Onion_found_tags: {found_tags}")
+            with span("spacy"):
+                if doc is None:
+                    with track_inference(NLP):
+                        doc = nlp(text)
+
+                # Extract entities
+                entities = [ent.text.lower() for ent in doc.ents
+                            if ent.label_ in ['ORG', 'PRODUCT', 'EVENT', 'WORK_OF_ART']]
+                found_tags.extend(entities[:3])  # Limit to 3 entities
+
+                # Extract important nouns
+                important_nouns = [token.lemma_.lower() for token in doc
+                                   if token.pos_ == 'NOUN' and len(token.text) > 3
+                                   and not token.is_stop][:5]
+                found_tags.extend(important_nouns)
 
         except Exception as e:
             print(f"spaCy processing error: {e}")
+            doc = None
 
-    # Method 3: TF-IDF based keyword extraction (if you have enough data)
-    try:
-        # This would work better with more tasks in your database
-        stop_words = set(stopwords.words('english'))
-        words = word_tokenize(text.lower())
+    # Method 3: Frequent non-stopword terms, reusing the spaCy tokens when there are any
+    with span("nltk"):
+        words = [token.lower_ for token in doc] if doc is not None else TOKEN_PATTERN.findall(lower_text)
+        stop_words = ModelRegistry().get_model(STOPWORDS) or frozenset()
         important_words = [word for word in words
                            if word.isalnum() and word not in stop_words
                            and len(word) > 3][:5]
-        found_tags.extend(important_words)
-    except Exception as e:
-        print(f"NLTK processing error: {e}")
+    found_tags.extend(important_words)
 
     # Clean and deduplicate tags
     clean_tags = []
@@ -109,11 +172,36 @@ def extract_tags_from_text(title, description):
 
     for tag in found_tags:
         tag_clean = re.sub(r'[^\w\s]', '', str(tag)).strip().lower()
-        # print(f"Onion_tag_clean: {tag_clean}")
 
         if tag_clean and tag_clean not in seen and len(tag_clean) > 2:
             clean_tags.append(tag_clean)
             seen.add(tag_clean)
 
     # Limit to top 5 tags
-    return ','.join(clean_tags[:3])
\ No newline at end of file
+    return ','.join(clean_tags[:3])
+
+
+def extract_tags_from_texts(items):
+    """
+    Batch version of extract_tags_from_text for [(title, description), ...]:
+    spaCy parses all texts in one `nlp.pipe` pass.
+    Returns: list of comma-separated tag strings, in input order
+    """
+    items = list(items)
+    docs = [None] * len(items)
+
+    nlp = ModelRegistry().get_model(NLP)
+    if nlp and items:
+        try:
+            with span("spacy"), track_inference(NLP, len(items)):
+                docs = list(nlp.pipe(
+                    (_tag_source_text(title, description) for title, description in items),
+                    batch_size=SPACY_BATCH_SIZE,
+                ))
+        except Exception as e:
+            print(f"spaCy processing error: {e}")
+
+    return [
+        extract_tags_from_text(title, description, doc=doc)
+        for (title, description), doc in zip(items, docs)
+    ]
@@ -1,5 +1,12 @@
 # Using Hugging Face Transformers
-from transformers import pipeline
+from django.conf import settings
+
+from ai_module.ai_services.auto_assign_task_tag import match_predefined_tags
+from ai_module.ai_services.micro_batcher import MicroBatcher, is_micro_batching_enabled
+from ai_module.ai_services.model_registry import ModelRegistry, CLASSIFIER
+from ai_module.ai_services.prototype_categorizer import categorize_by_prototypes
+from tasks.services.metrics import track_inference
+from tasks.services.server_timing import span
 
 '''
 Smart Task Categorization & Tagging
@@ -9,14 +16,114 @@ Free AI Options:
     Hugging Face Transformers (zero-shot classification)
     OpenAI API (free tier: $5 credit)
     Google's Universal Sentence Encoder (via TensorFlow Hub)
+
+Backends (AI_CATEGORIZER_BACKEND):
+    "zero_shot": facebook/bart-large-mnli, one NLI pass per candidate label
+    "prototype": all-MiniLM-L6-v2 embedding vs. category prototypes, one pass per task
 '''
 
-classifier = pipeline("zero-shot-classification", model="facebook/bart-large-mnli")
+
+CATEGORIES = ["Work", "Personal", "Learning", "Health", "Shopping", "Finance"]
+CLASSIFIER_BATCH_SIZE = 8
+
+ZERO_SHOT_BACKEND = "zero_shot"
+PROTOTYPE_BACKEND = "prototype"
+
+
+def get_categories():
+    """Configured category list (AI_CATEGORIES), CATEGORIES by default."""
+    return list(getattr(settings, "AI_CATEGORIES", None) or CATEGORIES)
+
+
+def get_categorizer_backend():
+    return getattr(settings, "AI_CATEGORIZER_BACKEND", ZERO_SHOT_BACKEND)
+
+# Predefined tag -> category, for the rule-based tier of the tiered enrichment
+TAG_CATEGORIES = {
+    'work': "Work",
+    'learning': "Learning",
+    'health': "Health",
+    'personal': "Personal",
+    'finance': "Finance",
+    'shopping': "Shopping",
+    'ai': "Work",
+    'backend': "Work",
+    'frontend': "Work",
+}
+
+
+def categorize_by_keywords(title, description):
+    """Category of the first matching keyword tag, None if no keyword matches."""
+    for tag in match_predefined_tags(f"{title} {description}".lower()):
+        category = TAG_CATEGORIES.get(tag)
+        if category in get_categories():
+            return category
+    return None
+
+
+def _classify_batch(items):
+    """MicroBatcher callback: `items` are (text, categories) pairs, one classifier call per label set."""
+    classifier = ModelRegistry().get_model(CLASSIFIER)
+    if not classifier:
+        return [None] * len(items)
+
+    results = [None] * len(items)
+    by_labels = {}
+    for index, (text, categories) in enumerate(items):
+        by_labels.setdefault(tuple(categories), []).append(index)
+    for categories, indexes in by_labels.items():
+        with span("zero_shot"), track_inference(CLASSIFIER, len(indexes)):
+            outputs = classifier(
+                [items[index][0] for index in indexes], list(categories), batch_size=CLASSIFIER_BATCH_SIZE
+            )
+        if isinstance(outputs, dict):  # a single input comes back unwrapped
+            outputs = [outputs]
+        for index, output in zip(indexes, outputs):
+            results[index] = output
+    return results
+
+
+CLASSIFIER_BATCHER = MicroBatcher("zero_shot_classifier", _classify_batch)
+
 
 def auto_categorize_task(title, description):
     text = f"{title}. {description}"
-    categories = ["Work", "Personal", "Learning", "Health", "Shopping", "Finance"]
-    result = classifier(text, categories)
-    print(f"Onion_auto_categorize_task: {result}")
+    categories = get_categories()
+
+    if get_categorizer_backend() == PROTOTYPE_BACKEND:
+        result = categorize_by_prototypes([text], categories)
+        return result[0] if result else None
+
+    if is_micro_batching_enabled():
+        # shares one forward pass with the other requests arriving in the same window
+        result = CLASSIFIER_BATCHER.submit((text, tuple(categories)))
+        if result is None:
+            return None
+    else:
+        classifier = ModelRegistry().get_model(CLASSIFIER)
+        if not classifier:
+            return None  # Model not available, leave the task uncategorized
+        with span("zero_shot"), track_inference(CLASSIFIER):
+            result = classifier(text, categories)
+
+    return result['labels'][0]  # Top predicted category
+
+
+def auto_categorize_tasks(items):
+    """
+    Batch version of auto_categorize_task for [(title, description), ...]:
+    all texts go through the zero-shot classifier (or the encoder) in one call.
+    Returns: list of top predicted categories, in input order
+    """
+    items = list(items)
+    if not items:
+        return []
+
+    texts = [f"{title}. {description}" for title, description in items]
+    categories = get_categories()
+
+    if get_categorizer_backend() == PROTOTYPE_BACKEND:
+        return categorize_by_prototypes(texts, categories) or [None] * len(items)
 
-    return result['labels'][0]  # Top predicted category
\ No newline at end of file
+    results = _classify_batch([(text, categories) for text in texts])
+    return [result['labels'][0] if result else None for result in results]
@@ -0,0 +1,210 @@
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Sum
+from django.utils import timezone
+
+from ai_module.models import AIResultCache
+
+'''
+AI Enrichment Result Cache
+What it does: Content-addressed cache for tag, category and priority predictions.
+Recurring tasks ("Pay electricity bill") hit the cache instead of spaCy/BART.
+
+    Key: sha256 of namespace + model fingerprint + AI_CACHE_VERSION + normalized text
+    Tier 1: bounded in-process LRU (AI_CACHE_MEMORY_ENTRIES)
+    Tier 2: AIResultCache table shared by every worker, evicted by size (AI_CACHE_MAX_BYTES)
+'''
+
+# Persist last_used_at at most this often per entry, reads should not turn into writes
+TOUCH_INTERVAL = timedelta(hours=1)
+# Check the store size every N writes per process
+EVICTION_CHECK_INTERVAL = 100
+# Evict down to this share of AI_CACHE_MAX_BYTES
+EVICTION_TARGET_RATIO = 0.9
+KEY_CHUNK_SIZE = 500
+
+_MISSING = object()
+
+
+def normalize_text(text):
+    return re.sub(r"\s+", " ", str(text or "")).strip().lower()
+
+
+class EnrichmentCache:
+    """Process-wide two-tier cache (singleton); see module docstring."""
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    instance = super(EnrichmentCache, cls).__new__(cls)
+                    instance._memory = OrderedDict()
+                    instance._lock = threading.Lock()
+                    instance._writes = 0
+                    instance._stats = {
+                        "memory_hits": 0,
+                        "store_hits": 0,
+                        "misses": 0,
+                        "writes": 0,
+                        "evictions": 0,
+                    }
+                    cls._instance = instance
+        return cls._instance
+
+    # -------------------------------------------------------------------------
+    # keys & settings
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def is_enabled() -> bool:
+        return getattr(settings, "AI_CACHE_ENABLED", True)
+
+    @staticmethod
+    def make_key(namespace, fingerprint, text) -> str:
+        version = getattr(settings, "AI_CACHE_VERSION", "1")
+        raw = "\x1f".join([namespace, fingerprint, str(version), normalize_text(text)])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    # -------------------------------------------------------------------------
+    # lookups
+    # -------------------------------------------------------------------------
+    def get_many(self, namespace, fingerprint, texts) -> dict:
+        """Returns {index: value} for the `texts` that are cached."""
+        if not self.is_enabled():
+            return {}
+
+        keys = [self.make_key(namespace, fingerprint, text) for text in texts]
+        found, store_keys = {}, {}
+        with self._lock:
+            for index, key in enumerate(keys):
+                value = self._memory.get(key, _MISSING)
+                if value is _MISSING:
+                    store_keys.setdefault(key, []).append(index)
+                else:
+                    self._memory.move_to_end(key)
+                    found[index] = value
+                    self._stats["memory_hits"] += 1
+
+        if store_keys:
+            rows = self._fetch(list(store_keys))
+            for key, value in rows.items():
+                for index in store_keys[key]:
+                    found[index] = value
+                self._remember(key, value)
+            with self._lock:
+                self._stats["store_hits"] += sum(len(store_keys[key]) for key in rows)
+                self._stats["misses"] += sum(
+                    len(indexes) for key, indexes in store_keys.items() if key not in rows
+                )
+        return found
+
+    def set_many(self, namespace, fingerprint, items) -> None:
+        """`items` is a list of (text, value) pairs; None values are not cached."""
+        if not self.is_enabled():
+            return
+
+        rows = {}
+        for text, value in items:
+            if value is None:
+                continue
+            key = self.make_key(namespace, fingerprint, text)
+            encoded = json.dumps(value)
+            rows[key] = AIResultCache(
+                key=key, namespace=namespace, value=encoded, size=len(key) + len(encoded)
+            )
+            self._remember(key, value)
+        if not rows:
+            return
+
+        AIResultCache.objects.bulk_create(rows.values(), ignore_conflicts=True)
+        with self._lock:
+            self._stats["writes"] += len(rows)
+            self._writes += len(rows)
+            check_size = self._writes >= EVICTION_CHECK_INTERVAL
+            if check_size:
+                self._writes = 0
+        if check_size:
+            self.evict()
+
+    def cached(self, namespace, fingerprint, text, compute):
+        """Return the cached value for `text`, or compute, store and return it."""
+        value = self.get_many(namespace, fingerprint, [text]).get(0, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.set_many(namespace, fingerprint, [(text, value)])
+        return value
+
+    # -------------------------------------------------------------------------
+    # maintenance
+    # -------------------------------------------------------------------------
+    def evict(self, max_bytes=None) -> int:
+        """Drop least recently used rows until the store fits in `max_bytes`."""
+        max_bytes = max_bytes or getattr(settings, "AI_CACHE_MAX_BYTES", 64 * 1024 * 1024)
+        total = AIResultCache.objects.aggregate(total=Sum("size"))["total"] or 0
+        if total <= max_bytes:
+            return 0
+
+        to_free = total - int(max_bytes * EVICTION_TARGET_RATIO)
+        victims, freed = [], 0
+        for key, size in AIResultCache.objects.order_by("last_used_at").values_list("key", "size").iterator():
+            if freed >= to_free:
+                break
+            victims.append(key)
+            freed += size
+
+        for start in range(0, len(victims), KEY_CHUNK_SIZE):
+            AIResultCache.objects.filter(key__in=victims[start:start + KEY_CHUNK_SIZE]).delete()
+        with self._lock:
+            for key in victims:
+                self._memory.pop(key, None)
+            self._stats["evictions"] += len(victims)
+        return len(victims)
+
+    def clear(self) -> int:
+        with self._lock:
+            self._memory.clear()
+        deleted, _ = AIResultCache.objects.all().delete()
+        return deleted
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+        lookups = stats["memory_hits"] + stats["store_hits"] + stats["misses"]
+        stats["hit_ratio"] = (
+            (stats["memory_hits"] + stats["store_hits"]) / lookups if lookups else 0.0
+        )
+        return stats
+
+    # -------------------------------------------------------------------------
+    # internals
+    # -------------------------------------------------------------------------
+    def _remember(self, key, value) -> None:
+        limit = getattr(settings, "AI_CACHE_MEMORY_ENTRIES", 2048)
+        with self._lock:
+            self._memory[key] = value
+            self._memory.move_to_end(key)
+            while len(self._memory) > limit:
+                self._memory.popitem(last=False)
+
+    def _fetch(self, keys) -> dict:
+        now = timezone.now()
+        values, stale = {}, []
+        for start in range(0, len(keys), KEY_CHUNK_SIZE):
+            for key, value, last_used_at in AIResultCache.objects.filter(
+                key__in=keys[start:start + KEY_CHUNK_SIZE]
+            ).values_list("key", "value", "last_used_at"):
+                values[key] = json.loads(value)
+                if now - last_used_at > TOUCH_INTERVAL:
+                    stale.append(key)
+        if stale:
+            AIResultCache.objects.filter(key__in=stale).update(last_used_at=now)
+        return values
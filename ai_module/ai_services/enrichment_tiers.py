@@ -0,0 +1,218 @@
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+
+from django.conf import settings
+
+from ai_module.ai_services.model_registry import CLASSIFIER, NLP, SENTENCE_TRANSFORMER, ModelRegistry
+
+'''
+Enrichment Tiers
+What it does: Runs the model-backed enrichment steps under a latency budget.
+Every field has a cheap rule-based answer; a model tier only replaces it when
+
+    - its circuit breaker is closed (or half-open for a single trial call),
+    - its model is already loaded (a cold model is warmed up in the background), and
+    - its observed latency fits in what is left of the budget.
+
+Tier calls run on a small thread pool so a slow model can be abandoned at the deadline.
+An abandoned call keeps its pool thread until the model returns, so a tier is only
+admitted while a pool thread is free; otherwise the request takes the rules answer
+at once instead of queueing behind calls that already missed their deadline.
+'''
+
+# Names reported per field in the /add response
+TIER_USER = "user"
+TIER_CACHE = "cache"
+TIER_RULES = "rules"
+TIER_SPACY = "spacy"
+TIER_TRANSFORMER = "transformer"
+TIER_EMBEDDING = "embedding"
+
+# Consecutive failures/timeouts that open a breaker, and how long it stays open
+FAILURE_THRESHOLD = 3
+RESET_SECONDS = 30.0
+# Weight of the newest sample in the latency estimate
+LATENCY_SMOOTHING = 0.2
+
+
+class Deadline:
+    """Budget of one enrichment; `budget_ms` None or <= 0 means unlimited."""
+
+    def __init__(self, budget_ms=None):
+        self.unlimited = not budget_ms or budget_ms <= 0
+        self.expires_at = None if self.unlimited else time.monotonic() + budget_ms / 1000
+
+    def remaining(self):
+        """Seconds left, None if unlimited."""
+        if self.unlimited:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+
+class CircuitBreaker:
+    """closed -> open after FAILURE_THRESHOLD failures -> half-open after RESET_SECONDS."""
+
+    def __init__(self, failure_threshold=FAILURE_THRESHOLD, reset_seconds=RESET_SECONDS):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None
+        self._trial_running = False
+
+    @property
+    def state(self):
+        with self._lock:
+            return self._state()
+
+    def _state(self):
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_seconds:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        with self._lock:
+            state = self._state()
+            if state == "closed":
+                return True
+            if state == "half_open" and not self._trial_running:
+                self._trial_running = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._trial_running = False
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+
+_executor = None
+_slots = None  # one per pool thread, held from admission until the call returns
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor, _slots
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                workers = getattr(settings, "AI_ENRICHMENT_TIER_WORKERS", 4)
+                _slots = threading.BoundedSemaphore(workers)
+                _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="enrichment-tier")
+    return _executor
+
+
+def _acquire_slot(blocking: bool) -> bool:
+    _get_executor()
+    return _slots.acquire(blocking=blocking)
+
+
+def _release_slot():
+    _slots.release()
+
+
+class ModelTier:
+    """One model-backed tier: breaker, latency estimate and cold-start warm-up."""
+
+    def __init__(self, name, model_name):
+        self.name = name
+        self.model_name = model_name
+        self.breaker = CircuitBreaker()
+        self.latency = None  # smoothed seconds of successful calls
+        self._warming = False
+        self._lock = threading.Lock()
+
+    def admits(self, deadline: Deadline) -> bool:
+        """Whether to run the tier; True reserves a pool thread that submit() must use."""
+        registry = ModelRegistry()
+        if not registry.is_loaded(self.model_name) and not deadline.unlimited:
+            self._warm_up()
+            return False
+        # without a budget a cold model is loaded inline, like before
+        if registry.get_model(self.model_name) is None:
+            return False  # not installed
+        remaining = deadline.remaining()
+        if remaining is not None and self.latency is not None and self.latency > remaining:
+            return False
+        # without a budget nothing is abandoned, so waiting for a thread is fine
+        if not _acquire_slot(blocking=deadline.unlimited):
+            return False
+        if not self.breaker.allow():
+            _release_slot()
+            return False
+        return True
+
+    def submit(self, function):
+        """Run `function` on the pool thread reserved by admits()."""
+        started = time.monotonic()
+
+        def _timed():
+            try:
+                value = function()
+                return value, time.monotonic() - started
+            finally:
+                _release_slot()
+
+        # in the caller's context, so the tier's spans land in the request's Server-Timing
+        return _get_executor().submit(contextvars.copy_context().run, _timed)
+
+    def result(self, future, deadline: Deadline):
+        """The tier's value, or None if it failed or missed the deadline."""
+        try:
+            value, elapsed = future.result(timeout=deadline.remaining())
+        except TimeoutError:
+            future.cancel()
+            self.breaker.record_failure()
+            print(f"⚠️ Enrichment tier '{self.name}' exceeded the latency budget")
+            return None
+        except Exception as e:
+            self.breaker.record_failure()
+            print(f"⚠️ Enrichment tier '{self.name}' failed: {e}")
+            return None
+
+        self.breaker.record_success()
+        with self._lock:
+            self.latency = elapsed if self.latency is None else (
+                LATENCY_SMOOTHING * elapsed + (1 - LATENCY_SMOOTHING) * self.latency
+            )
+        return value
+
+    def stats(self) -> dict:
+        return {
+            "state": self.breaker.state,
+            "latency_ms": None if self.latency is None else round(self.latency * 1000, 1),
+            "loaded": ModelRegistry().is_loaded(self.model_name),
+        }
+
+    def _warm_up(self):
+        with self._lock:
+            if self._warming or not _acquire_slot(blocking=False):
+                return  # already loading, or retried by a later request
+            self._warming = True
+
+        def _load():
+            try:
+                ModelRegistry().get_model(self.model_name)
+            finally:
+                self._warming = False
+                _release_slot()
+
+        _get_executor().submit(_load)
+
+
+SPACY_TIER = ModelTier(TIER_SPACY, NLP)
+TRANSFORMER_TIER = ModelTier(TIER_TRANSFORMER, CLASSIFIER)
+# the prototype categorizer backend
+EMBEDDING_TIER = ModelTier(TIER_EMBEDDING, SENTENCE_TRANSFORMER)
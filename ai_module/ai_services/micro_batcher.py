@@ -0,0 +1,126 @@
+import queue
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future
+
+from django.conf import settings
+
+from tasks.services.server_timing import span
+
+'''
+Inference Micro-Batching
+What it does: Concurrent callers of a model (one /add request each) hand their
+inputs to a MicroBatcher instead of calling the model themselves. A dispatcher
+thread collects the inputs that arrive within AI_MICRO_BATCH_WINDOW_MS, up to
+AI_MICRO_BATCH_MAX_SIZE, runs one batched forward pass and hands every caller
+its own result. Only one batch runs per model at a time, so request threads no
+longer contend for the CPU.
+
+Enabled with AI_MICRO_BATCH_ENABLED; used by the zero-shot classifier and the
+sentence encoder.
+'''
+
+
+def is_micro_batching_enabled() -> bool:
+    return getattr(settings, "AI_MICRO_BATCH_ENABLED", False)
+
+
+def get_max_batch_size() -> int:
+    return getattr(settings, "AI_MICRO_BATCH_MAX_SIZE", 16)
+
+
+class MicroBatcher:
+    """
+    `run_batch(items) -> results` is called from the dispatcher thread with a
+    list of submitted items and must return one result per item, in order.
+    """
+
+    instances = {}
+
+    def __init__(self, name, run_batch):
+        self.name = name
+        self._run_batch = run_batch
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._dispatcher = None
+        self._stats = {"submitted": 0, "batches": 0, "failed_batches": 0, "max_queue_depth": 0}
+        self._batch_sizes = Counter()
+        MicroBatcher.instances[name] = self
+
+    def submit_many(self, items) -> list:
+        """Block until every item has been through a batch; returns their results in order."""
+        futures = []
+        for item in items:
+            future = Future()
+            self._queue.put((item, future))
+            futures.append(future)
+        with self._lock:
+            self._stats["submitted"] += len(futures)
+            self._stats["max_queue_depth"] = max(self._stats["max_queue_depth"], self._queue.qsize())
+        self._ensure_dispatcher()
+        # the model runs on the dispatcher thread: the caller's span is its wait for the batch
+        with span(self.name):
+            return [future.result() for future in futures]
+
+    def submit(self, item):
+        return self.submit_many([item])[0]
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+            batch_sizes = dict(sorted(self._batch_sizes.items()))
+        items = sum(size * count for size, count in batch_sizes.items())
+        stats["queue_depth"] = self._queue.qsize()
+        stats["batch_sizes"] = batch_sizes
+        stats["mean_batch_size"] = items / stats["batches"] if stats["batches"] else 0.0
+        return stats
+
+    # -------------------------------------------------------------------------
+    # dispatcher
+    # -------------------------------------------------------------------------
+    def _ensure_dispatcher(self):
+        if self._dispatcher is not None and self._dispatcher.is_alive():
+            return
+        with self._lock:
+            if self._dispatcher is None or not self._dispatcher.is_alive():
+                self._dispatcher = threading.Thread(
+                    target=self._dispatch, name=f"micro-batcher-{self.name}", daemon=True
+                )
+                self._dispatcher.start()
+
+    def _dispatch(self):
+        while True:
+            batch = [self._queue.get()]
+            window = getattr(settings, "AI_MICRO_BATCH_WINDOW_MS", 5) / 1000
+            max_size = get_max_batch_size()
+            closes_at = time.monotonic() + window
+            while len(batch) < max_size:
+                timeout = closes_at - time.monotonic()
+                try:
+                    batch.append(self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._execute(batch)
+
+    def _execute(self, batch):
+        with self._lock:
+            self._stats["batches"] += 1
+            self._batch_sizes[len(batch)] += 1
+        try:
+            results = self._run_batch([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise RuntimeError(f"{self.name}: {len(results)} results for {len(batch)} inputs")
+        except Exception as e:
+            with self._lock:
+                self._stats["failed_batches"] += 1
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
+
+
+def micro_batcher_stats() -> dict:
+    """stats() of every batcher in this process, by name."""
+    return {name: batcher.stats() for name, batcher in MicroBatcher.instances.items()}
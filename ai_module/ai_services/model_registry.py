@@ -0,0 +1,135 @@
+import threading
+import time
+
+from tasks.services.server_timing import span
+
+'''
+Shared AI Model Registry
+What it does: Holds one process-wide instance of every model used by the ai_services.
+Each model is loaded at most once, on first use, so importing an ai_service (and
+therefore running `manage.py migrate`, `shell`, ...) never pays the torch/spaCy/NLTK
+import or model-load cost.
+'''
+
+# =============================================================================
+# MODEL NAMES
+# =============================================================================
+SPACY_MODEL_NAME = "en_core_web_sm"
+ZERO_SHOT_MODEL_NAME = "facebook/bart-large-mnli"
+SENTENCE_MODEL_NAME = "all-MiniLM-L6-v2"
+
+# Registry keys
+NLP = "nlp"
+CLASSIFIER = "classifier"
+SENTENCE_TRANSFORMER = "sentence_transformer"
+STOPWORDS = "stopwords"
+
+
+# =============================================================================
+# LOADERS (heavy imports live inside the loaders on purpose)
+# =============================================================================
+def _load_spacy():
+    import spacy
+
+    try:
+        return spacy.load(SPACY_MODEL_NAME)
+    except OSError:
+        print(f"⚠️ spaCy model not found. Install with: python -m spacy download {SPACY_MODEL_NAME}")
+        return None
+
+
+def _load_zero_shot_classifier():
+    import warnings
+    from transformers import pipeline
+
+    warnings.filterwarnings('ignore')
+    return pipeline("zero-shot-classification", model=ZERO_SHOT_MODEL_NAME, device=-1)  # Use CPU
+
+
+def _load_sentence_transformer():
+    from sentence_transformers import SentenceTransformer
+
+    return SentenceTransformer(SENTENCE_MODEL_NAME)
+
+
+def _ensure_nltk_data():
+    import nltk
+
+    # Download NLTK data if not present
+    try:
+        nltk.data.find('corpora/stopwords')
+    except LookupError:
+        nltk.download('stopwords')
+
+
+def _load_stopwords():
+    _ensure_nltk_data()
+    from nltk.corpus import stopwords
+
+    return frozenset(stopwords.words('english'))
+
+
+DEFAULT_LOADERS = {
+    NLP: _load_spacy,
+    CLASSIFIER: _load_zero_shot_classifier,
+    SENTENCE_TRANSFORMER: _load_sentence_transformer,
+    STOPWORDS: _load_stopwords,
+}
+
+
+class ModelRegistry:
+    """
+    Process-wide, lazily populated model registry (singleton).
+
+    `get_model(name)` loads the model on the first call and returns the same
+    instance afterwards. Loading is guarded by a per-model lock, so concurrent
+    first requests in a threaded worker still load a model only once. A model
+    that fails to load is cached as None, like the old import-time fallbacks.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    instance = super(ModelRegistry, cls).__new__(cls)
+                    instance._loaders = dict(DEFAULT_LOADERS)
+                    instance._models = {}
+                    instance._locks = {name: threading.Lock() for name in instance._loaders}
+                    cls._instance = instance
+        return cls._instance
+
+    def get_model(self, name):
+        if name in self._models:
+            return self._models[name]
+        if name not in self._loaders:
+            raise KeyError(f"Unknown model: '{name}'")
+
+        with self._locks[name]:
+            if name not in self._models:
+                try:
+                    from tasks.services.metrics import MODEL_LOAD_SECONDS
+
+                    started = time.perf_counter()
+                    with span(f"load_{name}"):
+                        self._models[name] = self._loaders[name]()
+                    MODEL_LOAD_SECONDS.set(time.perf_counter() - started, model=name)
+                except Exception as e:
+                    print(f"⚠️ Model '{name}' loading failed: {e}")
+                    self._models[name] = None
+        return self._models[name]
+
+    def register(self, name, loader):
+        """Register (or replace) the loader for `name`; the next get_model() reloads it."""
+        with self._instance_lock:
+            self._loaders[name] = loader
+            self._locks.setdefault(name, threading.Lock())
+            self._models.pop(name, None)
+
+    def is_loaded(self, name) -> bool:
+        return name in self._models
+
+    def unload(self, name):
+        self._models.pop(name, None)
@@ -0,0 +1,349 @@
+import os
+import resource
+import threading
+import time
+from multiprocessing.connection import AuthenticationError, Client, Listener
+
+from django.conf import settings
+
+from ai_module.ai_services.model_registry import (
+    CLASSIFIER,
+    DEFAULT_LOADERS,
+    SENTENCE_TRANSFORMER,
+    ModelRegistry,
+)
+
+'''
+Local Model Server
+What it does: One process (`manage.py run_model_server`) owns the zero-shot
+classifier and the sentence encoder and serves them over a Unix domain socket,
+so N web workers share one copy of the BART and MiniLM weights instead of
+loading N copies.
+
+With AI_MODEL_SERVER_SOCKET set, every worker registers RemoteModel proxies for
+these models in its ModelRegistry. A proxy has the same call signature as the
+model it stands for (`classifier(texts, labels, ...)`, `encoder.encode(texts, ...)`),
+so the ai_services do not know whether inference is local or remote. When the
+server is not running, the worker loads the model in-process as before.
+
+spaCy and the NLTK stopwords are small and return objects bound to a local
+vocabulary, they always stay in-process.
+'''
+
+# Models served by the server, and the methods a client may call on them
+SERVED_MODELS = {
+    CLASSIFIER: ("__call__",),
+    SENTENCE_TRANSFORMER: ("encode",),
+}
+
+# Seconds a worker uses its in-process model before trying the server again
+RETRY_SECONDS = 30.0
+
+
+class ModelServerUnavailable(Exception):
+    """The server could not be reached: not running, or it refused the connection."""
+
+
+class ModelServerError(Exception):
+    """The server was reached, but the model call raised."""
+
+
+class ModelServerTimeout(ModelServerError):
+    """
+    The server is running but did not answer in time (busy with other calls).
+    The call fails; loading a local copy of the model would defeat the server.
+    """
+
+
+def get_socket_path() -> str:
+    return getattr(settings, "AI_MODEL_SERVER_SOCKET", "")
+
+
+def _authkey() -> bytes:
+    # every connection is authenticated (HMAC challenge) before anything is unpickled
+    key = getattr(settings, "AI_MODEL_SERVER_AUTHKEY", "") or settings.SECRET_KEY or "smart-todo-model-server"
+    return key.encode()
+
+
+def resident_memory_bytes() -> int:
+    """Current RSS of this process (Linux), else the peak RSS."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024  # KiB on Linux
+
+
+# =============================================================================
+# SERVER
+# =============================================================================
+class ModelServer:
+    """
+    Accepts connections on `path`, one thread per connection. Forward passes of
+    one model are serialized: concurrent calls from several workers would only
+    compete for the same CPU cores.
+    """
+
+    def __init__(self, path, models=tuple(SERVED_MODELS)):
+        self.path = path
+        self.models = tuple(models)
+        self.load_seconds = {}
+        self._model_locks = {name: threading.Lock() for name in self.models}
+        self._stats_lock = threading.Lock()
+        self._calls = {name: {"calls": 0, "errors": 0, "seconds": 0.0} for name in self.models}
+        self._listener = None
+
+        # this process runs the models itself, never through another server
+        registry = ModelRegistry()
+        for name in self.models:
+            registry.register(name, DEFAULT_LOADERS[name])
+
+    def load_models(self):
+        for name in self.models:
+            started = time.perf_counter()
+            model = ModelRegistry().get_model(name)
+            self.load_seconds[name] = time.perf_counter() - started
+            state = "loaded" if model is not None else "not available"
+            print(f"Model '{name}' {state} in {self.load_seconds[name]:.1f}s")
+
+    def serve_forever(self):
+        if os.path.exists(self.path):
+            os.unlink(self.path)  # stale socket of a previous run
+        self._listener = Listener(self.path, family="AF_UNIX", authkey=_authkey())
+        os.chmod(self.path, 0o600)
+        try:
+            while True:
+                try:
+                    connection = self._listener.accept()
+                except AuthenticationError:
+                    print("⚠️ Model server rejected a connection with a wrong authkey")
+                    continue
+                except OSError:
+                    if self._listener is None:
+                        return  # closed by stop()
+                    raise
+                threading.Thread(
+                    target=self._serve_connection, args=(connection,), name="model-server-conn", daemon=True
+                ).start()
+        finally:
+            self.stop()
+
+    def stop(self):
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            listener.close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+    def _serve_connection(self, connection):
+        with connection:
+            while True:
+                try:
+                    request = connection.recv()
+                except (EOFError, OSError):
+                    return  # client went away
+                try:
+                    response = ("ok", self.handle(*request))
+                except Exception as e:
+                    response = ("error", f"{type(e).__name__}: {e}")
+                try:
+                    connection.send(response)
+                except OSError:
+                    return
+
+    def handle(self, operation, *args):
+        if operation == "load":
+            (name,) = args
+            return name in self.models and ModelRegistry().get_model(name) is not None
+        if operation == "stats":
+            return self.stats()
+        if operation == "call":
+            return self._call(*args)
+        raise ValueError(f"Unknown operation: '{operation}'")
+
+    def _call(self, name, method, args, kwargs):
+        if method not in SERVED_MODELS.get(name, ()) or name not in self.models:
+            raise ValueError(f"'{name}.{method}' is not served")
+        model = ModelRegistry().get_model(name)
+        if model is None:
+            raise ModelServerError(f"Model '{name}' is not available on the server")
+
+        target = model if method == "__call__" else getattr(model, method)
+        started = time.perf_counter()
+        failed = True
+        try:
+            with self._model_locks[name]:
+                result = target(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            with self._stats_lock:
+                calls = self._calls[name]
+                calls["calls"] += 1
+                calls["errors"] += failed
+                calls["seconds"] += time.perf_counter() - started
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            calls = {name: dict(values) for name, values in self._calls.items()}
+        return {
+            "pid": os.getpid(),
+            "rss_bytes": resident_memory_bytes(),
+            "models": {
+                name: {
+                    "loaded": ModelRegistry().is_loaded(name),
+                    "load_seconds": self.load_seconds.get(name),
+                    **calls[name],
+                }
+                for name in self.models
+            },
+        }
+
+
+# =============================================================================
+# CLIENT
+# =============================================================================
+class ModelServerClient:
+    """One connection per thread, reopened on the next request after a failure."""
+
+    def __init__(self, path, timeout=None):
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def request(self, *request):
+        timeout = self.timeout if self.timeout is not None else getattr(settings, "AI_MODEL_SERVER_TIMEOUT", 30.0)
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            try:
+                connection.send(request)
+            except OSError:
+                # the server restarted since this connection was opened
+                self.close()
+                connection = None
+        if connection is None:
+            connection = self._connect()
+            try:
+                connection.send(request)
+            except OSError as e:
+                self.close()
+                raise ModelServerUnavailable(f"{type(e).__name__}: {e}") from e
+
+        try:
+            if not connection.poll(timeout):
+                # a late answer must not be read by the next request
+                self.close()
+                raise ModelServerTimeout(f"no answer within {timeout}s")
+            status, value = connection.recv()
+        except (OSError, EOFError) as e:
+            # the server went away during the call; the next request reconnects (or falls back)
+            self.close()
+            raise ModelServerError(f"{type(e).__name__}: {e}") from e
+
+        if status == "error":
+            raise ModelServerError(value)
+        return value
+
+    def _connect(self):
+        try:
+            connection = Client(self.path, family="AF_UNIX", authkey=_authkey())
+        except (OSError, EOFError, AuthenticationError) as e:
+            # FileNotFoundError / ConnectionRefusedError: not running; AuthenticationError: wrong key
+            raise ModelServerUnavailable(f"{type(e).__name__}: {e}") from e
+        self._local.connection = connection
+        return connection
+
+    def close(self):
+        connection = getattr(self._local, "connection", None)
+        self._local.connection = None
+        if connection is not None:
+            connection.close()
+
+    def stats(self) -> dict:
+        return self.request("stats")
+
+
+class RemoteModel:
+    """
+    Stand-in for a served model in a worker's ModelRegistry. Calls go to the
+    server; while it is unreachable they run on an in-process copy of the model,
+    loaded on the first such call, and the server is tried again after RETRY_SECONDS.
+    A call the running server does not answer in time raises ModelServerTimeout,
+    the caller falls back to its rules.
+    """
+
+    def __init__(self, client, name, local_loader):
+        self.name = name
+        self._client = client
+        self._local_loader = local_loader
+        self._local_model = None
+        self._local_lock = threading.Lock()
+        self._retry_at = 0.0
+
+    def __call__(self, *args, **kwargs):
+        return self._invoke("__call__", args, kwargs)
+
+    def encode(self, *args, **kwargs):
+        return self._invoke("encode", args, kwargs)
+
+    def _invoke(self, method, args, kwargs):
+        if time.monotonic() >= self._retry_at:
+            try:
+                return self._client.request("call", self.name, method, args, kwargs)
+            except ModelServerUnavailable as e:
+                self._retry_at = time.monotonic() + RETRY_SECONDS
+                print(f"⚠️ Model server unavailable ({e}), running '{self.name}' in-process")
+
+        model = self._get_local_model()
+        if model is None:
+            raise ModelServerUnavailable(f"Model '{self.name}' is not available in-process either")
+        target = model if method == "__call__" else getattr(model, method)
+        return target(*args, **kwargs)
+
+    def _get_local_model(self):
+        with self._local_lock:
+            if self._local_model is None:
+                self._local_model = self._local_loader()
+            return self._local_model
+
+
+_client = None
+
+
+def get_client():
+    global _client
+    if _client is None or _client.path != get_socket_path():
+        _client = ModelServerClient(get_socket_path())
+    return _client
+
+
+def _remote_loader(name, local_loader):
+    def _load():
+        try:
+            available = get_client().request("load", name)
+        except ModelServerUnavailable as e:
+            print(f"⚠️ Model server not reachable ({e}), loading '{name}' in-process")
+            # still a proxy: the calls move to the server once it is up
+            model = RemoteModel(get_client(), name, local_loader)
+            model._retry_at = time.monotonic() + RETRY_SECONDS
+            model._get_local_model()
+            return model
+        except ModelServerTimeout:
+            # running but busy (or still loading): keep using it
+            available = True
+        return RemoteModel(get_client(), name, local_loader) if available else None
+
+    return _load
+
+
+def install_model_server_client() -> bool:
+    """
+    Route the served models of this process's ModelRegistry through the server
+    at AI_MODEL_SERVER_SOCKET. Does nothing when no socket is configured.
+    """
+    if not get_socket_path():
+        return False
+    registry = ModelRegistry()
+    for name in SERVED_MODELS:
+        registry.register(name, _remote_loader(name, DEFAULT_LOADERS[name]))
+    return True
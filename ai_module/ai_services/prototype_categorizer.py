@@ -0,0 +1,115 @@
+import threading
+
+import numpy as np
+
+from ai_module.ai_services.model_registry import ModelRegistry, SENTENCE_TRANSFORMER
+from ai_module.ai_services.smart_task_search import encode_texts
+
+'''
+Embedding-Prototype Categorization
+What it does: Categorizes a task with the sentence encoder already used by the
+semantic search instead of the BART zero-shot model. Every category gets a
+prototype vector, the normalised mean embedding of its name and example phrases;
+a task is embedded once and assigned the category with the highest cosine similarity.
+One MiniLM forward pass per task instead of one NLI pass per candidate label.
+'''
+
+# Example phrases per category; a configured category without examples uses its name only
+CATEGORY_EXAMPLES = {
+    "Work": [
+        "prepare the slides for the client meeting",
+        "finish the project report before the deadline",
+        "review the pull request from a colleague",
+        "schedule a call with the team",
+        "fix the bug in the production server",
+    ],
+    "Personal": [
+        "call mom on her birthday",
+        "plan the family vacation",
+        "clean the apartment",
+        "pick up the kids from school",
+        "renew my passport",
+    ],
+    "Learning": [
+        "study for the exam",
+        "watch the online course lecture",
+        "read a chapter of the book",
+        "practice the spanish lessons",
+        "follow a machine learning tutorial",
+    ],
+    "Health": [
+        "book a doctor appointment",
+        "go to the gym",
+        "take my medication",
+        "dentist checkup",
+        "go for a morning run",
+    ],
+    "Shopping": [
+        "buy groceries",
+        "order a new phone online",
+        "get milk and bread from the store",
+        "purchase a birthday gift",
+        "return the shoes to the shop",
+    ],
+    "Finance": [
+        "pay the electricity bill",
+        "file the tax return",
+        "transfer money to the savings account",
+        "review the monthly budget",
+        "renew the car insurance",
+    ],
+}
+
+_prototypes = {}
+_prototypes_lock = threading.Lock()
+
+
+def category_prototypes(categories):
+    """
+    (len(categories), dim) matrix of L2-normalised prototypes, built once per
+    category list and encoder instance. Returns None when the encoder is not available.
+    """
+    model = ModelRegistry().get_model(SENTENCE_TRANSFORMER)
+    if not model:
+        return None
+
+    key = (tuple(categories), id(model))
+    prototypes = _prototypes.get(key)
+    if prototypes is not None:
+        return prototypes
+
+    with _prototypes_lock:
+        if key not in _prototypes:
+            phrases = [[category] + CATEGORY_EXAMPLES.get(category, []) for category in categories]
+            embeddings = encode_texts([phrase for group in phrases for phrase in group])
+            if embeddings is None:
+                return None
+
+            rows, start = [], 0
+            for group in phrases:
+                mean = embeddings[start:start + len(group)].mean(axis=0)
+                rows.append(mean / (np.linalg.norm(mean) or 1.0))
+                start += len(group)
+            _prototypes.clear()  # only the current category list / model is kept
+            _prototypes[key] = np.vstack(rows)
+        return _prototypes[key]
+
+
+def categorize_by_prototypes(texts, categories):
+    """
+    Nearest category prototype for every text.
+    Returns: list of categories in input order, or None when the encoder is not available
+    """
+    texts = list(texts)
+    if not texts:
+        return []
+
+    prototypes = category_prototypes(categories)
+    if prototypes is None:
+        return None
+    embeddings = encode_texts(texts)
+    if embeddings is None:
+        return None
+
+    best = np.argmax(embeddings @ prototypes.T, axis=1)
+    return [categories[index] for index in best]
@@ -1,6 +1,13 @@
-from sentence_transformers import SentenceTransformer
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
+
+from ai_module.ai_services.micro_batcher import (
+    MicroBatcher,
+    get_max_batch_size,
+    is_micro_batching_enabled,
+)
+from ai_module.ai_services.model_registry import ModelRegistry, SENTENCE_TRANSFORMER
+from tasks.services.metrics import track_inference
+from tasks.services.server_timing import span
 
 '''
 Smart Search & Task Matching
@@ -12,23 +19,76 @@ Free AI Options:
     Word2Vec (custom training)
 '''
 
-model = SentenceTransformer('all-MiniLM-L6-v2')
+EMBEDDING_DTYPE = np.float32
+TOP_K = 5
+
+
+def task_embedding_text(title, description):
+    return f"{title} {description}"
+
+
+def _encode_batch(texts):
+    """Encoder call shared by encode_texts and the MicroBatcher; None without a model."""
+    model = ModelRegistry().get_model(SENTENCE_TRANSFORMER)
+    if not model:
+        return None
+    texts = list(texts)
+    with span("encoder"), track_inference(SENTENCE_TRANSFORMER, len(texts)):
+        embeddings = model.encode(texts, convert_to_numpy=True, normalize_embeddings=True)
+    return np.asarray(embeddings, dtype=EMBEDDING_DTYPE)
+
+
+def _encode_micro_batch(texts):
+    embeddings = _encode_batch(texts)
+    return [None] * len(texts) if embeddings is None else list(embeddings)
+
+
+ENCODER_BATCHER = MicroBatcher("sentence_encoder", _encode_micro_batch)
+
+
+def encode_texts(texts):
+    """
+    Encode `texts` into an L2-normalised float32 matrix of shape (len(texts), dim),
+    so that a dot product between two rows is their cosine similarity.
+    Small requests go through the micro-batcher when it is enabled; a request
+    that fills a batch on its own is encoded directly.
+    Returns None when the sentence encoder is not available.
+    """
+    texts = list(texts)
+    if not (is_micro_batching_enabled() and 0 < len(texts) < get_max_batch_size()):
+        return _encode_batch(texts)
+
+    rows = ENCODER_BATCHER.submit_many(texts)
+    if any(row is None for row in rows):
+        return None
+    return np.vstack(rows)
+
+
+def semantic_task_search(query, tasks, top_k=TOP_K):
+    """
+    Return the `top_k` tasks most similar to `query` as (task, similarity) pairs.
+    Only the query is encoded; task embeddings come from the persistent store.
+    """
+    from ai_module.ai_services.task_embedding_store import load_task_embedding_matrix
 
+    tasks = list(tasks)
+    if not tasks:
+        return []
 
-def semantic_task_search(query, tasks):
     # Get embeddings for query
-    query_embedding = model.encode([query])
+    query_embedding = encode_texts([query])
+    if query_embedding is None:
+        return []
 
-    # Get embeddings for all tasks
-    task_texts = [f"{task.title} {task.description}" for task in tasks]
-    task_embeddings = model.encode(task_texts)
+    # Stored embeddings for all tasks, in the same order as `tasks`
+    task_embeddings = load_task_embedding_matrix(tasks)
 
-    # Calculate similarities
-    similarities = cosine_similarity(query_embedding, task_embeddings)[0]
-    print(f"Onion_semantic_task_search_similarities: {similarities}")
+    # Cosine similarity (rows are normalised)
+    similarities = task_embeddings @ query_embedding[0]
 
-    # Return top 5 most similar tasks
-    top_indices = np.argsort(similarities)[::-1][:5]
-    print(f"Onion_semantic_task_search: {top_indices}")
+    # Top-k without sorting the whole corpus
+    k = min(top_k, len(tasks))
+    top_indices = np.argpartition(-similarities, k - 1)[:k]
+    top_indices = top_indices[np.argsort(-similarities[top_indices])]
 
-    return [(tasks[i], similarities[i]) for i in top_indices]
\ No newline at end of file
+    return [(tasks[i], float(similarities[i])) for i in top_indices]
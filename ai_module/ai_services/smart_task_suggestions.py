@@ -1,5 +1,7 @@
 import openai
 
+from tasks.services.server_timing import span
+
 '''
 Smart Task Suggestions & Reminders
 What it does: Suggest task breakdowns and optimal scheduling.
@@ -19,12 +21,12 @@ def generate_task_suggestions(task_title, task_description):
     Provide 3-5 specific, measurable subtasks:
     """
 
-    response = openai.Completion.create(
-        engine="text-davinci-003",
-        prompt=prompt,
-        max_tokens=200,
-        temperature=0.7
-    )
-    print(f"Onion_generate_task_suggestions: {response}")
+    with span("suggestions"):
+        response = openai.Completion.create(
+            engine="text-davinci-003",
+            prompt=prompt,
+            max_tokens=200,
+            temperature=0.7
+        )
 
     return response.choices[0].text.strip()
\ No newline at end of file
@@ -0,0 +1,81 @@
+import numpy as np
+
+from ai_module.ai_services.model_registry import SENTENCE_MODEL_NAME
+from ai_module.ai_services.smart_task_search import (
+    EMBEDDING_DTYPE,
+    encode_texts,
+    task_embedding_text,
+)
+from tasks.models.model.task_embedding_model import TaskEmbedding
+
+'''
+Persistent Task Embedding Store
+What it does: Keeps one float32 embedding blob per task, written when the task text
+changes, so semantic search only has to encode the query.
+'''
+
+# Stay well below SQLite's bound-parameter limit for `IN (...)` lookups
+ID_CHUNK_SIZE = 500
+
+
+def save_task_embeddings(tasks) -> dict:
+    """
+    Encode and upsert the embeddings of `tasks` in one batch.
+    Returns {task_id: blob} for the stored rows (empty when the encoder is not available).
+    """
+    tasks = list(tasks)
+    if not tasks:
+        return {}
+
+    embeddings = encode_texts(
+        [task_embedding_text(task.title, task.description) for task in tasks]
+    )
+    if embeddings is None:
+        return {}
+
+    rows = [
+        TaskEmbedding(
+            task_id=task.id,
+            model_name=SENTENCE_MODEL_NAME,
+            vector=embedding.tobytes(),
+        )
+        for task, embedding in zip(tasks, embeddings)
+    ]
+    TaskEmbedding.objects.bulk_create(
+        rows,
+        update_conflicts=True,
+        unique_fields=["task"],
+        update_fields=["model_name", "vector", "updated_at"],
+    )
+    return {row.task_id: row.vector for row in rows}
+
+
+def save_task_embedding(task):
+    """Write-path hook: never let an embedding failure break the task write."""
+    try:
+        save_task_embeddings([task])
+    except Exception as e:
+        print(f"⚠️ Task embedding update failed: {e}")
+
+
+def load_task_embedding_matrix(tasks):
+    """
+    Return the stored embeddings of `tasks` as a (len(tasks), dim) float32 matrix,
+    in the same order. Tasks without a current embedding are encoded and stored once.
+    """
+    ids = [task.id for task in tasks]
+    blobs = {}
+    for start in range(0, len(ids), ID_CHUNK_SIZE):
+        blobs.update(
+            TaskEmbedding.objects.filter(
+                task_id__in=ids[start:start + ID_CHUNK_SIZE],
+                model_name=SENTENCE_MODEL_NAME,
+            ).values_list("task_id", "vector")
+        )
+
+    missing = [task for task in tasks if task.id not in blobs]
+    if missing:
+        blobs.update(save_task_embeddings(missing))
+
+    buffer = b"".join(bytes(blobs[task_id]) for task_id in ids)
+    return np.frombuffer(buffer, dtype=EMBEDDING_DTYPE).reshape(len(ids), -1)
@@ -0,0 +1,201 @@
+from ai_module.ai_services.auto_assign_task_tag import extract_tags_from_text, extract_tags_from_texts
+from ai_module.ai_services.auto_categorize_task import (
+    PROTOTYPE_BACKEND,
+    auto_categorize_task,
+    auto_categorize_tasks,
+    categorize_by_keywords,
+    get_categories,
+    get_categorizer_backend,
+)
+from ai_module.ai_services.enrichment_cache import EnrichmentCache
+from ai_module.ai_services.enrichment_tiers import (
+    EMBEDDING_TIER,
+    SPACY_TIER,
+    TIER_CACHE,
+    TIER_RULES,
+    TIER_USER,
+    TRANSFORMER_TIER,
+    Deadline,
+)
+from ai_module.ai_services.model_registry import (
+    SENTENCE_MODEL_NAME,
+    SPACY_MODEL_NAME,
+    ZERO_SHOT_MODEL_NAME,
+)
+from ai_module.ai_services.smart_priority_assignment import smart_priority_assignment
+from tasks.services.server_timing import span
+
+'''
+Task Enrichment
+What it does: Fills in the tags, category and priority a user left empty, using the
+tagging, categorization and prioritization services. Shared by the inline /add path
+and the background enrichment workers. Results are memoised in the EnrichmentCache.
+enrich_task_within_budget is the /add variant: model tiers only run while the
+latency budget allows, otherwise the rule-based answer is used.
+'''
+
+# Cache namespaces and fingerprints: a fingerprint changes whenever the model or the
+# rules behind a prediction change, so stale results are never served
+TAGS = "tags"
+TAGS_FINGERPRINT = f"{SPACY_MODEL_NAME}+rules:v3"
+CATEGORY = "category"
+PRIORITY = "priority"
+PRIORITY_FINGERPRINT = "rules:v1"
+
+
+def _category_fingerprint():
+    # backend and category list are settings, so the fingerprint is built per call
+    if get_categorizer_backend() == PROTOTYPE_BACKEND:
+        model = f"{SENTENCE_MODEL_NAME}+prototypes:v1"
+    else:
+        model = ZERO_SHOT_MODEL_NAME
+    return f"{model}:{'|'.join(get_categories())}"
+
+
+def _category_tier():
+    return EMBEDDING_TIER if get_categorizer_backend() == PROTOTYPE_BACKEND else TRANSFORMER_TIER
+
+
+def _cache_text(title, description):
+    return f"{title}\n{description}"
+
+
+def enrich_task(title, description, due_date, tags=None, category=None, priority=None):
+    """
+    Returns {"tags": <comma-separated str>, "category": str, "priority": str};
+    values passed in are kept, missing ones are predicted.
+    `due_date` must be a naive local datetime (as parsed from the request) or None.
+    """
+    cache = EnrichmentCache()
+    text = _cache_text(title, description)
+
+    if not tags:
+        tags = cache.cached(
+            TAGS, TAGS_FINGERPRINT, text, lambda: extract_tags_from_text(title, description)
+        )
+
+    if not category:
+        category = cache.cached(
+            CATEGORY, _category_fingerprint(), text, lambda: auto_categorize_task(title, description)
+        )
+
+    if not priority:
+        priority = _assign_priority(cache, text, title, description, due_date)
+
+    return {"tags": tags, "category": category, "priority": priority}
+
+
+def _assign_priority(cache, text, title, description, due_date):
+    with span("priority"):
+        if due_date is None:
+            # without a due date the rules only look at the text, so the result is cacheable
+            return cache.cached(
+                PRIORITY,
+                PRIORITY_FINGERPRINT,
+                text,
+                lambda: smart_priority_assignment(title, description, None),
+            )
+        return smart_priority_assignment(title, description, due_date)
+
+
+def enrich_task_within_budget(
+    title, description, due_date, tags=None, category=None, priority=None, budget_ms=None
+):
+    """
+    enrich_task bounded by `budget_ms` (None or 0: unlimited). Rule-based answers are
+    computed first; spaCy tags and model categories run in parallel and replace
+    them only if they finish in time. Only model results are cached, so a fallback
+    never hides the better answer from later requests.
+    Returns: enrich_task's dict plus "tiers": {field: tier that produced it}
+    """
+    deadline = Deadline(budget_ms)
+    cache = EnrichmentCache()
+    text = _cache_text(title, description)
+    values = {"tags": tags, "category": category, "priority": priority}
+    tiers = {field: TIER_USER for field, value in values.items() if value}
+
+    model_tiers = {
+        "tags": (TAGS, TAGS_FINGERPRINT, SPACY_TIER, lambda: extract_tags_from_text(title, description)),
+        "category": (CATEGORY, _category_fingerprint(), _category_tier(), lambda: auto_categorize_task(title, description)),
+    }
+    running = {}
+    for field, (namespace, fingerprint, tier, predict) in model_tiers.items():
+        if values[field]:
+            continue
+        cached = cache.get_many(namespace, fingerprint, [text])
+        if 0 in cached:
+            values[field], tiers[field] = cached[0], TIER_CACHE
+        elif tier.admits(deadline):
+            running[field] = tier.submit(predict)
+
+    # rules tier, computed while the model tiers run
+    fallbacks = {}
+    if not values["tags"]:
+        fallbacks["tags"] = extract_tags_from_text(title, description, use_nlp=False)
+    if not values["category"]:
+        fallbacks["category"] = categorize_by_keywords(title, description)
+    if not values["priority"]:
+        values["priority"], tiers["priority"] = (
+            _assign_priority(cache, text, title, description, due_date), TIER_RULES
+        )
+
+    for field, future in running.items():
+        namespace, fingerprint, tier, _ = model_tiers[field]
+        value = tier.result(future, deadline)
+        if value:
+            values[field], tiers[field] = value, tier.name
+            cache.set_many(namespace, fingerprint, [(text, value)])
+
+    for field, value in fallbacks.items():
+        if not values[field]:
+            values[field], tiers[field] = value, TIER_RULES
+
+    tiers = {field: tiers.get(field) for field in values}
+    return {**values, "tiers": tiers}
+
+
+def _fill_batch(items, results, field, namespace, fingerprint, predict):
+    """Fill `field` for every result missing it: cache first, one batched `predict` for the rest."""
+    pending = [index for index, result in enumerate(results) if not result[field]]
+    if not pending:
+        return
+
+    cache = EnrichmentCache()
+    texts = [_cache_text(items[index]["title"], items[index]["description"]) for index in pending]
+    cached = cache.get_many(namespace, fingerprint, texts)
+    for position, value in cached.items():
+        results[pending[position]][field] = value
+
+    misses = [position for position in range(len(pending)) if position not in cached]
+    if not misses:
+        return
+    values = predict(
+        [(items[pending[position]]["title"], items[pending[position]]["description"]) for position in misses]
+    )
+    for position, value in zip(misses, values):
+        results[pending[position]][field] = value
+    cache.set_many(namespace, fingerprint, [(texts[position], value) for position, value in zip(misses, values)])
+
+
+def enrich_tasks(items):
+    """
+    Batch version of enrich_task. `items` are dicts with the enrich_task arguments
+    (title, description, due_date, tags, category, priority). Tag extraction and
+    categorization run once over every item that needs them and is not cached.
+    Returns: list of {"tags", "category", "priority"} dicts, in input order
+    """
+    results = [
+        {"tags": item.get("tags"), "category": item.get("category"), "priority": item.get("priority")}
+        for item in items
+    ]
+
+    _fill_batch(items, results, "tags", TAGS, TAGS_FINGERPRINT, extract_tags_from_texts)
+    _fill_batch(items, results, "category", CATEGORY, _category_fingerprint(), auto_categorize_tasks)
+
+    for item, result in zip(items, results):
+        if not result["priority"]:
+            result["priority"] = smart_priority_assignment(
+                item["title"], item["description"], item.get("due_date")
+            )
+
+    return results
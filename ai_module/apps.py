@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class AiModuleConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "ai_module"
+
+    def ready(self):
+        from ai_module.ai_services.model_server import install_model_server_client
+
+        # served models go through `manage.py run_model_server` when AI_MODEL_SERVER_SOCKET is set
+        install_model_server_client()
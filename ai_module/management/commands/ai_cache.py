@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, Sum
+
+from ai_module.ai_services.enrichment_cache import EnrichmentCache
+from ai_module.models import AIResultCache
+
+
+class Command(BaseCommand):
+    help = "Inspect, evict or clear the shared AI enrichment result cache."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--clear", action="store_true", help="Delete every cached result.")
+        parser.add_argument(
+            "--evict", action="store_true", help="Evict least recently used rows down to AI_CACHE_MAX_BYTES."
+        )
+
+    def handle(self, *args, **options):
+        cache = EnrichmentCache()
+        if options["clear"]:
+            self.stdout.write(self.style.SUCCESS(f"Deleted {cache.clear()} cached result(s)."))
+            return
+        if options["evict"]:
+            self.stdout.write(self.style.SUCCESS(f"Evicted {cache.evict()} cached result(s)."))
+
+        rows = (
+            AIResultCache.objects.values("namespace")
+            .annotate(entries=Count("key"), size=Sum("size"))
+            .order_by("namespace")
+        )
+        for row in rows:
+            self.stdout.write(f"{row['namespace']}: {row['entries']} entries, {row['size']} bytes")
@@ -0,0 +1,38 @@
+import signal
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ai_module.ai_services.model_server import SERVED_MODELS, ModelServer, get_socket_path
+
+
+class Command(BaseCommand):
+    help = "Serve the zero-shot classifier and sentence encoder to all web workers over a Unix socket."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--socket", default=None, help="Socket path (default: AI_MODEL_SERVER_SOCKET).")
+        parser.add_argument(
+            "--models",
+            nargs="+",
+            choices=list(SERVED_MODELS),
+            default=list(SERVED_MODELS),
+            help="Models to serve.",
+        )
+
+    def handle(self, *args, **options):
+        path = options["socket"] or get_socket_path()
+        if not path:
+            raise CommandError("Set AI_MODEL_SERVER_SOCKET or pass --socket.")
+
+        server = ModelServer(path, models=options["models"])
+        server.load_models()
+
+        def _stop(signum, frame):
+            server.stop()
+
+        signal.signal(signal.SIGTERM, _stop)
+        self.stdout.write(self.style.SUCCESS(f"Serving {', '.join(server.models)} on {path}"))
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        self.stdout.write("Model server stopped.")
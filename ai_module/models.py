@@ -0,0 +1,15 @@
+from django.db import models
+from django.utils import timezone
+
+
+class AIResultCache(models.Model):
+    # content-addressed AI result, key = sha256(namespace, model fingerprint, cache version, text)
+    key = models.CharField(max_length=64, primary_key=True)
+    namespace = models.CharField(max_length=50)
+    value = models.TextField()  # JSON
+    size = models.PositiveIntegerField()
+    created_at = models.DateTimeField(auto_now_add=True, editable=False)
+    last_used_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    def __str__(self):
+        return f"{self.namespace}:{self.key}"
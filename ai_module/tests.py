@@ -0,0 +1,27 @@
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from ai_module.ai_services import model_server
+from ai_module.ai_services.model_server import ModelServerClient, ModelServerUnavailable, RemoteModel
+
+
+@override_settings(AI_MODEL_SERVER_SOCKET="/tmp/smart-todo-tests-model-server.sock")
+class RemoteLoaderTests(SimpleTestCase):
+    def test_server_started_after_the_first_load_is_used(self):
+        local_classifier = mock.Mock(return_value="local")
+        server = mock.Mock(side_effect=ModelServerUnavailable("not running"))
+
+        with mock.patch.object(ModelServerClient, "request", server):
+            model = model_server._remote_loader("classifier", lambda: local_classifier)()
+            self.assertIsInstance(model, RemoteModel)
+            self.assertEqual(model("Pay rent", ["Finance"]), "local")
+
+            # the server comes up; it is tried again once the retry delay is over
+            server.side_effect = None
+            server.return_value = "served"
+            model._retry_at = 0.0
+            self.assertEqual(model("Pay rent", ["Finance"]), "served")
+
+        server.assert_called_with("call", "classifier", "__call__", ("Pay rent", ["Finance"]), {})
+        local_classifier.assert_called_once_with("Pay rent", ["Finance"])
@@ -0,0 +1,101 @@
+"""
+Accuracy and latency of the category backends on a labelled fixture set.
+
+    python benchmarks/categorizer_backends.py [--fixture benchmarks/fixtures/labelled_tasks.json]
+
+For every backend (zero_shot: facebook/bart-large-mnli, prototype: all-MiniLM-L6-v2
+prototypes) it reports the model load time, accuracy against the labels, and the
+p50/p95 latency of a single auto_categorize_task() call plus the throughput of
+one batched auto_categorize_tasks() call. A backend whose model is not installed
+is reported as unavailable. The fixture categories must be the configured ones.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "smart_todo.settings")
+
+DEFAULT_FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "labelled_tasks.json")
+
+
+def run_backend(backend, rows):
+    from django.test.utils import override_settings
+
+    from ai_module.ai_services.auto_categorize_task import (
+        PROTOTYPE_BACKEND,
+        auto_categorize_task,
+        auto_categorize_tasks,
+    )
+    from ai_module.ai_services.model_registry import CLASSIFIER, SENTENCE_TRANSFORMER, ModelRegistry
+
+    model_name = SENTENCE_TRANSFORMER if backend == PROTOTYPE_BACKEND else CLASSIFIER
+    with override_settings(AI_CATEGORIZER_BACKEND=backend):
+        started = time.perf_counter()
+        available = ModelRegistry().get_model(model_name) is not None
+        load_seconds = time.perf_counter() - started
+        if not available:
+            return None
+        auto_categorize_task("warm up", "first call builds lazy state")
+
+        latencies, predictions = [], []
+        for row in rows:
+            started = time.perf_counter()
+            predictions.append(auto_categorize_task(row["title"], row["description"]))
+            latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        auto_categorize_tasks([(row["title"], row["description"]) for row in rows])
+        batch_seconds = time.perf_counter() - started
+
+    correct = sum(prediction == row["category"] for prediction, row in zip(predictions, rows))
+    return {
+        "load_s": load_seconds,
+        "accuracy": correct / len(rows),
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": sorted(latencies)[int(len(latencies) * 0.95) - 1] * 1000,
+        "batch_rows_per_s": len(rows) / batch_seconds,
+        "errors": [
+            (row["title"], row["category"], prediction)
+            for prediction, row in zip(predictions, rows)
+            if prediction != row["category"]
+        ],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--fixture", default=DEFAULT_FIXTURE)
+    parser.add_argument("--show-errors", action="store_true")
+    args = parser.parse_args()
+
+    import django
+
+    django.setup()
+
+    from ai_module.ai_services.auto_categorize_task import PROTOTYPE_BACKEND, ZERO_SHOT_BACKEND
+
+    with open(args.fixture) as fixture:
+        rows = json.load(fixture)
+
+    print(f"fixture: {len(rows)} labelled tasks")
+    for backend in (ZERO_SHOT_BACKEND, PROTOTYPE_BACKEND):
+        result = run_backend(backend, rows)
+        if result is None:
+            print(f"{backend:>10}: unavailable (model not installed)")
+            continue
+        print(
+            f"{backend:>10}: accuracy {result['accuracy']:.1%}, load {result['load_s']:.1f}s, "
+            f"p50 {result['p50_ms']:.1f}ms, p95 {result['p95_ms']:.1f}ms, "
+            f"batch {result['batch_rows_per_s']:.0f} rows/s"
+        )
+        if args.show_errors:
+            for title, expected, predicted in result["errors"]:
+                print(f"{'':>12}{title!r}: expected {expected}, got {predicted}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Generated task corpus shared by the benchmarks.
+
+    from benchmarks.corpus import create_tasks
+    create_tasks(1_000_000)   # after django.setup() and migrate
+
+Seeded, so every run (and every machine) gets the same titles, descriptions,
+statuses, priorities, categories, dates and tags.
+"""
+import random
+import uuid
+from datetime import datetime, timedelta
+
+WORDS = (
+    "report meeting invoice gym groceries code review deploy email call dentist plan budget "
+    "client contract insurance vacation course presentation server"
+).split()
+CATEGORIES = ("Work", "Personal", "Health", "Finance", "Learning", None)
+TAGS = ("work", "urgent", "home", "finance", "health", "study", "email", "travel")
+
+
+def parse_size(value):
+    """'1k' -> 1000, '100k' -> 100000, '1m' -> 1000000, '2500' -> 2500."""
+    value = value.strip().lower()
+    multiplier = {"k": 1_000, "m": 1_000_000}.get(value[-1:], 1)
+    return int(float(value[:-1] if multiplier > 1 else value) * multiplier)
+
+
+def create_tasks(count, seed=1):
+    """
+    Raw executemany() inserts in primary key order; the secondary indexes and the
+    full-text triggers are dropped meanwhile and rebuilt once at the end.
+    """
+    from django.db import connection
+
+    from tasks.services.full_text_search import FTS_TRIGGERS, install_full_text_triggers
+
+    rng = random.Random(seed)
+    id_rng = random.Random(seed + 1)
+    # naive UTC, the format Django stores datetimes in on SQLite
+    started = datetime(2025, 1, 1)
+    tag_ids = [uuid.UUID(int=id_rng.getrandbits(128)).hex for _ in TAGS]
+
+    task_ids = sorted(uuid.UUID(int=id_rng.getrandbits(128)).hex for _ in range(count))
+
+    def rows():
+        for index, task_id in enumerate(task_ids):
+            created = started + timedelta(minutes=index)
+            status = rng.choice(("pending", "in_progress", "completed"))
+            due = created + timedelta(days=rng.randint(1, 60)) if rng.random() < 0.7 else None
+            completed = created + timedelta(days=2) if status == "completed" else None
+            due, completed = (str(value) if value else None for value in (due, completed))
+            yield (
+                task_id, str(created), str(created), f"{rng.choice(WORDS)} {rng.choice(WORDS)} {index}",
+                " ".join(rng.choices(WORDS, k=8)), status, rng.choice(("low", "medium", "high")),
+                rng.choice(CATEGORIES), due, completed, rng.random() < 0.8, "completed", 1,
+            )
+
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA synchronous=OFF")
+        for name in FTS_TRIGGERS:
+            cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+        cursor.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = 'tasks_task' AND sql IS NOT NULL"
+        )
+        indexes = cursor.fetchall()
+        for name, _ in indexes:
+            cursor.execute(f'DROP INDEX "{name}"')
+        cursor.executemany(
+            "INSERT INTO tasks_task (id, created_at, updated_at, title, description, status, priority, "
+            "category, due_date, completed_at, is_active, enrichment_status, version) "
+            "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)",
+            rows(),
+        )
+        cursor.executemany(
+            "INSERT INTO tasks_tag (id, created_at, updated_at, name) VALUES (%s, %s, %s, %s)",
+            [(tag_id, str(started), str(started), name) for tag_id, name in zip(tag_ids, TAGS)],
+        )
+        # one tag on every tenth task
+        cursor.execute(
+            "INSERT INTO tasks_tasktag (id, created_at, updated_at, task_id, tag_id) "
+            "SELECT lower(hex(randomblob(16))), created_at, created_at, id, %s FROM tasks_task "
+            "WHERE rowid %% 10 = 0",
+            [tag_ids[0]],
+        )
+        for _, sql in indexes:
+            cursor.execute(sql)
+        cursor.execute("ANALYZE")
+    install_full_text_triggers()
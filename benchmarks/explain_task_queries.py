@@ -0,0 +1,155 @@
+"""
+EXPLAIN QUERY PLAN check of the task service queries at 1M rows.
+
+    python benchmarks/explain_task_queries.py --rows 1000000
+    python benchmarks/explain_task_queries.py --db /tmp/tasks-1m.sqlite3   # keep and reuse the data
+
+Builds the queries exactly as TaskServices does (read, search with every
+filter/sort combination, with and without archived tasks, and a cursor page, the bulk filter, the archive sweep),
+prints each plan with its run time and exits with 1 if any of them scans
+tasks_task without an index or sorts it in a temporary b-tree. Queries driven
+by another index are allowed to sort their matches: full-text (FTS5, by rank)
+and tag filters (the TaskTag (tag, task) index).
+Runs against a throw-away SQLite database unless --db is given; the project
+database is not touched.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "smart_todo.settings")
+
+from benchmarks.corpus import TAGS, create_tasks  # noqa: E402
+
+
+def setup_django(db_path):
+    import django
+    from django.conf import settings
+
+    settings.DATABASES["default"]["NAME"] = db_path
+    django.setup()
+
+    from django.core.management import call_command
+
+    call_command("migrate", verbosity=0)
+
+
+def service_queries():
+    """
+    (name, queryset, index driven) of every query shape TaskServices runs against
+    tasks_task; index driven queries may sort their matches.
+    """
+    from tasks.export_types.request_data_types.bulk_edit_task import TaskFilterType
+    from tasks.export_types.task_export_types.export_task import EXPORT_TASK_COLUMNS
+    from tasks.models import Task
+    from tasks.services.archive_sweep import get_archive_cutoff, stale_completed_tasks
+    from tasks.services.pagination import _page_queryset, encode_cursor, order_queryset, parse_sort
+    from tasks.services.read_cache import VERSION_FIELD
+    from tasks.services.task_service.task_service import TaskServices
+
+    task_id, created_at = Task.objects.filter(is_active=True).values_list("id", "created_at").last()
+    yield "read version check", Task.objects.filter(id=task_id, is_active=True).values_list("id", VERSION_FIELD), False
+    yield "read", Task.objects.filter(id=task_id, is_active=True), False
+
+    filters = ({}, {"status": "pending"}, {"priority": "high"}, {"status": "pending", "priority": "high"},
+               {"tags": [TAGS[0]]})
+    sorts = (None, "created_at", "due_date", "-due_date", "priority", "-priority")
+    for include_archived in (True, False):
+        for search_filter in filters:
+            for sort in sorts:
+                sort_key, descending = parse_sort(sort, has_query=False)
+                tasks = TaskServices._search_queryset(
+                    None, search_filter.get("status"), search_filter.get("priority"), search_filter.get("tags"),
+                    include_archived,
+                )
+                page, _, _ = _page_queryset(tasks, sort_key, descending, None, 50, EXPORT_TASK_COLUMNS)
+                label = ",".join(f"{key}={value}" for key, value in search_filter.items()) or "-"
+                if not include_archived:
+                    label += ",include_archived=false"
+                yield f"search {label} sort={sort or 'default'}", page, "tags" in search_filter
+
+    tasks = TaskServices._search_queryset(None, None, None, None)
+    cursor = encode_cursor("created_at", True, created_at, task_id)
+    page, _, _ = _page_queryset(tasks, "created_at", True, cursor, 50, EXPORT_TASK_COLUMNS)
+    yield "search cursor page sort=-created_at", page, False
+    cursor = encode_cursor("priority", False, 2, task_id)
+    page, _, _ = _page_queryset(tasks, "priority", False, cursor, 50, EXPORT_TASK_COLUMNS)
+    yield "search cursor page sort=priority", page, False
+
+    stream, _ = order_queryset(TaskServices._search_queryset(None, "pending", None, None), "created_at", True)
+    yield "search stream status=pending", stream.values_list(*EXPORT_TASK_COLUMNS), False
+
+    tasks = TaskServices._search_queryset("report budget", "pending", None, None)
+    page, _, _ = _page_queryset(tasks, "relevance", False, None, 50, EXPORT_TASK_COLUMNS)
+    yield "search q=report budget,status=pending", page, True
+
+    for label, task_filter in (("category=Work", TaskFilterType(category="Work")),
+                               ("status=in_progress", TaskFilterType(status="in_progress"))):
+        yield f"bulk filter {label}", TaskServices._filter_queryset(task_filter).values_list("id", flat=True), False
+    ids = list(Task.objects.filter(is_active=True).values_list("id", flat=True)[:500])
+    yield "bulk ids", Task.objects.filter(id__in=ids, is_active=True).values_list("id", flat=True), False
+
+    sweep = stale_completed_tasks(get_archive_cutoff(30)).order_by("completed_at").values_list("id", flat=True)[:500]
+    yield "archive sweep batch", sweep, False
+
+
+def explain(queryset):
+    from django.db import connection
+
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+        plan = [row[-1] for row in cursor.fetchall()]
+        started = time.perf_counter()
+        cursor.execute(sql, params)
+        cursor.fetchall()
+    return plan, time.perf_counter() - started
+
+
+def problems(plan, index_driven):
+    found = [
+        step
+        for step in plan
+        if step == "SCAN tasks_task" or (step.startswith("SCAN tasks_task ") and "INDEX" not in step)
+    ]
+    if not index_driven:
+        found += [step for step in plan if "TEMP B-TREE" in step]
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000, help="tasks in the database")
+    parser.add_argument("--db", default=None, help="database file to fill (if empty) and keep")
+    parser.add_argument("--verbose", action="store_true", help="print the SQL of every query")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        setup_django(args.db or os.path.join(directory, "explain.sqlite3"))
+
+        from tasks.models import Task
+
+        if not Task.objects.exists():
+            started = time.perf_counter()
+            create_tasks(args.rows)
+            print(f"created {args.rows} tasks in {time.perf_counter() - started:.0f}s")
+
+        failures = 0
+        print(f"tasks: {Task.objects.count()}, active: {Task.objects.filter(is_active=True).count()}")
+        for name, queryset, index_driven in service_queries():
+            plan, seconds = explain(queryset)
+            found = problems(plan, index_driven)
+            failures += bool(found)
+            print(f"{'FAIL' if found else 'ok':>4}  {name:<42} {seconds * 1000:8.1f}ms  {' | '.join(plan)}")
+            if args.verbose:
+                print(f"      {queryset.query}")
+
+    print(f"{failures} quer{'y' if failures == 1 else 'ies'} without a usable index" if failures else "every query uses an index")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Rows per second of the /search serialization path, before and after the
+values_list() read path.
+
+    python benchmarks/search_serialization.py --rows 20000 --page-size 200
+
+"before" is the former path: Task instances with prefetched tags ->
+model_to_dict() -> ExportTask(...) -> model_dump() -> JSONRenderer.
+"after" is the values_list() rows -> export_task_row() -> FastJSONRenderer path.
+
+Two numbers are reported: the whole search_task_service() call, which includes
+selecting the page (the same ORDER BY for both paths), and reading plus
+serializing an already selected page of ids, which isolates the changed code.
+Runs against a throw-away SQLite database, the project database is not touched.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import uuid
+from datetime import timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "smart_todo.settings")
+
+
+def setup_django(db_path):
+    import django
+    from django.conf import settings
+
+    settings.DATABASES["default"]["NAME"] = db_path
+    django.setup()
+
+    from django.core.management import call_command
+
+    call_command("migrate", verbosity=0)
+
+
+def create_tasks(count):
+    from django.utils import timezone
+
+    from tasks.models import Task
+    from tasks.services.tag_service.tag_service import TagServices
+
+    now = timezone.now()
+    tasks = [
+        Task(
+            id=uuid.uuid4(),
+            title=f"Benchmark task {index}",
+            description="Prepare the quarterly report and review the budget with finance",
+            status="pending",
+            priority=("low", "medium", "high")[index % 3],
+            category="Work",
+            due_date=now + timedelta(days=index % 30),
+        )
+        for index in range(count)
+    ]
+    Task.objects.bulk_create(tasks, batch_size=1000)
+    TagServices.add_task_tags({task.id: ["work", "report", f"q{index % 4 + 1}"] for index, task in enumerate(tasks)})
+
+
+def render_before(tasks):
+    from rest_framework.renderers import JSONRenderer
+
+    from tasks.export_types.task_export_types.export_task import ExportTask
+
+    data = {"task_list": [ExportTask(**task.model_to_dict()).model_dump() for task in tasks]}
+    return JSONRenderer().render({"message": "Data is fetched`", "data": data})
+
+
+def render_after(data):
+    from tasks.services.renderers import FastJSONRenderer
+
+    return FastJSONRenderer().render({"message": "Data is fetched`", "data": data})
+
+
+def search_before(page_size, page_ids):
+    from tasks.models import Task
+
+    return render_before(Task.objects.prefetch_related("tags").order_by("-created_at", "-id")[:page_size])
+
+
+def search_after(page_size, page_ids):
+    from tasks.services.task_service.task_service import TaskServices
+
+    return render_after(TaskServices.search_task_service(None, None, None, limit=str(page_size)))
+
+
+def page_before(page_size, page_ids):
+    from tasks.models import Task
+
+    return render_before(Task.objects.prefetch_related("tags").filter(id__in=page_ids))
+
+
+def page_after(page_size, page_ids):
+    from tasks.export_types.task_export_types.export_task import EXPORT_TASK_COLUMNS
+    from tasks.models import Task
+    from tasks.services.task_service.task_service import TaskServices
+
+    rows = list(Task.objects.filter(id__in=page_ids).values_list(*EXPORT_TASK_COLUMNS))
+    return render_after({"task_list": TaskServices._export_rows(rows), "next": None})
+
+
+def measure(function, page_size, page_ids, repeat):
+    function(page_size, page_ids)  # warm-up
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function(page_size, page_ids)
+        best = min(best, time.perf_counter() - started)
+    return page_size / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000, help="tasks in the database")
+    parser.add_argument("--page-size", type=int, default=200, help="rows per response")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        setup_django(os.path.join(directory, "benchmark.sqlite3"))
+
+        from django.conf import settings
+
+        settings.SEARCH_MAX_PAGE_SIZE = max(settings.SEARCH_MAX_PAGE_SIZE, args.page_size)
+        create_tasks(args.rows)
+
+        from tasks.models import Task
+
+        page_ids = list(Task.objects.values_list("id", flat=True)[: args.page_size])
+        results = {
+            name: (
+                measure(before, args.page_size, page_ids, args.repeat),
+                measure(after, args.page_size, page_ids, args.repeat),
+            )
+            for name, before, after in (
+                ("search_task_service", search_before, search_after),
+                ("page read + serialize", page_before, page_after),
+            )
+        }
+
+    from tasks.services import renderers
+
+    print(f"rows: {args.rows}, page size: {args.page_size}, orjson: {renderers.orjson is not None}")
+    for name, (before, after) in results.items():
+        print(f"{name:>22}: before {before:9.0f} rows/s, after {after:9.0f} rows/s ({after / before:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
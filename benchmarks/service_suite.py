@@ -0,0 +1,296 @@
+"""
+Offline latency suite for the task services and AI functions, compared against a stored baseline.
+
+    python benchmarks/service_suite.py                          # 1k tasks, stub models
+    python benchmarks/service_suite.py --sizes 1k,100k,1m --output results.json
+    python benchmarks/service_suite.py --models real            # the ModelRegistry models
+    python benchmarks/service_suite.py --save-baseline          # store this run as the baseline
+
+For every corpus size it fills a throw-away SQLite database with generated
+tasks (benchmarks/corpus.py) and times extract_tags_from_text(),
+auto_categorize_task(), semantic_task_search(), TaskSerializer.create() (inline
+enrichment, one INSERT per call) and search_task_service() with several filter
+and sort shapes. Each case reports calls, ops/s and mean/p50/p95 latency.
+
+The models are deterministic stubs (benchmarks/stub_models.py) unless --models
+real is given, so the numbers measure the service code and are comparable
+between runs and machines of the same kind. Results are printed as a table and
+written as JSON with --output; with a baseline (--baseline, default
+benchmarks/service_suite_baseline.json) every case whose p50 is more than
+--tolerance slower exits with 1. Baselines are only compared when they were
+recorded with the same models; record a fresh one per machine.
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import sqlite3
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "smart_todo.settings")
+
+from benchmarks.corpus import TAGS, create_tasks, parse_size  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "service_suite_baseline.json")
+
+# calls per case at --scale 1
+CALLS = {
+    "extract_tags_from_text": 2000,
+    "auto_categorize_task": 2000,
+    "semantic_task_search": 20,
+    "TaskSerializer.create": 200,
+    "search_task_service": 100,
+}
+# semantic_task_search scores every task it is given; larger corpora are searched
+# through their first --semantic-pool tasks
+SEMANTIC_POOL = 100_000
+SEMANTIC_QUERIES = (
+    "prepare the client presentation", "pay the insurance invoice", "book a dentist appointment",
+    "deploy the server after code review", "plan the vacation budget",
+)
+SEARCH_SHAPES = (
+    ("default", {}),
+    ("status=pending,sort=-due_date", {"status": "pending", "sort": "-due_date"}),
+    ("priority=high,sort=priority", {"priority": "high", "sort": "priority"}),
+    (f"tags={TAGS[0]}", {"tags": [TAGS[0]]}),
+    ("q=report budget", {"query": "report budget"}),
+)
+
+
+def size_label(count):
+    for suffix, unit in (("m", 1_000_000), ("k", 1_000)):
+        if count >= unit and count % unit == 0:
+            return f"{count // unit}{suffix}"
+    return str(count)
+
+
+def use_database(db_path):
+    """Point the "default" database at `db_path` and migrate it."""
+    from django.conf import settings
+    from django.core.management import call_command
+    from django.db import connections
+
+    connections.close_all()
+    settings.DATABASES["default"]["NAME"] = db_path
+    connections["default"].settings_dict["NAME"] = db_path
+    call_command("migrate", verbosity=0)
+
+
+def percentile(ordered, fraction):
+    return ordered[max(0, math.ceil(len(ordered) * fraction) - 1)]
+
+
+def measure(function, arguments):
+    """Time function(*args) for every args after one warm-up call; stdout (debug prints) is discarded."""
+    latencies = []
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        function(*arguments[0])
+        for args in arguments:
+            started = time.perf_counter()
+            function(*args)
+            latencies.append(time.perf_counter() - started)
+    latencies.sort()
+    total = sum(latencies)
+    return {
+        "calls": len(latencies),
+        "ops_per_s": len(latencies) / total if total else 0.0,
+        "mean_ms": total / len(latencies) * 1000,
+        "p50_ms": percentile(latencies, 0.5) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+    }
+
+
+def fill_embeddings(limit):
+    """Store the embeddings of the first `limit` tasks, as the write path would have."""
+    from ai_module.ai_services.task_embedding_store import save_task_embeddings
+    from tasks.models import Task, TaskEmbedding
+
+    tasks = Task.objects.filter(is_active=True).order_by("id").only("id", "title", "description")[:limit]
+    if TaskEmbedding.objects.count() >= limit:
+        return list(tasks)
+    pool, chunk = [], []
+    for task in tasks.iterator(chunk_size=2000):
+        pool.append(task)
+        chunk.append(task)
+        if len(chunk) == 2000:
+            save_task_embeddings(chunk)
+            chunk = []
+    save_task_embeddings(chunk)
+    return pool
+
+
+def run_cases(label, scale, semantic_pool):
+    from ai_module.ai_services.auto_assign_task_tag import extract_tags_from_text
+    from ai_module.ai_services.auto_categorize_task import auto_categorize_task
+    from ai_module.ai_services.smart_task_search import semantic_task_search
+    from tasks.export_types.request_data_types.add_task import AddTaskRequestType
+    from tasks.models import Task
+    from tasks.serializers.task_serializer import TaskSerializer
+    from tasks.services.task_service.task_service import TaskServices
+
+    def calls(case):
+        return max(1, int(CALLS[case] * scale))
+
+    texts = list(Task.objects.order_by("id").values_list("title", "description")[: calls("auto_categorize_task")])
+    texts = (texts * math.ceil(calls("extract_tags_from_text") / len(texts)))[: calls("extract_tags_from_text")]
+    cases = {
+        "extract_tags_from_text": measure(extract_tags_from_text, texts),
+        "auto_categorize_task": measure(auto_categorize_task, texts[: calls("auto_categorize_task")]),
+    }
+
+    started = time.perf_counter()
+    pool = fill_embeddings(semantic_pool)
+    embedding_seconds = time.perf_counter() - started
+    queries = [(SEMANTIC_QUERIES[index % len(SEMANTIC_QUERIES)], pool) for index in range(calls("semantic_task_search"))]
+    cases["semantic_task_search"] = measure(semantic_task_search, queries)
+
+    # new text on every call: nothing is served by the enrichment cache
+    requests = [
+        ({"request_data": AddTaskRequestType(title=f"{title} new {label} {index}", description=description)},)
+        for index, (title, description) in enumerate(texts[: calls("TaskSerializer.create")])
+    ]
+    cases["TaskSerializer.create"] = measure(TaskSerializer().create, requests)
+
+    for name, shape in SEARCH_SHAPES:
+        arguments = {"query": None, "status": None, "priority": None, **shape}
+        cases[f"search_task_service[{name}]"] = measure(
+            lambda: TaskServices.search_task_service(**arguments), [()] * calls("search_task_service")
+        )
+    return cases, {"semantic_pool": len(pool), "embedding_fill_s": embedding_seconds}
+
+
+def run_size(count, directory, scale, semantic_pool):
+    from tasks.models import Task
+
+    label = size_label(count)
+    use_database(os.path.join(directory, f"service-suite-{label}.sqlite3"))
+    fill_seconds = 0.0
+    if not Task.objects.exists():
+        started = time.perf_counter()
+        create_tasks(count)
+        fill_seconds = time.perf_counter() - started
+    print(f"[{label}] {Task.objects.count()} tasks ({fill_seconds:.0f}s to generate)", file=sys.stderr)
+
+    cases, details = run_cases(label, scale, min(semantic_pool, count))
+    return label, {"tasks": count, "fill_s": fill_seconds, **details, "cases": cases}
+
+
+def environment(models):
+    import numpy
+    from ai_module.ai_services.model_registry import CLASSIFIER, NLP, SENTENCE_TRANSFORMER, STOPWORDS, ModelRegistry
+    from django.conf import settings
+
+    registry = ModelRegistry()
+    return {
+        "models": models,
+        "available_models": {name: registry.get_model(name) is not None
+                             for name in (NLP, CLASSIFIER, SENTENCE_TRANSFORMER, STOPWORDS)},
+        "categorizer_backend": settings.AI_CATEGORIZER_BACKEND,
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "numpy": numpy.__version__,
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def compare(results, baseline, tolerance):
+    """[(size, case, baseline p50, p50, ratio, regressed)] for every case present in both runs."""
+    rows = []
+    for label, run in results["sizes"].items():
+        baseline_cases = baseline.get("sizes", {}).get(label, {}).get("cases", {})
+        for case, stats in run["cases"].items():
+            if case not in baseline_cases:
+                continue
+            before = baseline_cases[case]["p50_ms"]
+            ratio = stats["p50_ms"] / before if before else 1.0
+            rows.append({
+                "size": label, "case": case, "baseline_p50_ms": before, "p50_ms": stats["p50_ms"],
+                "ratio": ratio, "regressed": ratio > 1 + tolerance,
+            })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="1k", help="comma separated corpus sizes, e.g. 1k,100k,1m")
+    parser.add_argument("--models", choices=("stub", "real"), default="stub")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply the calls per case")
+    parser.add_argument("--semantic-pool", type=int, default=SEMANTIC_POOL,
+                        help="tasks scored by semantic_task_search")
+    parser.add_argument("--db-dir", default=None, help="directory to keep (and reuse) the corpus databases in")
+    parser.add_argument("--output", default=None, help="write the results as JSON to this file")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="write this run to --baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed p50 slowdown against the baseline")
+    args = parser.parse_args()
+
+    import django
+
+    # no query runs before use_database() points "default" at a corpus database
+    django.setup()
+
+    from django.test.utils import override_settings
+
+    if args.models == "stub":
+        from benchmarks.stub_models import install
+
+        install()
+
+    results = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": environment(args.models),
+        "sizes": {},
+    }
+    if args.db_dir:
+        os.makedirs(args.db_dir, exist_ok=True)
+    with tempfile.TemporaryDirectory() as directory:
+        # inline enrichment and no batching window: one request at a time, every model call on the clock
+        with override_settings(AI_ENRICHMENT_MODE="sync", AI_MICRO_BATCH_ENABLED=False):
+            for count in (parse_size(size) for size in args.sizes.split(",")):
+                label, run = run_size(count, args.db_dir or directory, args.scale, args.semantic_pool)
+                results["sizes"][label] = run
+
+    print(f"{'size':>5}  {'case':<52} {'ops/s':>10} {'p50 ms':>9} {'p95 ms':>9}")
+    for label, run in results["sizes"].items():
+        for case, stats in run["cases"].items():
+            print(f"{label:>5}  {case:<52} {stats['ops_per_s']:10.1f} {stats['p50_ms']:9.2f} {stats['p95_ms']:9.2f}")
+
+    regressions = []
+    if not args.save_baseline and os.path.exists(args.baseline):
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        if baseline.get("environment", {}).get("models") != args.models:
+            print(f"baseline {args.baseline} was recorded with other models, not compared", file=sys.stderr)
+        else:
+            results["comparison"] = compare(results, baseline, args.tolerance)
+            regressions = [row for row in results["comparison"] if row["regressed"]]
+            for row in results["comparison"]:
+                print(
+                    f"{'SLOW' if row['regressed'] else 'ok':>5}  {row['size']:>4} {row['case']:<52} "
+                    f"{row['baseline_p50_ms']:9.2f} -> {row['p50_ms']:9.2f} ms ({row['ratio']:.2f}x)"
+                )
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+            file.write("\n")
+    if args.save_baseline:
+        with open(args.baseline, "w") as file:
+            json.dump(results, file, indent=2)
+            file.write("\n")
+        print(f"baseline written to {args.baseline}", file=sys.stderr)
+
+    if regressions:
+        print(f"{len(regressions)} case(s) more than {args.tolerance:.0%} slower than the baseline", file=sys.stderr)
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Deterministic stand-ins for the spaCy, zero-shot, sentence-transformer and
+NLTK stopword models, so the benchmarks run offline and give the same output
+on every machine.
+
+    from benchmarks.stub_models import install
+    install()   # every ModelRegistry model is now a stub
+
+They have the call signatures the ai_services use (`nlp(text)`, `nlp.pipe(...)`,
+`classifier(texts, labels, batch_size=...)`, `encoder.encode(texts, ...)`) and
+cost a small, fixed amount of pure Python per text: the suite measures the
+service code around the models, not the models. Run with the real models
+(`--models real`) to measure those too.
+"""
+import re
+import zlib
+
+import numpy as np
+
+EMBEDDING_DIM = 384  # all-MiniLM-L6-v2
+TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+STOP_WORDS = frozenset(
+    "a an and are as at be before but by for from had has have in is it its just make "
+    "of on or sure the their them then there these they this to two was were what when "
+    "which with".split()
+)
+
+
+def _hash(text):
+    return zlib.crc32(text.encode("utf-8"))
+
+
+class StubToken:
+    __slots__ = ("text", "lower_", "lemma_", "pos_", "is_stop")
+
+    def __init__(self, text):
+        self.text = text
+        self.lower_ = text.lower()
+        self.is_stop = self.lower_ in STOP_WORDS
+        self.lemma_ = self.lower_[:-1] if self.lower_.endswith("s") and len(self.lower_) > 4 else self.lower_
+        self.pos_ = "NOUN" if text.isalpha() and not self.is_stop and _hash(self.lower_) % 3 else "VERB"
+
+
+class StubSpan:
+    __slots__ = ("text", "label_")
+
+    def __init__(self, text, label):
+        self.text = text
+        self.label_ = label
+
+
+class StubDoc:
+    """Tokens by regex; capitalised words after the first token are ORG entities."""
+
+    def __init__(self, text):
+        self.text = text
+        self.tokens = [StubToken(token) for token in TOKEN_PATTERN.findall(text)]
+        self.ents = [StubSpan(token.text, "ORG") for token in self.tokens[1:] if token.text[:1].isupper()]
+
+    def __iter__(self):
+        return iter(self.tokens)
+
+    def __len__(self):
+        return len(self.tokens)
+
+
+class StubNLP:
+    def __call__(self, text):
+        return StubDoc(text)
+
+    def pipe(self, texts, batch_size=None, **kwargs):
+        for text in texts:
+            yield StubDoc(text)
+
+
+def stub_classifier(sequences, candidate_labels, batch_size=None, multi_label=False, **kwargs):
+    """Zero-shot pipeline output; a label scores higher the more of the text's words hash next to it."""
+    single = isinstance(sequences, str)
+    outputs = []
+    for sequence in [sequences] if single else sequences:
+        words = TOKEN_PATTERN.findall(sequence.lower())
+        scores = [1.0 + sum(_hash(f"{label}:{word}") % 7 == 0 for word in words) for label in candidate_labels]
+        total = sum(scores)
+        ranked = sorted(zip(candidate_labels, scores), key=lambda pair: (-pair[1], pair[0]))
+        outputs.append(
+            {
+                "sequence": sequence,
+                "labels": [label for label, _ in ranked],
+                "scores": [score / total for _, score in ranked],
+            }
+        )
+    return outputs[0] if single else outputs
+
+
+class StubEncoder:
+    """Hashed bag of words: texts sharing words get similar vectors."""
+
+    def __init__(self, dim=EMBEDDING_DIM):
+        self.dim = dim
+
+    def get_sentence_embedding_dimension(self):
+        return self.dim
+
+    def encode(self, sentences, convert_to_numpy=True, normalize_embeddings=False, batch_size=32, **kwargs):
+        single = isinstance(sentences, str)
+        sentences = [sentences] if single else list(sentences)
+        embeddings = np.zeros((len(sentences), self.dim), dtype=np.float32)
+        for row, sentence in enumerate(sentences):
+            for word in TOKEN_PATTERN.findall(sentence.lower()):
+                code = _hash(word)
+                embeddings[row, code % self.dim] += 1.0 if code & 0x80000000 else -1.0
+        if normalize_embeddings:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings /= np.where(norms == 0, 1.0, norms)
+        return embeddings[0] if single else embeddings
+
+
+def install():
+    """Replace every ModelRegistry loader with its stub (loaded models are dropped)."""
+    from ai_module.ai_services.model_registry import (
+        CLASSIFIER,
+        NLP,
+        SENTENCE_TRANSFORMER,
+        STOPWORDS,
+        ModelRegistry,
+    )
+
+    registry = ModelRegistry()
+    registry.register(NLP, StubNLP)
+    registry.register(CLASSIFIER, lambda: stub_classifier)
+    registry.register(SENTENCE_TRANSFORMER, StubEncoder)
+    registry.register(STOPWORDS, lambda: STOP_WORDS)
@@ -0,0 +1,162 @@
+"""
+CPU cost and output of extract_tags_from_text(), before and after the
+single-pass engine (compiled keyword matcher, one tokenization, NER on the
+original-case text).
+
+    python benchmarks/tag_extraction.py --texts 5000
+
+"before" is the former implementation, kept here verbatim minus its debug
+prints: the keyword dict rebuilt per call, one substring scan per keyword,
+spaCy on lower-cased text and a second NLTK tokenization. spaCy and NLTK
+are used when they are installed; without them only the rule and token
+stages are compared.
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_module.ai_services.auto_assign_task_tag import (  # noqa: E402
+    MAX_TEXT_LENGTH,
+    extract_tags_from_text,
+    match_predefined_tags,
+)
+from ai_module.ai_services.model_registry import NLP, STOPWORDS, ModelRegistry  # noqa: E402
+
+try:
+    from nltk.tokenize import word_tokenize
+except ImportError:
+    word_tokenize = str.split
+
+TITLES = [
+    "Maintain the build server", "Book doctor appointment", "Pay electricity bill",
+    "Prepare client presentation", "Study machine learning course", "Buy groceries at the market",
+    "Fix UI bug in React app", "Plan family vacation", "Review Django API pull request",
+    "Urgent: renew car insurance", "Email Acme Corp about the contract", "Gym session",
+]
+DESCRIPTIONS = [
+    "Make sure the deadline is met and the team is aligned.",
+    "Remember to bring the documents and check the budget first.",
+    "Aim to finish before Friday, it is important for the quarterly review.",
+    "Coordinate with Google and Microsoft partners on the rollout plan.",
+    "Read two chapters of the book and practice the exercises.",
+    "Nothing special, just a routine maintenance task for the database.",
+]
+
+# keyword-stage output the matcher must produce: whole words, plurals and verb forms only
+EXPECTED_TAGS = [
+    ("maintain the build server", ["backend"]),
+    ("aim to finish before friday", []),
+    ("fix ui bug in react app", ["frontend"]),
+    ("booking a flight", []),
+    ("finish the homework", []),
+    ("ordering pizza", []),
+    ("learning python", ["learning", "backend"]),
+    ("shopping for shoes", ["shopping"]),
+    ("studied two books", ["learning"]),
+    ("pay the bills", ["finance"]),
+    ("weekly meetings with clients", ["work"]),
+    ("read about machine  learning", ["ai"]),
+]
+
+
+def legacy_predefined_tags(text):
+    predefined_tags = {
+        'work': ['work', 'job', 'office', 'meeting', 'project', 'client', 'deadline', 'presentation'],
+        'learning': ['learn', 'study', 'course', 'tutorial', 'book', 'research', 'practice'],
+        'health': ['doctor', 'gym', 'exercise', 'medical', 'appointment', 'fitness', 'diet'],
+        'personal': ['personal', 'family', 'friend', 'home', 'hobby', 'vacation'],
+        'finance': ['bank', 'money', 'budget', 'bill', 'payment', 'insurance', 'tax'],
+        'shopping': ['buy', 'purchase', 'shop', 'order', 'store', 'market'],
+        'urgent': ['urgent', 'asap', 'critical', 'important', 'emergency'],
+        'ai': ['ai', 'ml', 'machine learning', 'artificial intelligence', 'data science'],
+        'backend': ['backend', 'server', 'database', 'api', 'django', 'python'],
+        'frontend': ['frontend', 'ui', 'ux', 'react', 'javascript', 'css', 'html']
+    }
+    return [tag for tag, keywords in predefined_tags.items() if any(keyword in text for keyword in keywords)]
+
+
+def legacy_extract_tags(title, description):
+    text = f"{title} {description[:MAX_TEXT_LENGTH]}".lower()
+    found_tags = legacy_predefined_tags(text)
+
+    nlp = ModelRegistry().get_model(NLP)
+    if nlp:
+        doc = nlp(text)
+        found_tags.extend([ent.text.lower() for ent in doc.ents
+                           if ent.label_ in ['ORG', 'PRODUCT', 'EVENT', 'WORK_OF_ART']][:3])
+        found_tags.extend([token.lemma_.lower() for token in doc
+                           if token.pos_ == 'NOUN' and len(token.text) > 3 and not token.is_stop][:5])
+
+    words = word_tokenize(text.lower())
+    stop_words = ModelRegistry().get_model(STOPWORDS) or frozenset()
+    found_tags.extend([word for word in words if word.isalnum() and word not in stop_words and len(word) > 3][:5])
+
+    clean_tags, seen = [], set()
+    for tag in found_tags:
+        tag_clean = re.sub(r'[^\w\s]', '', str(tag)).strip().lower()
+        if tag_clean and tag_clean not in seen and len(tag_clean) > 2:
+            clean_tags.append(tag_clean)
+            seen.add(tag_clean)
+    return ','.join(clean_tags[:3])
+
+
+def make_corpus(count, seed=7):
+    rng = random.Random(seed)
+    return [(rng.choice(TITLES), " ".join(rng.sample(DESCRIPTIONS, 2))) for _ in range(count)]
+
+
+def rate(function, arguments, repeat):
+    """Best calls per second over `repeat` runs of function(*args) for every args."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for args in arguments:
+            function(*args)
+        best = min(best, time.perf_counter() - started)
+    return len(arguments) / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--texts", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.texts)
+    registry = ModelRegistry()
+    registry.get_model(NLP)
+    registry.get_model(STOPWORDS)
+
+    before = rate(legacy_extract_tags, corpus, args.repeat)
+    after = rate(extract_tags_from_text, corpus, args.repeat)
+    print(f"spaCy: {registry.get_model(NLP) is not None}, texts: {len(corpus)}")
+    print(f"extract_tags_from_text: before {before:9.0f} texts/s, after {after:9.0f} texts/s ({after / before:.1f}x)")
+
+    # keyword stage on its own, the part every call pays even without models
+    texts = [(f"{title} {description}".lower(),) for title, description in corpus]
+    before = rate(legacy_predefined_tags, texts, args.repeat)
+    after = rate(match_predefined_tags, texts, args.repeat)
+    print(f"{'keyword stage':>22}: before {before:9.0f} texts/s, after {after:9.0f} texts/s ({after / before:.1f}x)")
+
+    print("predefined tags that changed (before -> after):")
+    for title in TITLES + DESCRIPTIONS:
+        text = title.lower()
+        old, new = legacy_predefined_tags(text), match_predefined_tags(text)
+        if old != new:
+            print(f"  {title!r}: {old} -> {new}")
+
+    wrong = [(text, expected, match_predefined_tags(text)) for text, expected in EXPECTED_TAGS]
+    wrong = [case for case in wrong if case[1] != case[2]]
+    print(f"expected tags: {len(EXPECTED_TAGS) - len(wrong)}/{len(EXPECTED_TAGS)} correct")
+    for text, expected, got in wrong:
+        print(f"  {text!r}: expected {expected}, got {got}")
+    return 1 if wrong else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
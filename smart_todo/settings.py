@@ -40,6 +40,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "tasks.middleware.MetricsMiddleware",
+    "tasks.middleware.ServerTimingMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -79,6 +81,42 @@ DATABASES = {
     }
 }
 
+# DATABASE_PROFILE=production: WAL and tuned pragmas on every new connection, connections
+# kept open between requests, and a query_only "read" alias that read-only service calls
+# are routed to (tasks/services/db_router.py)
+DATABASE_PROFILE = os.environ.get("DATABASE_PROFILE", "default")
+if DATABASE_PROFILE == "production":
+    SQLITE_PRAGMAS = [
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        f"PRAGMA mmap_size={int(os.environ.get('SQLITE_MMAP_SIZE', str(256 * 1024 * 1024)))}",
+        # negative: KiB instead of pages
+        f"PRAGMA cache_size=-{int(os.environ.get('SQLITE_CACHE_SIZE_KB', '65536'))}",
+        f"PRAGMA busy_timeout={int(os.environ.get('SQLITE_BUSY_TIMEOUT_MS', '5000'))}",
+        "PRAGMA temp_store=MEMORY",
+        # refresh stale planner statistics (cheap, sampled) for the long-lived connection
+        "PRAGMA optimize=0x10002",
+    ]
+    DATABASE_CONN_MAX_AGE = int(os.environ.get("DATABASE_CONN_MAX_AGE", "600"))
+    DATABASES["default"].update(
+        {
+            "CONN_MAX_AGE": DATABASE_CONN_MAX_AGE,
+            "CONN_HEALTH_CHECKS": True,
+            "OPTIONS": {
+                "init_command": ";".join(SQLITE_PRAGMAS),
+                # take the write lock at BEGIN: a deferred transaction upgrading to a
+                # writer fails with "database is locked" without waiting for busy_timeout
+                "transaction_mode": "IMMEDIATE",
+            },
+        }
+    )
+    DATABASES["read"] = {
+        **DATABASES["default"],
+        "OPTIONS": {"init_command": ";".join(SQLITE_PRAGMAS + ["PRAGMA query_only=ON"])},
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_ROUTERS = ["tasks.services.db_router.ReadOnlyServiceRouter"]
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -120,3 +158,94 @@ STATIC_URL = "static/"
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+# AI enrichment
+# "sync": tags/category/priority are predicted inside POST /add
+# "async": the task is saved as pending and `manage.py run_enrichment_workers` fills them in
+AI_ENRICHMENT_MODE = os.environ.get("AI_ENRICHMENT_MODE", "sync")
+# latency budget of the inline enrichment in ms (0: unlimited); a request can send
+# `enrichment_budget_ms` instead. Model tiers that do not fit fall back to the rules.
+AI_ENRICHMENT_BUDGET_MS = int(os.environ.get("AI_ENRICHMENT_BUDGET_MS", "0"))
+AI_ENRICHMENT_TIER_WORKERS = int(os.environ.get("AI_ENRICHMENT_TIER_WORKERS", "4"))
+
+# category classifier: "zero_shot" (bart-large-mnli) or "prototype" (MiniLM embedding prototypes)
+AI_CATEGORIZER_BACKEND = os.environ.get("AI_CATEGORIZER_BACKEND", "zero_shot")
+AI_CATEGORIES = [
+    category.strip()
+    for category in os.environ.get(
+        "AI_CATEGORIES", "Work,Personal,Learning,Health,Shopping,Finance"
+    ).split(",")
+    if category.strip()
+]
+
+# micro-batching of concurrent classifier/encoder calls: inputs arriving within the
+# window (ms) share one forward pass of at most AI_MICRO_BATCH_MAX_SIZE inputs
+AI_MICRO_BATCH_ENABLED = os.environ.get("AI_MICRO_BATCH_ENABLED", "false").lower() in ("1", "true", "yes")
+AI_MICRO_BATCH_WINDOW_MS = float(os.environ.get("AI_MICRO_BATCH_WINDOW_MS", "5"))
+AI_MICRO_BATCH_MAX_SIZE = int(os.environ.get("AI_MICRO_BATCH_MAX_SIZE", "16"))
+
+# out-of-process model server (`manage.py run_model_server`) shared by all workers;
+# empty: every worker loads its own models. Falls back to in-process when the server is down.
+AI_MODEL_SERVER_SOCKET = os.environ.get("AI_MODEL_SERVER_SOCKET", "")
+AI_MODEL_SERVER_AUTHKEY = os.environ.get("AI_MODEL_SERVER_AUTHKEY", "")
+AI_MODEL_SERVER_TIMEOUT = float(os.environ.get("AI_MODEL_SERVER_TIMEOUT", "30"))
+
+# AI result cache: in-process LRU in front of a table shared by all workers
+# bump AI_CACHE_VERSION to invalidate every cached result (e.g. after a model upgrade)
+AI_CACHE_ENABLED = os.environ.get("AI_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+AI_CACHE_VERSION = os.environ.get("AI_CACHE_VERSION", "1")
+AI_CACHE_MEMORY_ENTRIES = int(os.environ.get("AI_CACHE_MEMORY_ENTRIES", "2048"))
+AI_CACHE_MAX_BYTES = int(os.environ.get("AI_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+# project log (tasks.services.log.logger): written by a background thread to LOG_DIR;
+# LOG_FORMAT "text" or "json" (one object per line). By default the files are reopened
+# when logrotate moves them, which is safe with any number of worker processes. A single
+# process can rotate them itself, by size (LOG_MAX_BYTES) or by time with LOG_ROTATE_WHEN
+# ("midnight", "H", ...), keeping LOG_BACKUP_COUNT old files; forked workers never do.
+LOG_DIR = os.environ.get("LOG_DIR", "logs")
+LOG_FORMAT = os.environ.get("LOG_FORMAT", "text")
+LOG_MAX_BYTES = int(os.environ.get("LOG_MAX_BYTES", "0"))
+LOG_ROTATE_WHEN = os.environ.get("LOG_ROTATE_WHEN", "")
+LOG_BACKUP_COUNT = int(os.environ.get("LOG_BACKUP_COUNT", "5"))
+
+# Prometheus metrics at /metrics; with several worker processes (gunicorn) set
+# METRICS_MULTIPROC_DIR to a directory shared by them and emptied on deploy: every
+# process writes its values there each METRICS_FLUSH_INTERVAL seconds and /metrics adds them up
+METRICS_ENABLED = os.environ.get("METRICS_ENABLED", "true").lower() in ("1", "true", "yes")
+METRICS_MULTIPROC_DIR = os.environ.get("METRICS_MULTIPROC_DIR", "")
+METRICS_FLUSH_INTERVAL = float(os.environ.get("METRICS_FLUSH_INTERVAL", "5"))
+
+# per-stage timings (validation, spaCy, classifier, DB insert, ...) of every request in a
+# `Server-Timing` response header, and in the project log unless SERVER_TIMING_LOG=false
+SERVER_TIMING_ENABLED = os.environ.get("SERVER_TIMING_ENABLED", "false").lower() in ("1", "true", "yes")
+SERVER_TIMING_LOG = os.environ.get("SERVER_TIMING_LOG", "true").lower() in ("1", "true", "yes")
+
+# async task views for ASGI deployments (`uvicorn smart_todo.asgi:application`);
+# /add enrichment runs on a pool of ASYNC_INFERENCE_WORKERS threads per process
+TASK_API_ASYNC = os.environ.get("TASK_API_ASYNC", "false").lower() in ("1", "true", "yes")
+ASYNC_INFERENCE_WORKERS = int(os.environ.get("ASYNC_INFERENCE_WORKERS", "2"))
+
+# /read cache: in-process LRU in front of the "tasks" cache shared by all workers; the
+# shared tier is only used with TASK_CACHE_REDIS_URL (redis://..., needs `pip install redis`)
+TASK_READ_CACHE_ENABLED = os.environ.get("TASK_READ_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+TASK_READ_CACHE_ENTRIES = int(os.environ.get("TASK_READ_CACHE_ENTRIES", "1024"))
+TASK_READ_CACHE_TIMEOUT = int(os.environ.get("TASK_READ_CACHE_TIMEOUT", "3600"))
+CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+TASK_CACHE_REDIS_URL = os.environ.get("TASK_CACHE_REDIS_URL", "")
+if TASK_CACHE_REDIS_URL:
+    CACHES["tasks"] = {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": TASK_CACHE_REDIS_URL,
+    }
+
+# `manage.py archive_completed_tasks`: archive tasks completed more than N days ago,
+# TASK_ARCHIVE_BATCH_SIZE per UPDATE; repeated every TASK_ARCHIVE_SWEEP_INTERVAL seconds with --every
+TASK_ARCHIVE_COMPLETED_AFTER_DAYS = float(os.environ.get("TASK_ARCHIVE_COMPLETED_AFTER_DAYS", "30"))
+TASK_ARCHIVE_BATCH_SIZE = int(os.environ.get("TASK_ARCHIVE_BATCH_SIZE", "500"))
+TASK_ARCHIVE_SWEEP_INTERVAL = float(os.environ.get("TASK_ARCHIVE_SWEEP_INTERVAL", "3600"))
+
+# /search page size: `limit` query param, capped at SEARCH_MAX_PAGE_SIZE
+SEARCH_PAGE_SIZE = int(os.environ.get("SEARCH_PAGE_SIZE", "50"))
+SEARCH_MAX_PAGE_SIZE = int(os.environ.get("SEARCH_MAX_PAGE_SIZE", "200"))
+# rows fetched per DB round trip when /search streams NDJSON
+SEARCH_STREAM_CHUNK_SIZE = int(os.environ.get("SEARCH_STREAM_CHUNK_SIZE", "500"))
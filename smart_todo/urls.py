@@ -15,10 +15,16 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 
+from django.conf import settings
 from django.contrib import admin
 from django.urls import path, include
 
+from tasks.views.metrics import MetricsView
+
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/v1/task/", include("tasks.urls")),
 ]
+
+if getattr(settings, "METRICS_ENABLED", True):
+    urlpatterns.append(path("metrics", MetricsView.as_view(), name="Metrics"))
@@ -1,6 +1,25 @@
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_migrate
+
+
+def install_full_text_index(sender, using, **kwargs):
+    from django.db import connections
+
+    from tasks.services.full_text_search import install_full_text_triggers
+
+    install_full_text_triggers(connections[using])
 
 
 class TasksConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "tasks"
+
+    def ready(self):
+        post_migrate.connect(install_full_text_index, sender=self)
+
+        from tasks.services.metrics import install_query_counter, is_metrics_enabled
+
+        if is_metrics_enabled():
+            # per-request DB query counts for /metrics
+            connection_created.connect(install_query_counter)
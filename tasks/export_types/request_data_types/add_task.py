@@ -11,3 +11,5 @@ class AddTaskRequestType(BaseModel):
     tags: Optional[List[str]] = None
     due_date: Optional[str] = None
     completed_at: Optional[str] = None
+    # latency budget for the AI enrichment of this task, overrides AI_ENRICHMENT_BUDGET_MS
+    enrichment_budget_ms: Optional[int] = None
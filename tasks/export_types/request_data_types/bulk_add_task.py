@@ -0,0 +1,7 @@
+from typing import Any, Dict, List
+from pydantic import BaseModel
+
+
+class BulkAddTaskRequestType(BaseModel):
+    # every item is an AddTaskRequestType payload, validated one by one
+    tasks: List[Dict[str, Any]]
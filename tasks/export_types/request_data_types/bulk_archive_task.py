@@ -0,0 +1,11 @@
+from typing import Dict, List, Optional
+from pydantic import BaseModel
+
+from tasks.export_types.request_data_types.bulk_edit_task import TaskFilterType
+
+
+class BulkArchiveTaskRequestType(BaseModel):
+    # exactly one target: `ids`, `versions` (id -> version as last read) or `filter`
+    ids: Optional[List[str]] = None
+    versions: Optional[Dict[str, int]] = None
+    filter: Optional[TaskFilterType] = None
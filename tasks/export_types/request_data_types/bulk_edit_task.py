@@ -0,0 +1,23 @@
+from typing import Dict, List, Optional
+from pydantic import BaseModel
+
+
+class TaskFilterType(BaseModel):
+    status: Optional[str] = None
+    priority: Optional[str] = None
+    category: Optional[str] = None
+    # all must be present
+    tags: Optional[List[str]] = None
+
+
+class BulkEditTaskRequestType(BaseModel):
+    # exactly one target: `ids`, `versions` (id -> version as last read) or `filter`
+    ids: Optional[List[str]] = None
+    versions: Optional[Dict[str, int]] = None
+    filter: Optional[TaskFilterType] = None
+    # new values, only the given columns are written
+    status: Optional[str] = None
+    priority: Optional[str] = None
+    category: Optional[str] = None
+    due_date: Optional[str] = None
+    completed_at: Optional[str] = None
@@ -13,3 +13,5 @@ class EditTaskRequestType(BaseModel):
     due_date: Optional[str] = None
     completed_at: Optional[str] = None
     is_active: Optional[bool] = None
+    # `version` of the task as last read; a newer version on the server rejects the edit
+    version: Optional[int] = None
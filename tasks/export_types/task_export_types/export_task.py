@@ -10,7 +10,7 @@ class ExportTask(BaseModel):
     title: str
     description: str
     status: str
-    priority: str
+    priority: Optional[str] = None
     category: Optional[str] = None
     tags: Optional[List[str]] = None
     due_date: Optional[datetime] = None
@@ -18,18 +18,76 @@ class ExportTask(BaseModel):
     updated_at: datetime
     completed_at: Optional[datetime] = None
     is_active: bool
+    enrichment_status: Optional[str] = None
+    # send it back with /update to reject the edit if the task changed in the meantime
+    version: Optional[int] = None
 
     def __init__(self, **kwargs):
-        # Check if 'tags' exists and is a string in the incoming data
-        if "tags" in kwargs and isinstance(kwargs.get("tags"), str):
-            tags_string = kwargs["tags"]
-            # Split the string, strip whitespace, and filter out empty parts.
-            # This correctly turns an empty string '' into an empty list [].
-            kwargs["tags"] = [
-                tag.strip() for tag in tags_string.split(",") if tag.strip()
-            ]
+        # `tags` comes from model_to_dict() as the related manager; use the
+        # prefetched tags when the queryset has prefetch_related("tags")
+        tags = kwargs.get("tags")
+        if tags is not None and not isinstance(tags, list):
+            kwargs["tags"] = [tag.name for tag in tags.all()]
         super().__init__(**kwargs)
 
 
+# columns read by the values_list() path, ExportTask fields without `tags`
+EXPORT_TASK_COLUMNS = (
+    "id",
+    "title",
+    "description",
+    "status",
+    "priority",
+    "category",
+    "due_date",
+    "created_at",
+    "updated_at",
+    "completed_at",
+    "is_active",
+    "enrichment_status",
+    "version",
+)
+
+
+def export_task_row(row: tuple, tags: List[str]) -> dict:
+    """
+    ExportTask(...).model_dump() for a values_list(*EXPORT_TASK_COLUMNS) row,
+    built without validation: the values come straight from the database.
+    """
+    (
+        task_id,
+        title,
+        description,
+        status,
+        priority,
+        category,
+        due_date,
+        created_at,
+        updated_at,
+        completed_at,
+        is_active,
+        enrichment_status,
+        version,
+    ) = row[: len(EXPORT_TASK_COLUMNS)]
+    return {
+        "id": task_id,
+        "title": title,
+        "description": description,
+        "status": status,
+        "priority": priority,
+        "category": category,
+        "tags": tags,
+        "due_date": due_date,
+        "created_at": created_at,
+        "updated_at": updated_at,
+        "completed_at": completed_at,
+        "is_active": is_active,
+        "enrichment_status": enrichment_status,
+        "version": version,
+    }
+
+
 class ExportTaskList(BaseModel):
     task_list: List[ExportTask]
+    # cursor of the next page, None on the last page
+    next: Optional[str] = None
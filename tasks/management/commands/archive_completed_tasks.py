@@ -0,0 +1,76 @@
+import signal
+import threading
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from tasks.services.archive_sweep import archive_stale_completed_tasks
+
+
+class Command(BaseCommand):
+    help = "Archive completed tasks older than TASK_ARCHIVE_COMPLETED_AFTER_DAYS, in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--older-than-days",
+            type=float,
+            default=None,
+            help="Archive tasks completed more than this many days ago (default: TASK_ARCHIVE_COMPLETED_AFTER_DAYS).",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=None, help="Tasks per UPDATE (default: TASK_ARCHIVE_BATCH_SIZE)."
+        )
+        parser.add_argument(
+            "--max-batches", type=int, default=None, help="Stop a sweep after this many batches."
+        )
+        parser.add_argument(
+            "--pause", type=float, default=0.05, help="Seconds to sleep between batches."
+        )
+        parser.add_argument(
+            "--every",
+            type=float,
+            nargs="?",
+            const=-1,
+            default=None,
+            help="Keep running and sweep every N seconds (default: TASK_ARCHIVE_SWEEP_INTERVAL).",
+        )
+
+    def handle(self, *args, **options):
+        interval = options["every"]
+        if interval is not None and interval < 0:
+            interval = getattr(settings, "TASK_ARCHIVE_SWEEP_INTERVAL", 3600)
+
+        stop_event = threading.Event()
+        signal.signal(signal.SIGTERM, lambda signum, frame: stop_event.set())
+        try:
+            while True:
+                self.sweep(options)
+                if interval is None:
+                    return
+                close_old_connections()
+                if stop_event.wait(interval):
+                    return
+        except KeyboardInterrupt:
+            pass
+
+    def sweep(self, options):
+        def _report(progress):
+            self.stdout.write(
+                f"batch {progress['batches']}: {progress['archived']} archived, "
+                f"{progress['rate']:.0f} tasks/s"
+            )
+
+        progress = archive_stale_completed_tasks(
+            older_than_days=options["older_than_days"],
+            batch_size=options["batch_size"],
+            max_batches=options["max_batches"],
+            pause=options["pause"],
+            on_batch=_report if options["verbosity"] > 0 else None,
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Archived {progress['archived']} completed task(s) in {progress['batches']} "
+                f"batch(es), {progress['seconds']:.1f}s ({progress['rate']:.0f} tasks/s)."
+            )
+        )
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from tasks.services.full_text_search import install_full_text_triggers, rebuild_full_text_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the task full-text search index (e.g. after a manual VACUUM)."
+
+    def handle(self, *args, **options):
+        install_full_text_triggers()
+        rebuild_full_text_index()
+        self.stdout.write(self.style.SUCCESS("Task full-text index rebuilt."))
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from tasks.services.enrichment_service.enrichment_service import EnrichmentServices
+
+
+class Command(BaseCommand):
+    help = "Run the background AI enrichment worker pool (AI_ENRICHMENT_MODE=async)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=2, help="Number of worker threads.")
+        parser.add_argument(
+            "--poll-interval", type=float, default=1.0, help="Seconds to wait when the queue is empty."
+        )
+        parser.add_argument(
+            "--drain", action="store_true", help="Exit once the queue is empty instead of polling."
+        )
+
+    def handle(self, *args, **options):
+        processed = EnrichmentServices.run_worker_pool(
+            workers=options["workers"],
+            poll_interval=options["poll_interval"],
+            drain=options["drain"],
+        )
+        self.stdout.write(self.style.SUCCESS(f"Processed {processed} enrichment job(s)."))
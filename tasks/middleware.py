@@ -0,0 +1,138 @@
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from tasks.services.log.logger import logger
+from tasks.services.metrics import (
+    DB_QUERIES_PER_REQUEST,
+    HTTP_REQUEST_SECONDS,
+    HTTP_REQUESTS,
+    MetricsRegistry,
+    is_metrics_enabled,
+    start_query_count,
+    stop_query_count,
+)
+from tasks.services.server_timing import (
+    is_server_timing_enabled,
+    server_timing_header,
+    start_recording,
+    stop_recording,
+    summarize,
+)
+
+
+class ServerTimingMiddleware:
+    """
+    Records the spans of every request and sends them in a `Server-Timing` header.
+    Removed from the middleware chain at startup unless SERVER_TIMING_ENABLED is set.
+    Works in front of sync (WSGI) and async (ASGI) views.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not is_server_timing_enabled():
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        self.log = getattr(settings, "SERVER_TIMING_LOG", True)
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        token = start_recording()
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            spans = stop_recording(token)
+        self.report(request, response, spans, time.perf_counter() - started)
+        return response
+
+    async def __acall__(self, request):
+        token = start_recording()
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            spans = stop_recording(token)
+        self.report(request, response, spans, time.perf_counter() - started)
+        return response
+
+    def report(self, request, response, spans, total_seconds):
+        summary = summarize(spans)
+        response["Server-Timing"] = server_timing_header(summary, total_seconds)
+        if self.log:
+            logger.info(
+                f"{request.method} {request.path} {response.status_code} "
+                f"{total_seconds * 1000:.1f}ms | {response['Server-Timing']}",
+                extra={
+                    "server_timing": {
+                        "method": request.method,
+                        "path": request.path,
+                        "status": response.status_code,
+                        "total_ms": round(total_seconds * 1000, 3),
+                        "spans": {
+                            name: {"ms": round(seconds * 1000, 3), "count": count}
+                            for name, seconds, count in summary
+                        },
+                    }
+                },
+            )
+
+
+class MetricsMiddleware:
+    """
+    Counts every request and its latency and DB queries by route for /metrics.
+    Removed from the middleware chain at startup unless METRICS_ENABLED is set.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not is_metrics_enabled():
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        self.registry = MetricsRegistry()
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        self.registry.ensure_flusher()
+        token = start_query_count()
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            queries = stop_query_count(token)
+        self.record(request, response, time.perf_counter() - started, queries)
+        return response
+
+    async def __acall__(self, request):
+        self.registry.ensure_flusher()
+        token = start_query_count()
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            queries = stop_query_count(token)
+        self.record(request, response, time.perf_counter() - started, queries)
+        return response
+
+    @staticmethod
+    def record(request, response, seconds, queries):
+        # the URL pattern, not the path: one series per endpoint
+        match = getattr(request, "resolver_match", None)
+        route = match.route if match is not None else "unmatched"
+        HTTP_REQUESTS.inc(route=route, method=request.method, status=response.status_code)
+        HTTP_REQUEST_SECONDS.observe(seconds, route=route, method=request.method)
+        DB_QUERIES_PER_REQUEST.observe(queries, route=route)
@@ -0,0 +1,35 @@
+from django.db import migrations
+
+
+def create_full_text_index(apps, schema_editor):
+    # FTS5 is SQLite only; the sync triggers are (re)installed on post_migrate,
+    # see tasks.apps.TasksConfig.ready
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    schema_editor.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS tasks_task_fts "
+        "USING fts5(title, description, tags, tokenize = 'porter unicode61')"
+    )
+
+
+def drop_full_text_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    for trigger in (
+        "tasks_task_fts_insert",
+        "tasks_task_fts_update",
+        "tasks_task_fts_delete",
+    ):
+        schema_editor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    schema_editor.execute("DROP TABLE IF EXISTS tasks_task_fts")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0002_taskembedding"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_full_text_index, drop_full_text_index),
+    ]
@@ -0,0 +1,160 @@
+import uuid
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def drop_full_text_triggers(apps, schema_editor):
+    # SQLite refuses to drop tasks_task.tags while a trigger references it; the
+    # relation based triggers are installed (and the index rebuilt) on post_migrate
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    for trigger in (
+        "tasks_task_fts_insert",
+        "tasks_task_fts_update",
+        "tasks_task_fts_delete",
+    ):
+        schema_editor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+
+
+def split_tags(tag_string):
+    names = []
+    for tag in (tag_string or "").split(","):
+        name = tag.strip().lower()
+        if name and name not in names:
+            names.append(name[:100])
+    return names
+
+
+def copy_tags_to_relation(apps, schema_editor):
+    Task = apps.get_model("tasks", "Task")
+    Tag = apps.get_model("tasks", "Tag")
+    TaskTag = apps.get_model("tasks", "TaskTag")
+
+    task_tag_names = {
+        task_id: split_tags(tags)
+        for task_id, tags in Task.objects.exclude(tags__isnull=True)
+        .exclude(tags="")
+        .values_list("id", "tags")
+        .iterator()
+    }
+    names = {name for tag_names in task_tag_names.values() for name in tag_names}
+    Tag.objects.bulk_create([Tag(name=name) for name in names], ignore_conflicts=True)
+    tag_ids = dict(Tag.objects.values_list("name", "id"))
+    TaskTag.objects.bulk_create(
+        [
+            TaskTag(task_id=task_id, tag_id=tag_ids[name])
+            for task_id, tag_names in task_tag_names.items()
+            for name in tag_names
+        ],
+        ignore_conflicts=True,
+        batch_size=500,
+    )
+
+
+def copy_tags_to_string(apps, schema_editor):
+    Task = apps.get_model("tasks", "Task")
+    TaskTag = apps.get_model("tasks", "TaskTag")
+
+    task_tag_names = {}
+    for task_id, name in TaskTag.objects.values_list("task_id", "tag__name").iterator():
+        task_tag_names.setdefault(task_id, []).append(name)
+    for task_id, tag_names in task_tag_names.items():
+        Task.objects.filter(id=task_id).update(tags=",".join(tag_names)[:200])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0004_task_enrichment_status_enrichmentjob"),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_full_text_triggers, migrations.RunPython.noop),
+        migrations.CreateModel(
+            name="Tag",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        unique=True,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("name", models.CharField(max_length=100, unique=True)),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="TaskTag",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        unique=True,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "tag",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="tasks.tag",
+                    ),
+                ),
+                (
+                    "task",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="tasks.task",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+                "indexes": [
+                    models.Index(
+                        fields=["tag", "task"], name="tasks_taskt_tag_id_57069b_idx"
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("task", "tag"), name="unique_task_tag"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(copy_tags_to_relation, copy_tags_to_string),
+        migrations.RemoveIndex(
+            model_name="task",
+            name="tasks_task_tags_b75bf9_idx",
+        ),
+        migrations.RemoveField(
+            model_name="task",
+            name="tags",
+        ),
+        migrations.AddField(
+            model_name="task",
+            name="tags",
+            field=models.ManyToManyField(
+                blank=True,
+                related_name="tasks",
+                through="tasks.TaskTag",
+                to="tasks.tag",
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.6 on 2026-10-17 20:17
+
+from django.db import migrations, models
+
+from tasks.migrations._fts import drop_full_text_triggers
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0005_task_tags"),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_full_text_triggers, migrations.RunPython.noop),
+        migrations.AddField(
+            model_name="task",
+            name="version",
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
@@ -0,0 +1,110 @@
+# Generated by Django 5.2.6 on 2026-10-17 20:25
+
+from django.db import migrations, models
+
+from tasks.migrations._fts import drop_full_text_triggers
+
+
+def analyze_tasks(apps, schema_editor):
+    # planner statistics, so that filtered searches pick the index of their sort key
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    schema_editor.execute("ANALYZE tasks_task")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0006_task_version"),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_full_text_triggers, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name="task",
+            name="tasks_task_status_4a0a95_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="task",
+            name="tasks_task_priorit_a900d4_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="task",
+            name="tasks_task_categor_521417_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="task",
+            name="tasks_task_is_acti_16b97a_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="task",
+            name="tasks_task_due_dat_bce847_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="task",
+            name="tasks_task_complet_b3d8de_idx",
+        ),
+        migrations.AddField(
+            model_name="task",
+            name="priority_rank",
+            field=models.GeneratedField(
+                db_persist=False,
+                expression=models.Case(
+                    models.When(priority="low", then=models.Value(1)),
+                    models.When(priority="medium", then=models.Value(2)),
+                    models.When(priority="high", then=models.Value(3)),
+                    default=models.Value(0),
+                ),
+                output_field=models.IntegerField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["created_at", "id"],
+                name="task_active_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["due_date", "id"],
+                name="task_active_due_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["priority_rank", "id"],
+                name="task_active_priority_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["status", "created_at", "id"],
+                name="task_active_status_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["category"],
+                name="task_active_category_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("is_active", True), ("status", "completed")),
+                fields=["completed_at"],
+                name="task_active_completed_idx",
+            ),
+        ),
+        migrations.RunPython(analyze_tasks, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.6 on 2026-10-17 21:26
+
+from django.db import migrations, models
+
+
+def analyze_tasks(apps, schema_editor):
+    # planner statistics, so that filtered searches pick the index of their sort key
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    schema_editor.execute("ANALYZE tasks_task")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0007_task_active_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="task",
+            name="task_active_created_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="task",
+            name="task_active_due_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="task",
+            name="task_active_priority_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="task",
+            name="task_active_status_idx",
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(fields=["created_at", "id"], name="task_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(fields=["due_date", "id"], name="task_due_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["priority_rank", "id"], name="task_priority_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["status", "created_at", "id"], name="task_status_idx"
+            ),
+        ),
+        migrations.RunPython(analyze_tasks, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,22 @@
+'''
+Helpers shared by the migrations. The trigger names are frozen here, a migration
+must not change with the application code that runs after it.
+'''
+
+# every full-text sync trigger installed on post_migrate since 0005
+FTS_TRIGGERS = (
+    "tasks_task_fts_insert",
+    "tasks_task_fts_update",
+    "tasks_task_fts_delete",
+    "tasks_tasktag_fts_insert",
+    "tasks_tasktag_fts_delete",
+)
+
+
+def drop_full_text_triggers(apps, schema_editor):
+    # SQLite rebuilds tasks_task to alter it and refuses while triggers reference
+    # it; they are reinstalled (and the index rebuilt) on post_migrate
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    for trigger in FTS_TRIGGERS:
+        schema_editor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
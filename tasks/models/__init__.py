@@ -0,0 +1,4 @@
+from tasks.models.model.tag_model import Tag, TaskTag  # noqa: F401
+from tasks.models.model.task_model import Task  # noqa: F401
+from tasks.models.model.task_embedding_model import TaskEmbedding  # noqa: F401
+from tasks.models.model.enrichment_job_model import EnrichmentJob  # noqa: F401
@@ -1,9 +1,10 @@
-import logging
 import uuid
 
 from django.core.exceptions import FieldError
 from django.db import models
 
+from tasks.services.log.logger import logger
+
 
 class GenericBaseModel(models.Model):
     id = models.UUIDField(
@@ -19,12 +20,14 @@ class GenericBaseModel(models.Model):
         try:
             # Handle regular fields
             data = {
-                field.name: getattr(self, field.name) for field in self._meta.fields
+                field.name: getattr(self, field.name)
+                for field in self._meta.fields
+                if not field.generated
             }
             # Handle many-to-many fields
             for field in self._meta.many_to_many:
                 data[field.name] = getattr(self, field.name)
             return data
         except Exception:
-            logging.error("Error occurred  while converting model to dict")
+            logger.error("Error occurred  while converting model to dict")
             raise FieldError("Error occurred  while converting model to dict")
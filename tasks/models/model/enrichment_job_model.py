@@ -0,0 +1,28 @@
+from django.db import models
+from django.utils import timezone
+
+from tasks.models.base_models.base_model import GenericBaseModel
+from tasks.models.model.task_model import Task
+from tasks.services.const import ENRICHMENT_JOB_STATUS_CHOICES
+
+
+class EnrichmentJob(GenericBaseModel):
+    # durable queue entry for the background AI enrichment of one task
+    task = models.ForeignKey(Task, on_delete=models.CASCADE, related_name="enrichment_jobs")
+    status = models.CharField(
+        max_length=20, choices=ENRICHMENT_JOB_STATUS_CHOICES, default="queued"
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    available_at = models.DateTimeField(default=timezone.now)
+    locked_at = models.DateTimeField(blank=True, null=True)
+    locked_by = models.CharField(max_length=100, blank=True, null=True)
+    last_error = models.TextField(blank=True, null=True)
+
+    def __str__(self):
+        return f"{self.task_id} ({self.status})"
+
+    class Meta:
+        abstract = False
+        indexes = [
+            models.Index(fields=["status", "available_at"]),
+        ]
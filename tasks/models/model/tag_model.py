@@ -0,0 +1,32 @@
+from django.db import models
+
+from tasks.models.base_models.base_model import GenericBaseModel
+
+
+class Tag(GenericBaseModel):
+    # normalised (stripped, lower-case) tag name
+    name = models.CharField(max_length=100, unique=True)
+
+    def __str__(self):
+        return self.name
+
+    class Meta:
+        abstract = False
+
+
+class TaskTag(GenericBaseModel):
+    # the unique (task, tag) index serves task -> tags, the (tag, task) index tag -> tasks
+    task = models.ForeignKey("tasks.Task", on_delete=models.CASCADE, db_index=False)
+    tag = models.ForeignKey(Tag, on_delete=models.CASCADE, db_index=False)
+
+    def __str__(self):
+        return f"{self.task_id} - {self.tag_id}"
+
+    class Meta:
+        abstract = False
+        constraints = [
+            models.UniqueConstraint(fields=["task", "tag"], name="unique_task_tag"),
+        ]
+        indexes = [
+            models.Index(fields=["tag", "task"]),
+        ]
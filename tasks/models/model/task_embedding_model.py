@@ -0,0 +1,17 @@
+from django.db import models
+
+from tasks.models.base_models.base_model import GenericBaseModel
+from tasks.models.model.task_model import Task
+
+
+class TaskEmbedding(GenericBaseModel):
+    # float32 sentence embedding of "<title> <description>", L2-normalised
+    task = models.OneToOneField(Task, on_delete=models.CASCADE, related_name="embedding")
+    model_name = models.CharField(max_length=100)
+    vector = models.BinaryField()
+
+    def __str__(self):
+        return f"{self.task_id} ({self.model_name})"
+
+    class Meta:
+        abstract = False
@@ -1,7 +1,14 @@
 from django.db import models
+from django.db.models import Case, Q, Value, When
 
 from tasks.models.base_models.base_model import GenericBaseModel
-from tasks.services.const import STATUS_CHOICES, PRIORITY_CHOICES
+from tasks.models.model.tag_model import Tag
+from tasks.services.const import (
+    STATUS_CHOICES,
+    PRIORITY_CHOICES,
+    PRIORITY_RANK,
+    ENRICHMENT_STATUS_CHOICES,
+)
 
 
 class Task(GenericBaseModel):
@@ -14,22 +21,63 @@ class Task(GenericBaseModel):
         max_length=10, choices=PRIORITY_CHOICES, default="medium", blank=True, null=True
     )
     category = models.CharField(max_length=100, blank=True, null=True)
-    tags = models.CharField(max_length=200, blank=True, null=True)
+    tags = models.ManyToManyField(Tag, through="TaskTag", related_name="tasks", blank=True)
     due_date = models.DateTimeField(blank=True, null=True)
     completed_at = models.DateTimeField(blank=True, null=True)
     is_active = models.BooleanField(default=False, blank=True, null=True)
+    # state of the AI tags/category/priority fill-in, None for tasks created before it existed
+    enrichment_status = models.CharField(
+        max_length=20, choices=ENRICHMENT_STATUS_CHOICES, blank=True, null=True
+    )
+    # bumped by every edit/archive; an edit sent with an older version is rejected
+    version = models.PositiveIntegerField(default=1)
+    # key of `sort=priority`, a virtual column so that the sort can use an index
+    priority_rank = models.GeneratedField(
+        expression=Case(
+            *[When(priority=name, then=Value(rank)) for name, rank in PRIORITY_RANK.items()],
+            default=Value(0),
+        ),
+        output_field=models.IntegerField(),
+        db_persist=False,
+    )
 
     def __str__(self):
         return self.title
 
     class Meta:
         abstract = False
+        # shaped to the TaskServices queries. /search returns archived tasks too
+        # (unless include_archived=false), so its sort indexes cover every row; the
+        # other queries only read active tasks, archived rows stay out of their indexes
         indexes = [
-            models.Index(fields=["status"]),
-            models.Index(fields=["priority"]),
-            models.Index(fields=["category"]),
-            models.Index(fields=["is_active"]),
-            models.Index(fields=["tags"]),
-            models.Index(fields=["due_date"]),
-            models.Index(fields=["completed_at"]),
+            # /search sort keys, (key, id) as in the keyset pagination
+            models.Index(
+                fields=["created_at", "id"],
+                name="task_created_idx",
+            ),
+            models.Index(
+                fields=["due_date", "id"],
+                name="task_due_idx",
+            ),
+            models.Index(
+                fields=["priority_rank", "id"],
+                name="task_priority_idx",
+            ),
+            # status filter with the default (-created_at) sort
+            models.Index(
+                fields=["status", "created_at", "id"],
+                name="task_status_idx",
+            ),
+            # bulk edit/archive filter
+            models.Index(
+                fields=["category"],
+                condition=Q(is_active=True),
+                name="task_active_category_idx",
+            ),
+            # archive_completed_tasks sweep
+            models.Index(
+                fields=["completed_at"],
+                condition=Q(is_active=True, status="completed"),
+                name="task_active_completed_idx",
+            ),
         ]
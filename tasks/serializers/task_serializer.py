@@ -1,11 +1,15 @@
-from typing import Optional
+from typing import List, Optional
 
+from django.conf import settings
+from django.db import transaction
 from rest_framework import serializers
 
-from ai_module.ai_services.auto_assign_task_tag import extract_tags_from_text
-from ai_module.ai_services.auto_categorize_task import auto_categorize_task
-from ai_module.ai_services.smart_priority_assignment import smart_priority_assignment
+from ai_module.ai_services.task_embedding_store import save_task_embedding, save_task_embeddings
+from ai_module.ai_services.task_enrichment import enrich_task_within_budget, enrich_tasks
 from tasks.models.model.task_model import Task
+from tasks.services.enrichment_service.enrichment_service import EnrichmentServices
+from tasks.services.server_timing import span
+from tasks.services.tag_service.tag_service import TagServices
 from tasks.services.helpers import (
     validate_string_input,
     validate_dateTime_input,
@@ -39,6 +43,11 @@ class TaskSerializer(serializers.ModelSerializer):
                 detail="Priority should not."
             )
 
+        if request.enrichment_budget_ms is not None and request.enrichment_budget_ms < 0:
+            raise serializers.ValidationError(
+                detail="Enrichment budget must be a positive number of milliseconds."
+            )
+
         if request.tags and not validate_list_input(request.tags):
             raise serializers.ValidationError(
                 detail="Tags should not be empty and must be a list."
@@ -54,45 +63,126 @@ class TaskSerializer(serializers.ModelSerializer):
         return True
 
     def create(self, data: dict) -> Optional[Task]:
-        if self.validate(data):
+        with span("validate"):
+            valid = self.validate(data)
+        if valid:
             request: AddTaskRequestType = data.get("request_data")
 
             due_date = convert_string_to_dateTime(request.due_date)
             completed_at = convert_string_to_dateTime(request.completed_at)
-            tag_list = request.tags
-            tag_string_list = ""
-
-            if not tag_list:
-                ai_tags: str = extract_tags_from_text(request.title, request.description)
-                print(f"Onion_ai_tags: {ai_tags}")
-
-                tag_string_list = ai_tags
-            else:
-                if validate_list_input(tag_list):
-                    for tag in tag_list:
-                        tag_string_list += tag + ","
-
-            if not request.category:
-                ai_category = auto_categorize_task(request.title, request.description)
-                print(f"Onion_ai_category: {ai_category}")
-
-                request.category = ai_category
-
-            if not request.priority:
-                ai_priority = smart_priority_assignment(request.title, request.description, due_date)
-                print(f"Onion_ai_priority: {ai_priority}")
-                request.priority = ai_priority
-
-
-            task = Task.objects.create(
-                title=request.title,
-                description=request.description,
-                category=request.category,
-                due_date=due_date,
-                completed_at=completed_at,
-                tags=tag_string_list,
-                priority=request.priority,
+            tag_names = []
+
+            if validate_list_input(request.tags):
+                tag_names = TagServices.normalize_tag_names(request.tags)
+
+            if EnrichmentServices.is_async_enabled():
+                # insert now, tags/category/priority are filled in by the enrichment workers
+                with span("db_insert"), transaction.atomic():
+                    task = Task.objects.create(
+                        title=request.title,
+                        description=request.description,
+                        category=request.category,
+                        due_date=due_date,
+                        completed_at=completed_at,
+                        priority=request.priority,
+                        is_active=True,
+                        enrichment_status="pending",
+                    )
+                    TagServices.add_task_tags({task.id: tag_names})
+                    EnrichmentServices.enqueue(task)
+                return task
+
+            budget_ms = request.enrichment_budget_ms
+            if budget_ms is None:
+                budget_ms = getattr(settings, "AI_ENRICHMENT_BUDGET_MS", 0)
+            with span("enrichment"):
+                enriched: dict = enrich_task_within_budget(
+                    request.title,
+                    request.description,
+                    due_date,
+                    tags=",".join(tag_names),
+                    category=request.category,
+                    priority=request.priority,
+                    budget_ms=budget_ms,
+                )
+
+            with span("db_insert"), transaction.atomic():
+                task = Task.objects.create(
+                    title=request.title,
+                    description=request.description,
+                    category=enriched.get("category"),
+                    due_date=due_date,
+                    completed_at=completed_at,
+                    priority=enriched.get("priority"),
+                    is_active=True,
+                    enrichment_status="completed",
+                )
+                TagServices.add_task_tags(
+                    {task.id: TagServices.split_tag_string(enriched.get("tags"))}
+                )
+            with span("embedding"):
+                save_task_embedding(task)
+            # not persisted, reported in the /add response
+            task.enrichment_tiers = enriched.get("tiers")
+            return task
+        return None
+
+    def bulk_create(self, requests: List[AddTaskRequestType]) -> List[Task]:
+        """
+        Create already validated tasks with one batched enrichment pass
+        and a single bulk INSERT.
+        """
+        items = [
+            {
+                "title": request.title,
+                "description": request.description,
+                "due_date": convert_string_to_dateTime(request.due_date),
+                "completed_at": convert_string_to_dateTime(request.completed_at),
+                "tags": (
+                    ",".join(TagServices.normalize_tag_names(request.tags))
+                    if validate_list_input(request.tags)
+                    else ""
+                ),
+                "category": request.category,
+                "priority": request.priority,
+            }
+            for request in requests
+        ]
+
+        is_async = EnrichmentServices.is_async_enabled()
+        if not is_async:
+            with span("enrichment"):
+                for item, enriched in zip(items, enrich_tasks(items)):
+                    item.update(enriched)
+
+        tasks = [
+            Task(
+                title=item["title"],
+                description=item["description"],
+                category=item["category"],
+                due_date=item["due_date"],
+                completed_at=item["completed_at"],
+                priority=item["priority"],
                 is_active=True,
+                enrichment_status="pending" if is_async else "completed",
             )
-            return task
-        return None
\ No newline at end of file
+            for item in items
+        ]
+        with span("db_insert"), transaction.atomic():
+            tasks = Task.objects.bulk_create(tasks)
+            TagServices.add_task_tags(
+                {
+                    task.id: TagServices.split_tag_string(item["tags"])
+                    for task, item in zip(tasks, items)
+                }
+            )
+            if is_async:
+                EnrichmentServices.enqueue_many(tasks)
+
+        if not is_async:
+            try:
+                with span("embedding"):
+                    save_task_embeddings(tasks)
+            except Exception as e:
+                print(f"⚠️ Task embedding update failed: {e}")
+        return tasks
@@ -0,0 +1,80 @@
+import time
+from datetime import timedelta
+from typing import Callable, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from tasks.models.model.task_model import Task
+from tasks.services.log.logger import logger
+from tasks.services.read_cache import TaskReadCache
+
+# Archives completed tasks whose completed_at is older than
+# TASK_ARCHIVE_COMPLETED_AFTER_DAYS, so they leave the active working set.
+#
+# Each batch reads at most TASK_ARCHIVE_BATCH_SIZE ids (oldest first, outside any
+# transaction), then archives them with one UPDATE in its own short transaction.
+# The UPDATE repeats the conditions, so a task edited in between is left alone.
+# SQLite's write lock is held for one batch only, and `pause` seconds between
+# batches let the API's writes through.
+
+
+def get_archive_cutoff(older_than_days: Optional[float] = None):
+    if older_than_days is None:
+        older_than_days = getattr(settings, "TASK_ARCHIVE_COMPLETED_AFTER_DAYS", 30)
+    return timezone.now() - timedelta(days=older_than_days)
+
+
+def stale_completed_tasks(cutoff):
+    return Task.objects.filter(is_active=True, status="completed", completed_at__lt=cutoff)
+
+
+def archive_stale_completed_tasks(
+    older_than_days: Optional[float] = None,
+    batch_size: Optional[int] = None,
+    max_batches: Optional[int] = None,
+    pause: float = 0.0,
+    on_batch: Optional[Callable[[dict], None]] = None,
+) -> dict:
+    """
+    Run one sweep until no stale task is left (or `max_batches` ran).
+    `on_batch(progress)` is called after every batch with the running totals.
+    """
+    batch_size = batch_size or getattr(settings, "TASK_ARCHIVE_BATCH_SIZE", 500)
+    cutoff = get_archive_cutoff(older_than_days)
+    candidates = stale_completed_tasks(cutoff)
+    cache = TaskReadCache()
+
+    progress = {"batches": 0, "archived": 0, "seconds": 0.0, "rate": 0.0}
+    started = time.perf_counter()
+    while max_batches is None or progress["batches"] < max_batches:
+        ids = list(candidates.order_by("completed_at").values_list("id", flat=True)[:batch_size])
+        if not ids:
+            break
+
+        with transaction.atomic():
+            archived = candidates.filter(id__in=ids).update(
+                is_active=False, version=F("version") + 1, updated_at=timezone.now()
+            )
+            cache.invalidate_on_commit(ids)
+
+        progress["batches"] += 1
+        progress["archived"] += archived
+        progress["seconds"] = time.perf_counter() - started
+        progress["rate"] = progress["archived"] / progress["seconds"] if progress["seconds"] else 0.0
+        if on_batch is not None:
+            on_batch(dict(progress))
+        if len(ids) < batch_size:
+            break
+        if pause:
+            time.sleep(pause)
+
+    progress["seconds"] = time.perf_counter() - started
+    progress["rate"] = progress["archived"] / progress["seconds"] if progress["seconds"] else 0.0
+    logger.info(
+        f"Archived {progress['archived']} completed task(s) older than {cutoff:%Y-%m-%d %H:%M} "
+        f"in {progress['batches']} batch(es), {progress['seconds']:.1f}s"
+    )
+    return progress
@@ -9,3 +9,19 @@ PRIORITY_CHOICES = [
     ("medium", "Medium"),
     ("high", "High"),
 ]
+
+# order of `sort=priority`
+PRIORITY_RANK = {"low": 1, "medium": 2, "high": 3}
+
+ENRICHMENT_STATUS_CHOICES = [
+    ("pending", "Pending"),
+    ("processing", "Processing"),
+    ("completed", "Completed"),
+    ("failed", "Failed"),
+]
+
+ENRICHMENT_JOB_STATUS_CHOICES = [
+    ("queued", "Queued"),
+    ("running", "Running"),
+    ("failed", "Failed"),
+]
@@ -0,0 +1,73 @@
+import asyncio
+import functools
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+# Read/write split of the production database profile (DATABASE_PROFILE=production).
+#
+# The "read" alias is a second set of connections to the same SQLite file, opened
+# with `PRAGMA query_only`. Under WAL its readers never wait for the writer on
+# "default". Queries go to it only while a service marked @read_only_service (or a
+# read_only() block) runs, and only outside a transaction on "default", so a read
+# never misses the caller's own uncommitted writes.
+
+READ_DATABASE_ALIAS = "read"
+
+_read_only = ContextVar("read_only_service", default=False)
+
+
+@contextmanager
+def read_only():
+    """Route the ORM reads inside the block to the read database."""
+    token = _read_only.set(True)
+    try:
+        yield
+    finally:
+        _read_only.reset(token)
+
+
+def read_only_service(function):
+    """read_only() around every call of `function`, sync or async."""
+    if asyncio.iscoroutinefunction(function):
+
+        @functools.wraps(function)
+        async def _async_wrapper(*args, **kwargs):
+            with read_only():
+                return await function(*args, **kwargs)
+
+        return _async_wrapper
+
+    @functools.wraps(function)
+    def _wrapper(*args, **kwargs):
+        with read_only():
+            return function(*args, **kwargs)
+
+    return _wrapper
+
+
+def has_read_database() -> bool:
+    return READ_DATABASE_ALIAS in settings.DATABASES
+
+
+class ReadOnlyServiceRouter:
+    def db_for_read(self, model, **hints):
+        if (
+            _read_only.get()
+            and has_read_database()
+            and not connections[DEFAULT_DB_ALIAS].in_atomic_block
+        ):
+            return READ_DATABASE_ALIAS
+        return None
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # both aliases are the same database file
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db != READ_DATABASE_ALIAS
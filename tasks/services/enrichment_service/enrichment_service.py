@@ -0,0 +1,205 @@
+import os
+import socket
+import threading
+from datetime import timedelta
+from typing import Iterable, List, Optional
+
+from django.conf import settings
+from django.db import close_old_connections, connections, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from ai_module.ai_services.task_embedding_store import save_task_embedding
+from ai_module.ai_services.task_enrichment import enrich_task
+from tasks.models.model.enrichment_job_model import EnrichmentJob
+from tasks.models.model.tag_model import TaskTag
+from tasks.models.model.task_model import Task
+from tasks.services.log.logger import logger
+from tasks.services.read_cache import TaskReadCache
+from tasks.services.tag_service.tag_service import TagServices
+
+MAX_ATTEMPTS = 3
+RETRY_BACKOFF_SECONDS = 10
+# a `running` job whose worker has not finished it within the lease is handed out again
+LEASE_SECONDS = 300
+CLAIM_CANDIDATES = 10
+
+
+class EnrichmentServices:
+    @staticmethod
+    def is_async_enabled() -> bool:
+        return getattr(settings, "AI_ENRICHMENT_MODE", "sync") == "async"
+
+    @staticmethod
+    def enqueue(task: Task) -> EnrichmentJob:
+        return EnrichmentJob.objects.create(task=task)
+
+    @staticmethod
+    def enqueue_many(tasks: Iterable[Task]) -> List[EnrichmentJob]:
+        return EnrichmentJob.objects.bulk_create(
+            [EnrichmentJob(task=task) for task in tasks]
+        )
+
+    @staticmethod
+    def requeue_stale_jobs(lease_seconds: int = LEASE_SECONDS) -> int:
+        """Give jobs left `running` by a crashed or restarted worker back to the queue."""
+        expired = timezone.now() - timedelta(seconds=lease_seconds)
+        count = EnrichmentJob.objects.filter(
+            status="running", locked_at__lt=expired
+        ).update(status="queued", locked_at=None, locked_by=None)
+        if count:
+            logger.info(f"Re-queued {count} stale enrichment job(s)")
+        return count
+
+    @staticmethod
+    def claim_next_job(worker_id: str) -> Optional[EnrichmentJob]:
+        """
+        Atomically move the oldest available job to `running`. The conditional
+        UPDATE makes the claim safe across threads and worker processes.
+        """
+        now = timezone.now()
+        candidate_ids = list(
+            EnrichmentJob.objects.filter(status="queued", available_at__lte=now)
+            .order_by("available_at")
+            .values_list("id", flat=True)[:CLAIM_CANDIDATES]
+        )
+        for job_id in candidate_ids:
+            claimed = EnrichmentJob.objects.filter(id=job_id, status="queued").update(
+                status="running",
+                locked_at=now,
+                locked_by=worker_id,
+                attempts=F("attempts") + 1,
+            )
+            if claimed:
+                return EnrichmentJob.objects.select_related("task").get(id=job_id)
+        return None
+
+    @staticmethod
+    def process_job(job: EnrichmentJob) -> None:
+        task: Task = job.task
+        try:
+            # updated_at is the /read cache version, every change of the payload moves it
+            Task.objects.filter(id=task.id).update(
+                enrichment_status="processing", updated_at=timezone.now()
+            )
+            due_date = timezone.make_naive(task.due_date) if task.due_date else None
+            enriched: dict = enrich_task(
+                task.title,
+                task.description,
+                due_date,
+                tags=",".join(task.tags.values_list("name", flat=True)),
+                category=task.category,
+                priority=task.priority,
+            )
+            EnrichmentServices._save_enrichment(job, enriched)
+        except Exception as e:
+            # the job goes back to the queue (or fails) instead of waiting out its lease
+            EnrichmentServices._fail_job(job, e)
+            return
+
+        # never raises: the enrichment is committed, a failed embedding is recomputed on the next write
+        save_task_embedding(task)
+
+    @staticmethod
+    def _save_enrichment(job: EnrichmentJob, enriched: dict) -> None:
+        task_id = job.task_id
+        with transaction.atomic():
+            # only fill fields that are still empty, a user edit in the meantime wins
+            for field in ("category", "priority"):
+                Task.objects.filter(
+                    Q(**{f"{field}__isnull": True}) | Q(**{field: ""}), id=task_id
+                ).update(**{field: enriched.get(field)})
+            if not TaskTag.objects.filter(task_id=task_id).exists():
+                TagServices.add_task_tags(
+                    {task_id: TagServices.split_tag_string(enriched.get("tags"))}
+                )
+            # filled-in fields are a new version: an edit based on the pending task is rejected
+            Task.objects.filter(id=task_id).update(
+                enrichment_status="completed",
+                version=F("version") + 1,
+                updated_at=timezone.now(),
+            )
+            TaskReadCache().invalidate_on_commit([task_id])
+            job.delete()
+
+    @staticmethod
+    def _fail_job(job: EnrichmentJob, error: Exception) -> None:
+        logger.error(f"Enrichment of task {job.task_id} failed (attempt {job.attempts}): {error}")
+        if job.attempts < MAX_ATTEMPTS:
+            EnrichmentJob.objects.filter(id=job.id).update(
+                status="queued",
+                locked_at=None,
+                locked_by=None,
+                last_error=str(error),
+                available_at=timezone.now()
+                + timedelta(seconds=RETRY_BACKOFF_SECONDS * 2 ** (job.attempts - 1)),
+            )
+            Task.objects.filter(id=job.task_id).update(
+                enrichment_status="pending", updated_at=timezone.now()
+            )
+        else:
+            EnrichmentJob.objects.filter(id=job.id).update(
+                status="failed", last_error=str(error)
+            )
+            Task.objects.filter(id=job.task_id).update(
+                enrichment_status="failed", updated_at=timezone.now()
+            )
+
+    @staticmethod
+    def run_worker(
+        worker_id: str,
+        stop_event: threading.Event,
+        poll_interval: float = 1.0,
+        drain: bool = False,
+    ) -> int:
+        """Process jobs until `stop_event` is set (or the queue is empty when `drain`)."""
+        processed = 0
+        try:
+            while not stop_event.is_set():
+                close_old_connections()
+                job = EnrichmentServices.claim_next_job(worker_id)
+                if job is None:
+                    if drain:
+                        break
+                    EnrichmentServices.requeue_stale_jobs()
+                    stop_event.wait(poll_interval)
+                    continue
+                EnrichmentServices.process_job(job)
+                processed += 1
+        finally:
+            connections.close_all()
+        return processed
+
+    @staticmethod
+    def run_worker_pool(
+        workers: int = 1,
+        poll_interval: float = 1.0,
+        drain: bool = False,
+        stop_event: Optional[threading.Event] = None,
+    ) -> int:
+        stop_event = stop_event or threading.Event()
+        EnrichmentServices.requeue_stale_jobs()
+
+        prefix = f"{socket.gethostname()}:{os.getpid()}"
+        results = [0] * workers
+
+        def _run(index: int):
+            results[index] = EnrichmentServices.run_worker(
+                f"{prefix}:{index}", stop_event, poll_interval, drain
+            )
+
+        threads = [
+            threading.Thread(target=_run, args=(index,), name=f"enrichment-worker-{index}", daemon=True)
+            for index in range(workers)
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            for thread in threads:
+                while thread.is_alive():
+                    thread.join(timeout=0.5)
+        except KeyboardInterrupt:
+            stop_event.set()
+            for thread in threads:
+                thread.join()
+        return sum(results)
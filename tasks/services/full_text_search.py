@@ -0,0 +1,148 @@
+import re
+from typing import Optional
+
+from django.db import connection
+
+from tasks.services.log.logger import logger
+
+# FTS5 index over Task.title, Task.description and the names of the task's tags.
+# Rows are keyed by the implicit `rowid` of tasks_task and kept in sync by triggers.
+FTS_TABLE = "tasks_task_fts"
+
+# bm25() column weights: title, description, tags
+BM25_WEIGHTS = (3.0, 1.0, 2.0)
+# lower is better
+RANK_SQL = f"bm25({FTS_TABLE}, {', '.join(str(weight) for weight in BM25_WEIGHTS)})"
+
+# space separated tag names of the task with id `{task_id}`
+TAG_TEXT_SQL = """
+    coalesce((
+        SELECT group_concat(tasks_tag.name, ' ')
+        FROM tasks_tasktag JOIN tasks_tag ON tasks_tag.id = tasks_tasktag.tag_id
+        WHERE tasks_tasktag.task_id = {task_id}
+    ), '')
+"""
+
+FTS_TRIGGERS = {
+    "tasks_task_fts_insert": f"""
+        CREATE TRIGGER tasks_task_fts_insert AFTER INSERT ON tasks_task BEGIN
+            INSERT INTO {FTS_TABLE}(rowid, title, description, tags)
+            VALUES (new.rowid, new.title, new.description, '');
+        END
+    """,
+    "tasks_task_fts_update": f"""
+        CREATE TRIGGER tasks_task_fts_update AFTER UPDATE OF title, description ON tasks_task
+        WHEN old.title IS NOT new.title OR old.description IS NOT new.description
+        BEGIN
+            UPDATE {FTS_TABLE} SET title = new.title, description = new.description
+            WHERE rowid = new.rowid;
+        END
+    """,
+    "tasks_task_fts_delete": f"""
+        CREATE TRIGGER tasks_task_fts_delete AFTER DELETE ON tasks_task BEGIN
+            DELETE FROM {FTS_TABLE} WHERE rowid = old.rowid;
+        END
+    """,
+    "tasks_tasktag_fts_insert": f"""
+        CREATE TRIGGER tasks_tasktag_fts_insert AFTER INSERT ON tasks_tasktag BEGIN
+            UPDATE {FTS_TABLE} SET tags = {TAG_TEXT_SQL.format(task_id="new.task_id")}
+            WHERE rowid = (SELECT rowid FROM tasks_task WHERE id = new.task_id);
+        END
+    """,
+    "tasks_tasktag_fts_delete": f"""
+        CREATE TRIGGER tasks_tasktag_fts_delete AFTER DELETE ON tasks_tasktag BEGIN
+            UPDATE {FTS_TABLE} SET tags = {TAG_TEXT_SQL.format(task_id="old.task_id")}
+            WHERE rowid = (SELECT rowid FROM tasks_task WHERE id = old.task_id);
+        END
+    """,
+}
+
+# tables the index and its triggers depend on
+FTS_SOURCE_TABLES = (FTS_TABLE, "tasks_task", "tasks_tag", "tasks_tasktag")
+
+
+def is_full_text_supported(conn=connection) -> bool:
+    return conn.vendor == "sqlite"
+
+
+def install_full_text_triggers(conn=connection) -> None:
+    """
+    (Re)create the sync triggers. SQLite drops triggers whenever a migration
+    rebuilds tasks_task, and the rebuild may renumber rowids, so if any trigger
+    was missing the index is rebuilt from scratch.
+    """
+    if not is_full_text_supported(conn):
+        return
+    with conn.cursor() as cursor:
+        if not set(FTS_SOURCE_TABLES) <= set(conn.introspection.table_names(cursor)):
+            for name in FTS_TRIGGERS:
+                cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+            return
+        cursor.execute(
+            "SELECT count(*) FROM sqlite_master WHERE type = 'trigger' AND name IN (%s)"
+            % ", ".join(["%s"] * len(FTS_TRIGGERS)),
+            list(FTS_TRIGGERS),
+        )
+        triggers_intact = cursor.fetchone()[0] == len(FTS_TRIGGERS)
+        for name, sql in FTS_TRIGGERS.items():
+            cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+            cursor.execute(sql)
+    if not triggers_intact:
+        rebuild_full_text_index(conn)
+
+
+def rebuild_full_text_index(conn=connection) -> None:
+    if not is_full_text_supported(conn):
+        return
+    with conn.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE}")
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE}(rowid, title, description, tags) "
+            f"SELECT rowid, title, description, {TAG_TEXT_SQL.format(task_id='tasks_task.id')} "
+            "FROM tasks_task"
+        )
+        cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('optimize')")
+    logger.info(f"Full-text index `{FTS_TABLE}` rebuilt")
+
+
+def build_match_query(text: str) -> Optional[str]:
+    """
+    Turn free text into a safe FTS5 MATCH expression: every word becomes a quoted
+    prefix term and all terms must match. Returns None if there is nothing to match.
+    """
+    terms = re.findall(r"\w+", text or "")
+    if not terms:
+        return None
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def filter_by_full_text(queryset, text: str):
+    """Restrict `queryset` to tasks matching `text`, best BM25 rank first."""
+    if not is_full_text_supported():
+        raise ValueError("full-text search is not available on this database")
+
+    match_query = build_match_query(text)
+    if match_query is None:
+        return queryset.none()
+
+    table = queryset.model._meta.db_table
+    return queryset.extra(
+        select={"search_rank": RANK_SQL},
+        tables=[FTS_TABLE],
+        where=[f"{FTS_TABLE}.rowid = {table}.rowid", f"{FTS_TABLE} MATCH %s"],
+        params=[match_query],
+        order_by=["search_rank"],
+    )
+
+
+def filter_by_rank_after(queryset, rank: float, task_id):
+    """
+    Keyset condition for paging a filter_by_full_text() queryset: only rows that
+    sort after (`rank`, `task_id`) in (search_rank, id) order.
+    """
+    table = queryset.model._meta.db_table
+    task_id = str(task_id).replace("-", "")
+    return queryset.extra(
+        where=[f"({RANK_SQL} > %s OR ({RANK_SQL} = %s AND {table}.id > %s))"],
+        params=[rank, rank, task_id],
+    )
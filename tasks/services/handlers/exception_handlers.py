@@ -1,4 +1,3 @@
-import logging
 from sqlite3 import DatabaseError
 
 import django
@@ -6,10 +5,17 @@ from rest_framework import status, serializers
 from pydantic import ValidationError
 from rest_framework.response import Response
 
+from tasks.services.log.logger import logger
+from tasks.services.metrics import EXCEPTIONS
+
+
+class TaskVersionConflict(Exception):
+    """An edit was based on an older version of the task than the stored one."""
+
 
 class ExceptionHandler:
     @staticmethod
-    def get_handlers(self) -> dict:
+    def get_handlers() -> dict:
         return {
             DatabaseError: {
                 "message": "DatabaseError: Error Occured While Fetching details from database",
@@ -19,6 +25,10 @@ class ExceptionHandler:
                 "message": "PydanticValidationError: Error Occured while converting to Pydantic object",
                 "status": status.HTTP_400_BAD_REQUEST,
             },
+            TaskVersionConflict: {
+                "message": "ConflictError",
+                "status": status.HTTP_409_CONFLICT,
+            },
             NotImplementedError: {
                 "message": "NotImplementedError",
                 "status": status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -41,7 +51,8 @@ class ExceptionHandler:
         handlers = self.get_handlers()
         for exc_type, handler in handlers.items():
             if isinstance(e, exc_type):
-                logging.error(
+                EXCEPTIONS.inc(category=handler["message"].split(":")[0])
+                logger.error(
                     f"{handler['message']}: {e.msg}"
                     if hasattr(e, "msg")
                     else f"{handler['message']}: {str(e)}"
@@ -60,5 +71,6 @@ class ExceptionHandler:
                     content_type="application/json",
                 )
         else:
-            logging.error(f"InternalServerError: {e}")
+            EXCEPTIONS.inc(category="InternalServerError")
+            logger.error(f"InternalServerError: {e}", exc_info=e)
             raise e
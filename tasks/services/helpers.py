@@ -1,6 +1,9 @@
 # write a method to validate a field is empty or not, return boolean
 from typing import Tuple
 
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
 
 def validate_not_empty(input_value):
     if input_value is None:
@@ -89,3 +92,11 @@ def suggest_closest(value: str, choices: Tuple):
     valid_values = [choice[0] for choice in choices]
     matches = difflib.get_close_matches(value, valid_values)
     return matches[0] if matches else None
+
+
+def get_setting(name, default):
+    # the logger and the metrics read their settings before (or without) Django being configured
+    try:
+        return getattr(settings, name, default)
+    except ImproperlyConfigured:
+        return default
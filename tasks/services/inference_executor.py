@@ -0,0 +1,46 @@
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections
+
+# Bounded thread pool for the CPU-bound, model-backed work of the async views
+# (/add enrichment, embeddings). The event loop keeps serving /read and /search
+# while at most ASYNC_INFERENCE_WORKERS requests are busy in inference; further
+# ones wait in the pool's queue without holding a thread.
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_inference_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=getattr(settings, "ASYNC_INFERENCE_WORKERS", 2),
+                    thread_name_prefix="async-inference",
+                )
+    return _executor
+
+
+def _run_job(function, args, kwargs):
+    try:
+        return function(*args, **kwargs)
+    finally:
+        # the pool threads have their own DB connections, closed like a request's
+        close_old_connections()
+
+
+async def run_inference(function, *args, **kwargs):
+    """Await `function(*args, **kwargs)` run on the inference pool."""
+    loop = asyncio.get_running_loop()
+    # run_in_executor does not carry context variables over (read routing, timing spans)
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(
+        get_inference_executor(), functools.partial(context.run, _run_job, function, args, kwargs)
+    )
@@ -1,38 +1,140 @@
+import atexit
+import copy
+import json
 import logging
 import os
+import queue
+from logging.handlers import (
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+    TimedRotatingFileHandler,
+    WatchedFileHandler,
+)
 
-# Create a logs directory if it doesn't exist
-LOG_DIR = "logs"
-if not os.path.exists(LOG_DIR):
-    os.makedirs(LOG_DIR)
+from tasks.services.helpers import get_setting
 
-# Define log file paths
-INFO_LOG_FILE = os.path.join(LOG_DIR, "info.log")
-ERROR_LOG_FILE = os.path.join(LOG_DIR, "error.log")
+# Project logger ("project_logger").
+#
+# Callers only put records on an in-memory queue; one listener thread formats them
+# and writes logs/info.log, logs/error.log and the console. A slow disk never
+# blocks a request. LOG_FORMAT=json writes one JSON object per line, including the
+# fields passed in `extra=`.
+#
+# Several worker processes append to the same files, so by default no process
+# rotates them: a WatchedFileHandler reopens a file once logrotate has moved it.
+# A single process may rotate them itself by size (LOG_MAX_BYTES) or, with
+# LOG_ROTATE_WHEN set ("midnight", "H", ...), by time, keeping LOG_BACKUP_COUNT old
+# files. A forked child (gunicorn --preload) always falls back to the watched
+# files: processes rotating the same file rename it under each other.
 
-# Create handlers
-info_handler = logging.FileHandler(INFO_LOG_FILE)
-info_handler.setLevel(logging.INFO)
+TEXT_FORMAT = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
-error_handler = logging.FileHandler(ERROR_LOG_FILE)
-error_handler.setLevel(logging.ERROR)
+# attributes every LogRecord has; anything else on a record came in through `extra=`
+_RECORD_ATTRIBUTES = frozenset(
+    vars(logging.LogRecord("", 0, "", 0, "", (), None)).keys() | {"message", "asctime", "taskName"}
+)
 
-console_handler = logging.StreamHandler()
-console_handler.setLevel(logging.DEBUG)
 
-# Define format
-formatter = logging.Formatter(
-    "%(asctime)s | %(levelname)s | %(name)s | %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
-)
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            "time": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        entry.update(
+            (key, value) for key, value in vars(record).items() if key not in _RECORD_ATTRIBUTES
+        )
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class _EnqueueHandler(QueueHandler):
+    def prepare(self, record):
+        # only freeze the message; formatting is the listener thread's job
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def _rotation_configured() -> bool:
+    return bool(get_setting("LOG_ROTATE_WHEN", "") or get_setting("LOG_MAX_BYTES", 0))
+
+
+def _file_handler(path, level, rotate):
+    backup_count = get_setting("LOG_BACKUP_COUNT", 5)
+    when = get_setting("LOG_ROTATE_WHEN", "")
+    max_bytes = get_setting("LOG_MAX_BYTES", 0)
+    if rotate and when:
+        handler = TimedRotatingFileHandler(path, when=when, backupCount=backup_count, delay=True)
+    elif rotate and max_bytes:
+        handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count, delay=True)
+    else:
+        handler = WatchedFileHandler(path, delay=True)
+    handler.setLevel(level)
+    return handler
+
+
+def _build_handlers(rotate=True):
+    log_dir = get_setting("LOG_DIR", "logs")
+    os.makedirs(log_dir, exist_ok=True)
+
+    info_handler = _file_handler(os.path.join(log_dir, "info.log"), logging.INFO, rotate)
+    error_handler = _file_handler(os.path.join(log_dir, "error.log"), logging.ERROR, rotate)
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(logging.DEBUG)
+
+    if get_setting("LOG_FORMAT", "text") == "json":
+        formatter = JsonFormatter(datefmt=DATE_FORMAT)
+    else:
+        formatter = logging.Formatter(TEXT_FORMAT, datefmt=DATE_FORMAT)
+    for handler in (info_handler, error_handler, console_handler):
+        handler.setFormatter(formatter)
+    return info_handler, error_handler, console_handler
+
+
+_queue = queue.SimpleQueue()
+_handlers = _build_handlers()
+_listener = QueueListener(_queue, *_handlers, respect_handler_level=True)
+_listener.start()
+
+
+def stop_logging():
+    """Write out the queued records and stop the listener thread (also run at exit)."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def _restart_listener():
+    # a forked worker (gunicorn --preload) inherits the queue but not the listener
+    # thread, and shares the files with its siblings: it must not rotate them
+    global _listener, _handlers
+    if _rotation_configured():
+        for handler in _handlers:
+            handler.close()  # this process's copies of the parent's file descriptors
+        _handlers = _build_handlers(rotate=False)
+    _listener = QueueListener(_queue, *_handlers, respect_handler_level=True)
+    _listener.start()
+    if _rotation_configured():
+        logger.warning(
+            "LOG_MAX_BYTES / LOG_ROTATE_WHEN are ignored in forked worker %s; rotate the logs with logrotate",
+            os.getpid(),
+        )
+
 
-# Attach formatters
-info_handler.setFormatter(formatter)
-error_handler.setFormatter(formatter)
-console_handler.setFormatter(formatter)
+atexit.register(stop_logging)
+os.register_at_fork(after_in_child=_restart_listener)
 
 # Get logger
 logger = logging.getLogger("project_logger")
 logger.setLevel(logging.DEBUG)  # capture everything
-logger.addHandler(info_handler)
-logger.addHandler(error_handler)
-logger.addHandler(console_handler)
+logger.addHandler(_EnqueueHandler(_queue))
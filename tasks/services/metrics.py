@@ -0,0 +1,498 @@
+import atexit
+import bisect
+import glob
+import json
+import os
+import tempfile
+import threading
+import time
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Optional, Tuple
+
+from tasks.services.helpers import get_setting
+from tasks.services.log.logger import logger
+
+# In-process Prometheus metrics, served in the text exposition format at /metrics
+# (METRICS_ENABLED).
+#
+# Counters, gauges and histograms live in a process-wide MetricsRegistry and are
+# updated in place (one lock per metric, no I/O). Statistics the services already
+# keep (micro-batchers, enrichment tiers, caches, the model server) are copied in
+# by collectors when /metrics is rendered.
+#
+# Several worker processes: set METRICS_MULTIPROC_DIR to a directory shared by them
+# and emptied on every deploy. Each process writes its values to metrics-<pid>.json
+# there every METRICS_FLUSH_INTERVAL seconds; /metrics adds up the counters and
+# histograms of every file (exited workers included, so totals never go down) and
+# lists the gauges of the running processes with a `pid` label.
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 500)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+SNAPSHOT_PATTERN = "metrics-*.json"
+
+
+def is_metrics_enabled() -> bool:
+    return get_setting("METRICS_ENABLED", True)
+
+
+def get_multiproc_dir() -> str:
+    return get_setting("METRICS_MULTIPROC_DIR", "")
+
+
+# =============================================================================
+# METRIC TYPES
+# =============================================================================
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (), per_process=True):
+        """`per_process=False`: one value for the whole deployment (read from a shared service), never summed."""
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.per_process = per_process
+        self._values = {}
+        self._lock = threading.Lock()
+        MetricsRegistry().register(self)
+
+    def _key(self, labels: dict) -> tuple:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def values(self) -> dict:
+        with self._lock:
+            return {key: self._copy(value) for key, value in self._values.items()}
+
+    @staticmethod
+    def _copy(value):
+        return value
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def set_total(self, value: float, **labels):
+        """For collectors: copy a total that is counted elsewhere."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(float(bucket) for bucket in buckets)
+        super().__init__(name, documentation, labelnames)
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # [count per bucket (the last one is +Inf), sum, count]
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    @staticmethod
+    def _copy(value):
+        return [list(value[0]), value[1], value[2]]
+
+
+# =============================================================================
+# REGISTRY
+# =============================================================================
+class MetricsRegistry:
+    """Process-wide registry of every metric (singleton); see module comment."""
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    instance = super(MetricsRegistry, cls).__new__(cls)
+                    instance._metrics = {}
+                    instance._collectors = []
+                    instance._flusher_pid = None
+                    cls._instance = instance
+        return cls._instance
+
+    def register(self, metric: _Metric):
+        self._metrics[metric.name] = metric
+
+    def add_collector(self, collector: Callable[[], None], per_process=True):
+        """
+        `collector()` updates metrics in place before they are read. Per-process
+        collectors run before every render and snapshot, the others (shared
+        services) only when /metrics is rendered.
+        """
+        self._collectors.append((collector, per_process))
+
+    def collect(self, per_process: bool):
+        for collector, collector_per_process in self._collectors:
+            if collector_per_process != per_process:
+                continue
+            try:
+                collector()
+            except Exception as e:
+                logger.warning(f"Metrics collector {collector.__name__} failed: {e}")
+
+    # -------------------------------------------------------------------------
+    # multi-process mode
+    # -------------------------------------------------------------------------
+    def snapshot(self) -> dict:
+        self.collect(per_process=True)
+        return {
+            name: [[list(key), value] for key, value in metric.values().items()]
+            for name, metric in self._metrics.items()
+            if metric.per_process
+        }
+
+    def flush(self):
+        """Write this process's values to METRICS_MULTIPROC_DIR (atomically)."""
+        directory = get_multiproc_dir()
+        if not directory:
+            return
+        os.makedirs(directory, exist_ok=True)
+        document = json.dumps({"pid": os.getpid(), "metrics": self.snapshot()})
+        handle, temporary = tempfile.mkstemp(dir=directory, prefix=".metrics-", suffix=".tmp")
+        with os.fdopen(handle, "w") as file:
+            file.write(document)
+        os.replace(temporary, os.path.join(directory, f"metrics-{os.getpid()}.json"))
+
+    def ensure_flusher(self):
+        """Start the periodic flush thread of this process (again after a fork)."""
+        if not get_multiproc_dir() or self._flusher_pid == os.getpid():
+            return
+        with self._instance_lock:
+            if self._flusher_pid == os.getpid():
+                return
+            self._flusher_pid = os.getpid()
+        threading.Thread(target=self._flush_periodically, name="metrics-flush", daemon=True).start()
+
+    def _flush_periodically(self):
+        pid = os.getpid()
+        while self._flusher_pid == pid:
+            time.sleep(get_setting("METRICS_FLUSH_INTERVAL", 5.0))
+            try:
+                self.flush()
+            except Exception as e:
+                logger.warning(f"Metrics flush failed: {e}")
+
+    def _load_snapshots(self) -> List[dict]:
+        snapshots = []
+        for path in glob.glob(os.path.join(get_multiproc_dir(), SNAPSHOT_PATTERN)):
+            try:
+                with open(path) as file:
+                    snapshots.append(json.load(file))
+            except (OSError, ValueError):
+                continue  # removed or replaced meanwhile
+        return snapshots
+
+    # -------------------------------------------------------------------------
+    # exposition
+    # -------------------------------------------------------------------------
+    def render(self) -> str:
+        if get_multiproc_dir():
+            self.flush()
+            values = _merge(self._metrics, self._load_snapshots())
+        else:
+            self.collect(per_process=True)
+            values = {name: metric.values() for name, metric in self._metrics.items()}
+        self.collect(per_process=False)
+        for name, metric in self._metrics.items():
+            if not metric.per_process:
+                values[name] = metric.values()
+
+        lines = []
+        for name, metric in sorted(self._metrics.items()):
+            samples = values.get(name) or {}
+            if not samples:
+                continue
+            labelnames = metric.labelnames
+            if metric.kind == "gauge" and metric.per_process and get_multiproc_dir():
+                labelnames += ("pid",)
+            lines.append(f"# HELP {name} {_escape(metric.documentation, help_text=True)}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            for key, value in sorted(samples.items()):
+                labels = list(zip(labelnames, key))
+                if metric.kind == "histogram":
+                    cumulative = 0
+                    for bound, count in zip(metric.buckets + (float("inf"),), value[0]):
+                        cumulative += count
+                        lines.append(_sample(f"{name}_bucket", labels + [("le", _number(bound))], cumulative))
+                    lines.append(_sample(f"{name}_sum", labels, value[1]))
+                    lines.append(_sample(f"{name}_count", labels, value[2]))
+                else:
+                    lines.append(_sample(name, labels, value))
+        return "\n".join(lines) + "\n"
+
+
+def _merge(metrics: Dict[str, _Metric], snapshots: List[dict]) -> dict:
+    merged = {name: {} for name in metrics}
+    for snapshot in snapshots:
+        pid = snapshot.get("pid")
+        alive = _is_alive(pid)
+        for name, samples in snapshot.get("metrics", {}).items():
+            metric = metrics.get(name)
+            if metric is None:
+                continue
+            for key, value in samples:
+                key = tuple(key)
+                if metric.kind == "gauge":
+                    if alive:
+                        merged[name][key + (str(pid),)] = value
+                elif metric.kind == "histogram":
+                    total = merged[name].setdefault(key, [[0] * len(value[0]), 0.0, 0])
+                    if len(total[0]) != len(value[0]):
+                        continue  # written with other buckets
+                    total[0] = [a + b for a, b in zip(total[0], value[0])]
+                    total[1] += value[1]
+                    total[2] += value[2]
+                else:
+                    merged[name][key] = merged[name].get(key, 0.0) + value
+    return merged
+
+
+def _is_alive(pid) -> bool:
+    try:
+        os.kill(int(pid), 0)
+    except (TypeError, ValueError, ProcessLookupError):
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _escape(value: str, help_text=False) -> str:
+    value = value.replace("\\", "\\\\").replace("\n", "\\n")
+    return value if help_text else value.replace('"', '\\"')
+
+
+def _number(value) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _sample(name: str, labels: list, value) -> str:
+    if labels:
+        rendered = ",".join(f'{label}="{_escape(str(label_value))}"' for label, label_value in labels)
+        return f"{name}{{{rendered}}} {_number(value)}"
+    return f"{name} {_number(value)}"
+
+
+# =============================================================================
+# METRICS
+# =============================================================================
+HTTP_REQUESTS = Counter(
+    "http_requests_total", "Requests by route, method and status code.", ("route", "method", "status")
+)
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds", "Request latency by route and method.", ("route", "method")
+)
+DB_QUERIES_PER_REQUEST = Histogram(
+    "http_request_db_queries", "Database queries per request, by route.", ("route",), buckets=QUERY_COUNT_BUCKETS
+)
+EXCEPTIONS = Counter(
+    "exceptions_total", "Exceptions handled by ExceptionHandler, by category.", ("category",)
+)
+
+INFERENCE_SECONDS = Histogram(
+    "model_inference_seconds", "Duration of one model call (a batch of inputs), by model.", ("model",)
+)
+INFERENCE_BATCH_SIZE = Histogram(
+    "model_inference_batch_size", "Inputs per model call, by model.", ("model",), buckets=BATCH_SIZE_BUCKETS
+)
+MODEL_LOAD_SECONDS = Gauge("model_load_seconds", "Time it took to load the model in this process.", ("model",))
+MODEL_LOADED = Gauge("model_loaded", "1 when the model is loaded in this process (or its server proxy is).", ("model",))
+PROCESS_RESIDENT_MEMORY = Gauge("process_resident_memory_bytes", "Resident memory of the process.")
+
+MICRO_BATCH_INPUTS = Counter("micro_batch_inputs_total", "Inputs submitted to the micro-batcher.", ("batcher",))
+MICRO_BATCHES = Counter("micro_batches_total", "Batches run by the micro-batcher.", ("batcher",))
+MICRO_BATCH_FAILURES = Counter("micro_batch_failures_total", "Batches that raised.", ("batcher",))
+MICRO_BATCH_QUEUE_DEPTH = Gauge("micro_batch_queue_depth", "Inputs waiting for the next batch.", ("batcher",))
+
+ENRICHMENT_TIER_LATENCY = Gauge(
+    "enrichment_tier_latency_seconds", "Smoothed latency of the enrichment model tier.", ("tier",)
+)
+ENRICHMENT_TIER_OPEN = Gauge(
+    "enrichment_tier_circuit_open", "1 while the tier's circuit breaker is open.", ("tier",)
+)
+
+AI_CACHE_LOOKUPS = Counter("ai_cache_lookups_total", "AI result cache lookups by result.", ("result",))
+AI_CACHE_EVICTIONS = Counter("ai_cache_evictions_total", "Entries evicted from the AI result cache table.")
+AI_CACHE_ENTRIES = Gauge("ai_cache_memory_entries", "Entries in the in-process AI result cache.")
+READ_CACHE_LOOKUPS = Counter("read_cache_lookups_total", "/read cache lookups by result.", ("result",))
+READ_CACHE_ENTRIES = Gauge("read_cache_memory_entries", "Entries in the in-process /read cache.")
+
+MODEL_SERVER_UP = Gauge("model_server_up", "1 when the model server answered.", per_process=False)
+MODEL_SERVER_MEMORY = Gauge(
+    "model_server_resident_memory_bytes", "Resident memory of the model server process.", per_process=False
+)
+MODEL_SERVER_LOAD_SECONDS = Gauge(
+    "model_server_model_load_seconds", "Time it took the model server to load the model.", ("model",),
+    per_process=False,
+)
+MODEL_SERVER_CALLS = Counter(
+    "model_server_calls_total", "Calls served by the model server.", ("model",), per_process=False
+)
+MODEL_SERVER_ERRORS = Counter(
+    "model_server_call_errors_total", "Calls the model server failed.", ("model",), per_process=False
+)
+MODEL_SERVER_SECONDS = Counter(
+    "model_server_call_seconds_total", "Time the model server spent in calls.", ("model",), per_process=False
+)
+
+
+class _InferenceTimer:
+    __slots__ = ("model", "batch_size", "started")
+
+    def __init__(self, model: str, batch_size: int):
+        self.model = model
+        self.batch_size = batch_size
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        INFERENCE_SECONDS.observe(time.perf_counter() - self.started, model=self.model)
+        INFERENCE_BATCH_SIZE.observe(self.batch_size, model=self.model)
+        return False
+
+
+def track_inference(model: str, batch_size: int = 1) -> _InferenceTimer:
+    """`with track_inference(CLASSIFIER, len(texts)): ...` around one model call."""
+    return _InferenceTimer(model, batch_size)
+
+
+# =============================================================================
+# DB QUERY COUNTING
+# =============================================================================
+_query_count: ContextVar[Optional[list]] = ContextVar("db_query_count", default=None)
+
+
+def _count_query(execute, sql, params, many, context):
+    counter = _query_count.get()
+    if counter is not None:
+        counter[0] += 1
+    return execute(sql, params, many, context)
+
+
+def install_query_counter(sender, connection, **kwargs):
+    """connection_created receiver: count the queries of every connection (any alias, any thread)."""
+    if _count_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_count_query)
+
+
+def start_query_count():
+    return _query_count.set([0])
+
+
+def stop_query_count(token) -> int:
+    counter = _query_count.get()
+    _query_count.reset(token)
+    return counter[0] if counter else 0
+
+
+# =============================================================================
+# COLLECTORS
+# =============================================================================
+def _collect_process():
+    from ai_module.ai_services.model_registry import DEFAULT_LOADERS, ModelRegistry
+    from ai_module.ai_services.model_server import resident_memory_bytes
+
+    PROCESS_RESIDENT_MEMORY.set(resident_memory_bytes())
+    registry = ModelRegistry()
+    for name in DEFAULT_LOADERS:
+        MODEL_LOADED.set(1 if registry.is_loaded(name) and registry.get_model(name) is not None else 0, model=name)
+
+
+def _collect_inference():
+    from ai_module.ai_services.enrichment_tiers import EMBEDDING_TIER, SPACY_TIER, TRANSFORMER_TIER
+    from ai_module.ai_services.micro_batcher import micro_batcher_stats
+
+    for name, stats in micro_batcher_stats().items():
+        MICRO_BATCH_INPUTS.set_total(stats["submitted"], batcher=name)
+        MICRO_BATCHES.set_total(stats["batches"], batcher=name)
+        MICRO_BATCH_FAILURES.set_total(stats["failed_batches"], batcher=name)
+        MICRO_BATCH_QUEUE_DEPTH.set(stats["queue_depth"], batcher=name)
+    for tier in (SPACY_TIER, TRANSFORMER_TIER, EMBEDDING_TIER):
+        stats = tier.stats()
+        if stats["latency_ms"] is not None:
+            ENRICHMENT_TIER_LATENCY.set(stats["latency_ms"] / 1000, tier=tier.name)
+        ENRICHMENT_TIER_OPEN.set(1 if stats["state"] == "open" else 0, tier=tier.name)
+
+
+def _collect_caches():
+    from ai_module.ai_services.enrichment_cache import EnrichmentCache
+    from tasks.services.read_cache import TaskReadCache
+
+    stats = EnrichmentCache().stats()
+    for result in ("memory_hits", "store_hits", "misses"):
+        AI_CACHE_LOOKUPS.set_total(stats[result], result=result)
+    AI_CACHE_EVICTIONS.set_total(stats["evictions"])
+    AI_CACHE_ENTRIES.set(stats["memory_entries"])
+
+    stats = TaskReadCache().stats()
+    for result in ("memory_hits", "shared_hits", "misses"):
+        READ_CACHE_LOOKUPS.set_total(stats[result], result=result)
+    READ_CACHE_ENTRIES.set(stats["memory_entries"])
+
+
+def _collect_model_server():
+    from ai_module.ai_services.model_server import ModelServerError, ModelServerUnavailable, get_client, get_socket_path
+
+    if not get_socket_path():
+        return
+    try:
+        stats = get_client().stats()
+    except (ModelServerUnavailable, ModelServerError):
+        MODEL_SERVER_UP.set(0)
+        return
+    MODEL_SERVER_UP.set(1)
+    MODEL_SERVER_MEMORY.set(stats["rss_bytes"])
+    for name, model in stats["models"].items():
+        if model["load_seconds"] is not None:
+            MODEL_SERVER_LOAD_SECONDS.set(model["load_seconds"], model=name)
+        MODEL_SERVER_CALLS.set_total(model["calls"], model=name)
+        MODEL_SERVER_ERRORS.set_total(model["errors"], model=name)
+        MODEL_SERVER_SECONDS.set_total(model["seconds"], model=name)
+
+
+for _collector in (_collect_process, _collect_inference, _collect_caches):
+    MetricsRegistry().add_collector(_collector)
+MetricsRegistry().add_collector(_collect_model_server, per_process=False)
+
+
+def _flush_at_exit():
+    if get_multiproc_dir():
+        try:
+            MetricsRegistry().flush()
+        except Exception:
+            pass
+
+
+atexit.register(_flush_at_exit)
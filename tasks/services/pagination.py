@@ -0,0 +1,163 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+
+from django.conf import settings
+from django.db.models import F, Q
+
+from tasks.services.full_text_search import filter_by_rank_after
+
+# Keyset (cursor) pagination over (sort key, id). Pages are fetched with
+# `WHERE (key, id) > (last key, last id) ... LIMIT page_size + 1`, so neither
+# OFFSET nor COUNT(*) is needed and every page costs the same.
+
+SORT_DUE_DATE = "due_date"
+SORT_CREATED_AT = "created_at"
+SORT_PRIORITY = "priority"
+# best BM25 match first, only valid together with a full-text query
+SORT_RELEVANCE = "relevance"
+SORT_FIELDS = (SORT_DUE_DATE, SORT_CREATED_AT, SORT_PRIORITY)
+
+
+
+def get_page_size(limit: Optional[str]) -> int:
+    default = getattr(settings, "SEARCH_PAGE_SIZE", 50)
+    maximum = getattr(settings, "SEARCH_MAX_PAGE_SIZE", 200)
+    if limit in (None, ""):
+        return default
+    try:
+        page_size = int(limit)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid limit value: '{limit}'. Must be a number.")
+    if page_size < 1:
+        raise ValueError("limit must be at least 1")
+    return min(page_size, maximum)
+
+
+def parse_sort(sort: Optional[str], has_query: bool) -> Tuple[str, bool]:
+    """Returns (sort key, descending). `-due_date` sorts descending."""
+    if not sort:
+        return (SORT_RELEVANCE, False) if has_query else (SORT_CREATED_AT, True)
+    descending = sort.startswith("-")
+    key = sort.lstrip("-")
+    valid = SORT_FIELDS + ((SORT_RELEVANCE,) if has_query else ())
+    # relevance has a single direction, best match first
+    if key not in valid or (descending and key == SORT_RELEVANCE):
+        raise ValueError(f"Invalid sort value: '{sort}'. Must be one of {list(valid)}.")
+    return key, descending
+
+
+def encode_cursor(sort: str, descending: bool, value, task_id) -> str:
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    raw = json.dumps({"s": sort, "d": descending, "v": value, "id": str(task_id)})
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str, descending: bool):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        value, task_id = data["v"], data["id"]
+        if data["s"] != sort or data["d"] != descending:
+            raise ValueError
+        if value is not None and sort in (SORT_DUE_DATE, SORT_CREATED_AT):
+            value = datetime.fromisoformat(value)
+    except (ValueError, KeyError, TypeError, binascii.Error):
+        raise ValueError("Invalid cursor, it does not belong to this search")
+    return value, task_id
+
+
+def _sort_column(sort: str) -> str:
+    # priority sorts on Task.priority_rank, a generated column with an index
+    return "priority_rank" if sort == SORT_PRIORITY else sort
+
+
+def _keyset_filter(key: str, descending: bool, value, task_id) -> Q:
+    after = "lt" if descending else "gt"
+    if value is None:
+        # NULL keys sort last, so only NULL rows can follow a NULL key
+        return Q(**{f"{key}__isnull": True, f"id__{after}": task_id})
+    condition = Q(**{f"{key}__{after}": value}) | Q(**{key: value, f"id__{after}": task_id})
+    if key == SORT_DUE_DATE:
+        return condition | Q(due_date__isnull=True)
+    # the redundant bound lets SQLite start the (key, id) index range at the cursor
+    return Q(**{f"{key}__{after}e": value}) & condition
+
+
+def order_queryset(queryset, sort: str, descending: bool):
+    """
+    Returns (queryset in (sort key, id) order, name of the sort key).
+    For SORT_RELEVANCE the queryset must come from filter_by_full_text().
+    """
+    if sort == SORT_RELEVANCE:
+        return queryset.order_by("search_rank", "id"), "search_rank"
+    key = _sort_column(sort)
+    if key != SORT_DUE_DATE:
+        # NOT NULL keys: a plain ORDER BY walks the (key, id) index, NULLS LAST would not
+        if descending:
+            return queryset.order_by(F(key).desc(), "-id"), key
+        return queryset.order_by(F(key).asc(), "id"), key
+    if descending:
+        return queryset.order_by(F(key).desc(nulls_last=True), "-id"), key
+    return queryset.order_by(F(key).asc(nulls_last=True), "id"), key
+
+
+def _page_queryset(queryset, sort, descending, cursor, page_size, fields):
+    """The page query (one row more than the page, to detect a next page), its sort key and fields."""
+    queryset, key = order_queryset(queryset, sort, descending)
+    if cursor:
+        value, task_id = decode_cursor(cursor, sort, descending)
+        if sort == SORT_RELEVANCE:
+            queryset = filter_by_rank_after(queryset, value, task_id)
+        else:
+            queryset = queryset.filter(_keyset_filter(key, descending, value, task_id))
+
+    if fields is not None:
+        fields = tuple(fields) if key in fields else (*fields, key)
+        queryset = queryset.values_list(*fields)
+    return queryset[: page_size + 1], key, fields
+
+
+def _page(rows, sort, descending, page_size, key, fields):
+    if len(rows) <= page_size:
+        return rows, None
+
+    rows = rows[:page_size]
+    last = rows[-1]
+    if fields is not None:
+        return rows, encode_cursor(
+            sort, descending, last[fields.index(key)], last[fields.index("id")]
+        )
+    return rows, encode_cursor(sort, descending, getattr(last, key), last.id)
+
+
+def paginate(
+    queryset,
+    sort: str,
+    descending: bool,
+    cursor: Optional[str],
+    page_size: int,
+    fields: Optional[Sequence[str]] = None,
+) -> Tuple[List, Optional[str]]:
+    """
+    Returns (rows of this page, cursor of the next page or None). With `fields`
+    the rows are values_list() tuples starting with those fields.
+    """
+    page, key, fields = _page_queryset(queryset, sort, descending, cursor, page_size, fields)
+    return _page(list(page), sort, descending, page_size, key, fields)
+
+
+async def apaginate(
+    queryset,
+    sort: str,
+    descending: bool,
+    cursor: Optional[str],
+    page_size: int,
+    fields: Optional[Sequence[str]] = None,
+) -> Tuple[List, Optional[str]]:
+    """paginate() for async views, the page is read with the async ORM."""
+    page, key, fields = _page_queryset(queryset, sort, descending, cursor, page_size, fields)
+    return _page([row async for row in page], sort, descending, page_size, key, fields)
@@ -0,0 +1,174 @@
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+# Read-through cache of the /read payload ({"message", "data"}).
+#
+#   Version: Task.updated_at, read with a one-column primary key lookup on every
+#            request. Every write to a task moves it, so an entry cached for an
+#            older version is never served, whichever worker cached it.
+#   Tier 1:  bounded in-process LRU (TASK_READ_CACHE_ENTRIES), one entry per task
+#   Tier 2:  the "tasks" cache alias shared by all workers, when configured
+#            (TASK_CACHE_REDIS_URL)
+#
+# edit/archive also drop the entry once their transaction commits.
+
+VERSION_FIELD = "updated_at"
+SHARED_CACHE_ALIAS = "tasks"
+KEY_PREFIX = "task-read"
+
+_MISSING = object()
+
+
+class TaskReadCache:
+    """Process-wide two-tier cache (singleton); see module comment."""
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    instance = super(TaskReadCache, cls).__new__(cls)
+                    instance._memory = OrderedDict()
+                    instance._lock = threading.Lock()
+                    instance._stats = {
+                        "memory_hits": 0,
+                        "shared_hits": 0,
+                        "misses": 0,
+                        "invalidations": 0,
+                    }
+                    cls._instance = instance
+        return cls._instance
+
+    # -------------------------------------------------------------------------
+    # settings
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def is_enabled() -> bool:
+        return getattr(settings, "TASK_READ_CACHE_ENABLED", True)
+
+    @staticmethod
+    def shared_cache():
+        """The shared tier, None unless the "tasks" cache alias is configured."""
+        if SHARED_CACHE_ALIAS not in getattr(settings, "CACHES", {}):
+            return None
+        return caches[SHARED_CACHE_ALIAS]
+
+    @staticmethod
+    def make_key(task_id) -> str:
+        return f"{KEY_PREFIX}:{task_id}"
+
+    # -------------------------------------------------------------------------
+    # lookups
+    # -------------------------------------------------------------------------
+    def get(self, task_id, version):
+        """The payload cached for `task_id` at `version`, None on a miss."""
+        value = self._get_memory(task_id, version)
+        if value is not _MISSING:
+            return value
+        shared = self.shared_cache()
+        entry = shared.get(self.make_key(task_id)) if shared is not None else None
+        return self._from_shared(task_id, version, entry)
+
+    async def aget(self, task_id, version):
+        value = self._get_memory(task_id, version)
+        if value is not _MISSING:
+            return value
+        shared = self.shared_cache()
+        entry = await shared.aget(self.make_key(task_id)) if shared is not None else None
+        return self._from_shared(task_id, version, entry)
+
+    def set(self, task_id, version, value) -> None:
+        self._remember(task_id, version, value)
+        shared = self.shared_cache()
+        if shared is not None:
+            shared.set(self.make_key(task_id), (version, value), self._timeout())
+
+    async def aset(self, task_id, version, value) -> None:
+        self._remember(task_id, version, value)
+        shared = self.shared_cache()
+        if shared is not None:
+            await shared.aset(self.make_key(task_id), (version, value), self._timeout())
+
+    # -------------------------------------------------------------------------
+    # invalidation
+    # -------------------------------------------------------------------------
+    def invalidate(self, task_ids) -> None:
+        task_ids = [str(task_id) for task_id in task_ids]
+        self._forget(task_ids)
+        shared = self.shared_cache()
+        if shared is not None:
+            shared.delete_many([self.make_key(task_id) for task_id in task_ids])
+
+    async def ainvalidate(self, task_ids) -> None:
+        task_ids = [str(task_id) for task_id in task_ids]
+        self._forget(task_ids)
+        shared = self.shared_cache()
+        if shared is not None:
+            await shared.adelete_many([self.make_key(task_id) for task_id in task_ids])
+
+    def invalidate_on_commit(self, task_ids) -> None:
+        """Invalidate once the current transaction commits (immediately in autocommit)."""
+        task_ids = list(task_ids)
+        transaction.on_commit(lambda: self.invalidate(task_ids))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+        lookups = stats["memory_hits"] + stats["shared_hits"] + stats["misses"]
+        stats["hit_ratio"] = (
+            (stats["memory_hits"] + stats["shared_hits"]) / lookups if lookups else 0.0
+        )
+        return stats
+
+    # -------------------------------------------------------------------------
+    # internals
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def _timeout():
+        return getattr(settings, "TASK_READ_CACHE_TIMEOUT", 3600)
+
+    def _get_memory(self, task_id, version):
+        task_id = str(task_id)
+        with self._lock:
+            entry = self._memory.get(task_id)
+            if entry is not None and entry[0] == version:
+                self._memory.move_to_end(task_id)
+                self._stats["memory_hits"] += 1
+                return entry[1]
+        return _MISSING
+
+    def _from_shared(self, task_id, version, entry):
+        if entry is not None and entry[0] == version:
+            self._remember(task_id, version, entry[1])
+            with self._lock:
+                self._stats["shared_hits"] += 1
+            return entry[1]
+        with self._lock:
+            self._stats["misses"] += 1
+        return None
+
+    def _remember(self, task_id, version, value) -> None:
+        limit = getattr(settings, "TASK_READ_CACHE_ENTRIES", 1024)
+        task_id = str(task_id)
+        with self._lock:
+            self._memory[task_id] = (version, value)
+            self._memory.move_to_end(task_id)
+            while len(self._memory) > limit:
+                self._memory.popitem(last=False)
+
+    def _forget(self, task_ids) -> None:
+        with self._lock:
+            for task_id in task_ids:
+                self._memory.pop(task_id, None)
+            self._stats["invalidations"] += len(task_ids)
@@ -0,0 +1,53 @@
+import json
+
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # optional, the stdlib encoder is used instead
+    orjson = None
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+_drf_default = JSONEncoder().default
+
+
+def dumps(data) -> bytes:
+    """
+    Compact UTF-8 JSON, byte for byte what JSONRenderer produces. Uses orjson
+    when installed; datetimes go through DRF's encoder to keep its format.
+    """
+    if orjson is not None:
+        ret = orjson.dumps(data, default=_drf_default, option=orjson.OPT_PASSTHROUGH_DATETIME)
+    else:
+        ret = json.dumps(
+            data, cls=JSONEncoder, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+        ).encode("utf-8")
+    # same escaping as JSONRenderer, for JSON embedded in <script> tags
+    return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+
+
+class FastJSONRenderer(JSONRenderer):
+    """JSONRenderer with the orjson fast path of dumps(); indented output falls back to DRF."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None or self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        return dumps(data)
+
+
+class NDJSONRenderer(BaseRenderer):
+    """
+    Newline-delimited JSON. Lets views accept `Accept: application/x-ndjson`;
+    streamed results bypass it, other responses (errors, 404) render as one line.
+    """
+
+    media_type = NDJSON_MEDIA_TYPE
+    format = "ndjson"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return dumps(data) + b"\n"
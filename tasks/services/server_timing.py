@@ -0,0 +1,84 @@
+import time
+from contextvars import ContextVar
+from typing import List, Optional, Tuple
+
+from django.conf import settings
+
+# Per-stage timings of a request (SERVER_TIMING_ENABLED), reported in the
+# `Server-Timing` response header and logged by ServerTimingMiddleware.
+#
+# The middleware starts a recording per request; `with span("spacy"): ...` anywhere
+# below the view adds that stage's duration to it. Without a recording (timing
+# disabled, management commands, enrichment workers) span() returns a shared no-op
+# after one ContextVar lookup. Work handed to a thread pool is recorded when the
+# pool runs it in a copy of the caller's context (contextvars.copy_context()).
+
+_recording: ContextVar[Optional[list]] = ContextVar("server_timing", default=None)
+
+
+def is_server_timing_enabled() -> bool:
+    return getattr(settings, "SERVER_TIMING_ENABLED", False)
+
+
+class _Span:
+    __slots__ = ("spans", "name", "started")
+
+    def __init__(self, spans: list, name: str):
+        self.spans = spans
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.spans.append((self.name, time.perf_counter() - self.started))
+        return False
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+def span(name: str):
+    """Context manager timing one stage of the current request (a no-op outside one)."""
+    spans = _recording.get()
+    return _NO_SPAN if spans is None else _Span(spans, name)
+
+
+def start_recording():
+    """Collect the spans of the current context; pass the token to stop_recording()."""
+    return _recording.set([])
+
+
+def stop_recording(token) -> List[Tuple[str, float]]:
+    spans = _recording.get() or []
+    _recording.reset(token)
+    return spans
+
+
+def summarize(spans: List[Tuple[str, float]]) -> List[Tuple[str, float, int]]:
+    """(name, total seconds, count) per stage, in the order the stages first ran."""
+    totals = {}
+    for name, seconds in spans:
+        total, count = totals.get(name, (0.0, 0))
+        totals[name] = (total + seconds, count + 1)
+    return [(name, total, count) for name, (total, count) in totals.items()]
+
+
+def server_timing_header(summary: List[Tuple[str, float, int]], total_seconds: float) -> str:
+    metrics = [
+        f"{name};dur={seconds * 1000:.1f}" + (f';desc="{count} calls"' if count > 1 else "")
+        for name, seconds, count in summary
+    ]
+    metrics.append(f"total;dur={total_seconds * 1000:.1f}")
+    return ", ".join(metrics)
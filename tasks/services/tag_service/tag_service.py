@@ -0,0 +1,72 @@
+from typing import Dict, Iterable, List, Optional
+
+from tasks.models.model.tag_model import Tag, TaskTag
+
+TAG_NAME_MAX_LENGTH = 100
+
+
+class TagServices:
+    @staticmethod
+    def normalize_tag_names(names: Optional[Iterable[str]]) -> List[str]:
+        """Strip, lower-case and de-duplicate tag names, keeping their order."""
+        normalized = []
+        for name in names or []:
+            name = str(name).strip().lower()[:TAG_NAME_MAX_LENGTH]
+            if name and name not in normalized:
+                normalized.append(name)
+        return normalized
+
+    @staticmethod
+    def split_tag_string(tag_string: Optional[str]) -> List[str]:
+        """Tags predicted by the ai_services come as a comma-separated string."""
+        return TagServices.normalize_tag_names((tag_string or "").split(","))
+
+    @staticmethod
+    def get_or_create_tags(names: Iterable[str]) -> Dict[str, Tag]:
+        names = TagServices.normalize_tag_names(names)
+        if not names:
+            return {}
+        Tag.objects.bulk_create([Tag(name=name) for name in names], ignore_conflicts=True)
+        return {tag.name: tag for tag in Tag.objects.filter(name__in=names)}
+
+    @staticmethod
+    def get_task_tag_names(task_ids: Iterable[object]) -> Dict[object, List[str]]:
+        """Task id -> tag names for every given task that has tags, in one query."""
+        tag_names: Dict[object, List[str]] = {}
+        for task_id, name in TaskTag.objects.filter(task_id__in=list(task_ids)).values_list(
+            "task_id", "tag__name"
+        ):
+            tag_names.setdefault(task_id, []).append(name)
+        return tag_names
+
+    @staticmethod
+    async def aget_task_tag_names(task_ids: Iterable[object]) -> Dict[object, List[str]]:
+        """get_task_tag_names() for async views."""
+        tag_names: Dict[object, List[str]] = {}
+        async for task_id, name in TaskTag.objects.filter(task_id__in=list(task_ids)).values_list(
+            "task_id", "tag__name"
+        ):
+            tag_names.setdefault(task_id, []).append(name)
+        return tag_names
+
+    @staticmethod
+    def add_task_tags(task_tag_names: Dict[object, Iterable[str]]) -> None:
+        """
+        Attach tags to tasks, `task_tag_names` maps task id -> tag names.
+        One query for the tags and one INSERT for the links; existing links are kept.
+        """
+        task_tag_names = {
+            task_id: TagServices.normalize_tag_names(names)
+            for task_id, names in task_tag_names.items()
+        }
+        tags = TagServices.get_or_create_tags(
+            name for names in task_tag_names.values() for name in names
+        )
+        TaskTag.objects.bulk_create(
+            [
+                TaskTag(task_id=task_id, tag=tags[name])
+                for task_id, names in task_tag_names.items()
+                for name in names
+            ],
+            ignore_conflicts=True,
+        )
@@ -1,22 +1,65 @@
+import uuid
+from functools import reduce
+from itertools import islice
+from operator import or_
 from sqlite3 import DatabaseError
-from typing import Optional
+from typing import AsyncIterator, Iterator, List, Optional
 
+from pydantic import ValidationError
+from rest_framework import serializers
+
+from ai_module.ai_services.task_embedding_store import save_task_embedding
 from tasks.export_types.request_data_types.add_task import AddTaskRequestType
+from tasks.export_types.request_data_types.bulk_add_task import BulkAddTaskRequestType
+from tasks.export_types.request_data_types.bulk_archive_task import BulkArchiveTaskRequestType
+from tasks.export_types.request_data_types.bulk_edit_task import (
+    BulkEditTaskRequestType,
+    TaskFilterType,
+)
 from tasks.export_types.request_data_types.edit_task import EditTaskRequestType
-from tasks.export_types.task_export_types.export_task import ExportTask, ExportTaskList
+from tasks.export_types.task_export_types.export_task import (
+    EXPORT_TASK_COLUMNS,
+    ExportTask,
+    export_task_row,
+)
+from tasks.models.model.tag_model import TaskTag
 from tasks.models.model.task_model import Task
 from tasks.serializers.task_serializer import TaskSerializer
-from tasks.services.const import STATUS_CHOICES, PRIORITY_CHOICES
+from tasks.services.const import STATUS_CHOICES, PRIORITY_CHOICES, PRIORITY_RANK
+from tasks.services.db_router import read_only, read_only_service
+from tasks.services.full_text_search import filter_by_full_text
+from tasks.services.handlers.exception_handlers import TaskVersionConflict
+from tasks.services.inference_executor import run_inference
+from tasks.services.pagination import (
+    apaginate,
+    get_page_size,
+    order_queryset,
+    paginate,
+    parse_sort,
+)
+from tasks.services.read_cache import VERSION_FIELD, TaskReadCache
+from tasks.services.renderers import dumps
+from tasks.services.tag_service.tag_service import TagServices
 from tasks.services.helpers import (
     validate_string_input,
     suggest_closest,
     validate_list_input,
     validate_boolean_input,
+    validate_dateTime_input,
     convert_dateTime_to_string,
     convert_string_to_dateTime,
 )
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q, prefetch_related_objects
 from django.utils import timezone
 
+BULK_ADD_MAX_TASKS = 500
+BULK_UPDATE_MAX_TASKS = 5000
+# ids per UPDATE statement, keeps the bound parameters well below SQLite's limit
+BULK_UPDATE_CHUNK_SIZE = 500
+
 
 class TaskServices:
     @staticmethod
@@ -26,8 +69,60 @@ class TaskServices:
         return {
             "message": f"{task.title} is created",
             "data": ExportTask(**task.model_to_dict()).model_dump(),
+            # which tier (user/cache/rules/spacy/transformer) produced each field, None if async
+            "enrichment_tiers": getattr(task, "enrichment_tiers", None),
+        }
+
+    @staticmethod
+    def bulk_create_task_service(request_data: BulkAddTaskRequestType) -> dict:
+        if len(request_data.tasks) > BULK_ADD_MAX_TASKS:
+            raise ValueError(f"At most {BULK_ADD_MAX_TASKS} tasks can be added at once")
+
+        serializer = TaskSerializer()
+        valid_requests, valid_indexes, errors = [], [], []
+        for index, item in enumerate(request_data.tasks):
+            try:
+                request = AddTaskRequestType(**item)
+                serializer.validate({"request_data": request})
+            except ValidationError as e:
+                errors.append(
+                    {
+                        "index": index,
+                        "message": "; ".join(
+                            f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}"
+                            for error in e.errors()
+                        ),
+                    }
+                )
+                continue
+            except serializers.ValidationError as e:
+                errors.append({"index": index, "message": "; ".join(e.detail)})
+                continue
+            valid_requests.append(request)
+            valid_indexes.append(index)
+
+        tasks = serializer.bulk_create(valid_requests) if valid_requests else []
+        prefetch_related_objects(tasks, "tags")
+        return {
+            "message": f"{len(tasks)} of {len(request_data.tasks)} tasks are created",
+            "data": [
+                {"index": index, **ExportTask(**task.model_to_dict()).model_dump()}
+                for index, task in zip(valid_indexes, tasks)
+            ],
+            "errors": errors,
         }
 
+    @staticmethod
+    def _validate_choice(value: str, choices: list, label: str) -> str:
+        valid_values = [choice[0] for choice in choices]
+        if value not in valid_values:
+            suggestion = suggest_closest(value, choices)
+            msg = f"Invalid {label} value: '{value}'. Must be one of {valid_values}."
+            if suggestion:
+                msg += f" Did you mean '{suggestion}'?"
+            raise ValueError(msg)
+        return value
+
     @staticmethod
     def edit_task_service(request_data: EditTaskRequestType) -> ExportTask:
         if not validate_string_input(request_data.id):
@@ -36,60 +131,54 @@ class TaskServices:
             task = Task.objects.get(id=request_data.id, is_active=True)
         except Exception:
             raise ValueError("No task exists")
+        if request_data.version is not None and request_data.version != task.version:
+            raise TaskVersionConflict(
+                f"Task is at version {task.version}, the edit is based on version {request_data.version}"
+            )
+
+        # only the changed columns are written
+        changes = {}
 
+        def change(field, value):
+            setattr(task, field, value)
+            changes[field] = value
+
+        text_changed = False
         if (
             validate_string_input(request_data.description)
             and request_data.description != task.description
         ):
-            task.description = request_data.description
+            change("description", request_data.description)
+            text_changed = True
 
         # validate & update status, priority
         if validate_string_input(request_data.status):
-            VALID_STATUSES = [choice[0] for choice in STATUS_CHOICES]
-            if request_data.status not in VALID_STATUSES:
-                suggestion = suggest_closest(request_data.status, STATUS_CHOICES)
-                msg = f"Invalid status value: '{request_data.status}'. Must be one of {VALID_STATUSES}."
-                if suggestion:
-                    msg += f" Did you mean '{suggestion}'?"
-                raise ValueError(msg)
+            TaskServices._validate_choice(request_data.status, STATUS_CHOICES, "status")
+            if request_data.status.lower() == "completed":
+                change("completed_at", timezone.now())
             else:
-                if request_data.status.lower() == "completed":
-                    task.completed_at = timezone.now()
-                else:
-                    task.completed_at = None
-                task.status = request_data.status
+                change("completed_at", None)
+            change("status", request_data.status)
 
         if validate_string_input(request_data.priority):
-            VALID_PRIORITY_CHOICES = [priority[0] for priority in PRIORITY_CHOICES]
-            if request_data.priority not in VALID_PRIORITY_CHOICES:
-                suggestion = suggest_closest(request_data.priority, PRIORITY_CHOICES)
-                msg = f"Invalid priority value: '{request_data.priority}'. Must be one of {VALID_PRIORITY_CHOICES}."
-                if suggestion:
-                    msg += f" Did you mean '{suggestion}'?"
-                raise ValueError(msg)
-            else:
-                task.priority = request_data.priority
+            TaskServices._validate_choice(request_data.priority, PRIORITY_CHOICES, "priority")
+            change("priority", request_data.priority)
 
         # validate & update category
         if (
             validate_string_input(request_data.category)
             and request_data.category != task.category
         ):
-            task.category = request_data.category
+            change("category", request_data.category)
 
-        # validate & update tags
-        if validate_list_input(request_data.tags):
-            for tag in request_data.tags:
-                if tag in task.tags:
-                    request_data.tags.remove(tag)
-                else:
-                    task.tags += tag + ","
+        # validate tags (new tags are added, existing ones are kept)
+        new_tags = request_data.tags if validate_list_input(request_data.tags) else []
 
         # validate & update due date
         if validate_string_input(
             request_data.due_date
         ) and request_data.due_date != convert_dateTime_to_string(task.due_date):
-            task.due_date = convert_string_to_dateTime(request_data.due_date)
+            change("due_date", convert_string_to_dateTime(request_data.due_date))
 
         # validate & update complete date
         if validate_string_input(
@@ -97,67 +186,431 @@ class TaskServices:
         ) and request_data.completed_at != convert_dateTime_to_string(
             task.completed_at
         ):
-            task.completed_at = convert_string_to_dateTime(request_data.completed_at)
+            change("completed_at", convert_string_to_dateTime(request_data.completed_at))
 
         # validate & update isActive
         if (
             validate_boolean_input(request_data.is_active)
             and request_data.is_active != task.is_active
         ):
-            task.is_active = request_data.is_active
+            change("is_active", request_data.is_active)
 
-        task.updated_at = timezone.now()
-        task.save()
+        now = timezone.now()
+        with transaction.atomic():
+            # a concurrent edit since the get() above moved the version: reject, don't overwrite
+            updated = Task.objects.filter(id=task.id, version=task.version).update(
+                **changes, version=F("version") + 1, updated_at=now
+            )
+            if not updated:
+                raise TaskVersionConflict("Task was modified by another request, read it again")
+            if new_tags:
+                TagServices.add_task_tags({task.id: new_tags})
+            TaskReadCache().invalidate_on_commit([task.id])
+        task.version += 1
+        task.updated_at = now
+        if text_changed:
+            save_task_embedding(task)
         return ExportTask(**task.model_to_dict())
 
     @staticmethod
+    @read_only_service
     def view_task_service(task_id: str) -> dict:
+        cache = TaskReadCache()
+        if cache.is_enabled():
+            # the version check is a primary key lookup of one column
+            try:
+                task_id, version = (
+                    Task.objects.filter(id=task_id, is_active=True)
+                    .values_list("id", VERSION_FIELD)
+                    .get()
+                )
+            except Exception:
+                raise DatabaseError()
+            cached = cache.get(task_id, version)
+            if cached is not None:
+                return cached
+
         try:
             task: Task = Task.objects.get(id=task_id, is_active=True)
         except Exception:
             raise DatabaseError()
-        return {
+        result = {
             "message": f"`{task.title}` is fetched",
             "data": ExportTask(**task.model_to_dict()).model_dump(),
         }
+        if cache.is_enabled():
+            cache.set(task.id, getattr(task, VERSION_FIELD), result)
+        return result
 
     @staticmethod
     def archive_task_service(task_id: str) -> dict:
         try:
-            task: Task = Task.objects.get(id=task_id, is_active=True)
+            # one conditional UPDATE: an edit racing the archive still sees a new version
+            archived = Task.objects.filter(id=task_id, is_active=True).update(
+                is_active=False, version=F("version") + 1, updated_at=timezone.now()
+            )
+            if not archived:
+                raise Task.DoesNotExist()
+            task: Task = Task.objects.get(id=task_id)
         except Exception:
             raise DatabaseError()
-        task.is_active = False
-        task.save()
+        TaskReadCache().invalidate_on_commit([task.id])
         return {
             "message": f"`{task.title}` is fetched",
             "data": ExportTask(**task.model_to_dict()).model_dump(),
         }
 
     @staticmethod
-    def search_task_service(query: str, status: str, priority: str) -> Optional[ExportTaskList]:
+    def _bulk_target_ids(ids: List[str]) -> List[uuid.UUID]:
         try:
-            tasks = Task.objects.all()
-            if query:
-                # tasks = tasks.filter(status=status)
-                print("Filter with query")
+            task_ids = [uuid.UUID(str(task_id)) for task_id in ids]
+        except ValueError:
+            raise ValueError("Every id must be a task UUID")
+        if len(task_ids) > BULK_UPDATE_MAX_TASKS:
+            raise ValueError(f"At most {BULK_UPDATE_MAX_TASKS} tasks can be changed at once")
+        # "ABC..." and "abc..." (or with and without hyphens) are the same task
+        if len(set(task_ids)) < len(task_ids):
+            raise ValueError("Every task can only be given once")
+        return task_ids
+
+    @staticmethod
+    def _filter_queryset(task_filter: TaskFilterType):
+        if not any((task_filter.status, task_filter.priority, task_filter.category, task_filter.tags)):
+            raise ValueError("A filter needs at least one of status, priority, category or tags")
+        tasks = TaskServices._search_queryset(
+            None, task_filter.status, task_filter.priority, task_filter.tags, include_archived=False
+        )
+        if task_filter.category:
+            tasks = tasks.filter(category=task_filter.category)
+        return tasks
 
-            if status:
-                tasks = tasks.filter(status=status)
+    @staticmethod
+    def _bulk_update(target, changes: dict) -> dict:
+        """
+        Apply `changes` to the active tasks selected by `target` (ids, versions or filter)
+        with set-based UPDATEs of only those columns, in one transaction. With
+        `versions`, tasks whose version moved on are left alone and reported as conflicts.
+        Returns {"count": updated rows, "conflicts": [ids]}
+        """
+        targets = [target.ids, target.versions, target.filter]
+        if sum(value is not None for value in targets) != 1:
+            raise ValueError("Give exactly one of ids, versions or filter")
+
+        now = timezone.now()
+        values = {**changes, "version": F("version") + 1, "updated_at": now}
+        active = Task.objects.filter(is_active=True)
+        count, conflicts, task_ids = 0, [], None
+        with transaction.atomic():
+            if target.filter is not None:
+                count = TaskServices._filter_queryset(target.filter).update(**values)
+            elif target.versions is not None:
+                task_ids = TaskServices._bulk_target_ids(target.versions)
+                expected = {
+                    uuid.UUID(str(task_id)): version for task_id, version in target.versions.items()
+                }
+                for start in range(0, len(task_ids), BULK_UPDATE_CHUNK_SIZE):
+                    chunk = task_ids[start:start + BULK_UPDATE_CHUNK_SIZE]
+                    count += active.filter(
+                        reduce(or_, (Q(id=task_id, version=expected[task_id]) for task_id in chunk))
+                    ).update(**values)
+                if count < len(task_ids):
+                    # rows of this transaction carry its `now`; reads inside it see its own writes
+                    changed = set()
+                    for start in range(0, len(task_ids), BULK_UPDATE_CHUNK_SIZE):
+                        changed.update(
+                            Task.objects.filter(
+                                id__in=task_ids[start:start + BULK_UPDATE_CHUNK_SIZE], updated_at=now
+                            ).values_list("id", flat=True)
+                        )
+                    conflicts = [str(task_id) for task_id in task_ids if task_id not in changed]
+            else:
+                task_ids = TaskServices._bulk_target_ids(target.ids)
+                for start in range(0, len(task_ids), BULK_UPDATE_CHUNK_SIZE):
+                    count += active.filter(
+                        id__in=task_ids[start:start + BULK_UPDATE_CHUNK_SIZE]
+                    ).update(**values)
+            if task_ids:
+                # filter updates need no eviction: the moved updated_at hides their cached payloads
+                TaskReadCache().invalidate_on_commit(task_ids)
+        return {"count": count, "conflicts": conflicts}
+
+    @staticmethod
+    def bulk_edit_task_service(request_data: BulkEditTaskRequestType) -> dict:
+        changes = {}
+        if validate_string_input(request_data.status):
+            changes["status"] = TaskServices._validate_choice(
+                request_data.status, STATUS_CHOICES, "status"
+            )
+            changes["completed_at"] = (
+                timezone.now() if request_data.status.lower() == "completed" else None
+            )
+        if validate_string_input(request_data.priority):
+            changes["priority"] = TaskServices._validate_choice(
+                request_data.priority, PRIORITY_CHOICES, "priority"
+            )
+        if validate_string_input(request_data.category):
+            changes["category"] = request_data.category
+        for field in ("due_date", "completed_at"):
+            value = getattr(request_data, field)
+            if validate_string_input(value):
+                if not validate_dateTime_input(value):
+                    raise ValueError(f"Invalid {field} value: '{value}'. Expected DD.MM.YYYY.")
+                changes[field] = convert_string_to_dateTime(value)
+        if not changes:
+            raise ValueError("Nothing to update: give status, priority, category, due_date or completed_at")
+
+        result = TaskServices._bulk_update(request_data, changes)
+        return {"message": f"{result['count']} tasks are updated", "data": result}
+
+    @staticmethod
+    def bulk_archive_task_service(request_data: BulkArchiveTaskRequestType) -> dict:
+        result = TaskServices._bulk_update(request_data, {"is_active": False})
+        return {"message": f"{result['count']} tasks are archived", "data": result}
+
+    @staticmethod
+    def _search_queryset(
+        query: str, status: str, priority: str, tags: Optional[List[str]], include_archived: bool = True
+    ):
+        tasks = Task.objects.all() if include_archived else Task.objects.filter(is_active=True)
+        if status:
+            tasks = tasks.filter(status=status)
+
+        if priority in PRIORITY_RANK:
+            # same rows, but the rank can seek the index that also orders sort=priority
+            tasks = tasks.filter(priority_rank=PRIORITY_RANK[priority])
+        elif priority:
+            tasks = tasks.filter(priority=priority)
+
+        # every given tag must be present, each one is an indexed (tag, task) lookup
+        for tag_name in TagServices.normalize_tag_names(tags):
+            tasks = tasks.filter(
+                id__in=TaskTag.objects.filter(tag__name=tag_name).values("task_id")
+            )
 
-            if priority:
-                tasks = tasks.filter(priority=priority)
+        if query:
+            # served by the FTS5 index, best BM25 match first
+            tasks = filter_by_full_text(tasks, query)
+        return tasks
+
+    @staticmethod
+    def _export_rows(rows: List[tuple]) -> List[dict]:
+        """values_list(*EXPORT_TASK_COLUMNS) rows -> ExportTask dicts, one query for the tags."""
+        tag_names = TagServices.get_task_tag_names(row[0] for row in rows)
+        return [export_task_row(row, tag_names.get(row[0], [])) for row in rows]
+
+    @staticmethod
+    async def _aexport_rows(rows: List[tuple]) -> List[dict]:
+        tag_names = await TagServices.aget_task_tag_names(row[0] for row in rows)
+        return [export_task_row(row, tag_names.get(row[0], [])) for row in rows]
+
+    @staticmethod
+    def _ndjson_lines(task_list: List[dict]) -> bytes:
+        return b"".join(dumps(task) + b"\n" for task in task_list)
+
+    @staticmethod
+    @read_only_service
+    def search_task_service(
+        query: str,
+        status: str,
+        priority: str,
+        tags: Optional[List[str]] = None,
+        sort: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[str] = None,
+        include_archived: bool = True,
+    ) -> Optional[dict]:
+        """
+        Returns {"task_list": [ExportTask dicts], "next": cursor or None}, or None
+        if nothing matches. Rows are read with values_list(), no model instances
+        and no pydantic validation on this path.
+        """
+        # invalid sort/limit/cursor values raise ValueError before touching the DB
+        sort_key, descending = parse_sort(sort, has_query=bool(query))
+        page_size = get_page_size(limit)
+        try:
+            tasks = TaskServices._search_queryset(query, status, priority, tags, include_archived)
+            # one page of (sort key, id) ordered rows, no OFFSET and no COUNT(*)
+            rows, next_cursor = paginate(
+                tasks, sort_key, descending, cursor, page_size, fields=EXPORT_TASK_COLUMNS
+            )
+            task_list = TaskServices._export_rows(rows)
+        except ValueError:
+            raise
         except Exception:
             raise DatabaseError()
-        if tasks:
-            all_tasks = ExportTaskList(
-                task_list=[
-                    ExportTask(
-                        **task_data.model_to_dict()
-                    )
-                    for task_data in tasks
-                ]
+        if task_list:
+            return {"task_list": task_list, "next": next_cursor}
+        else:
+            return None
+
+    @staticmethod
+    def stream_search_task_service(
+        query: str,
+        status: str,
+        priority: str,
+        tags: Optional[List[str]] = None,
+        sort: Optional[str] = None,
+        include_archived: bool = True,
+    ) -> Iterator[bytes]:
+        """
+        Every matching task as one NDJSON line, read from the DB in chunks of
+        SEARCH_STREAM_CHUNK_SIZE rows so memory stays flat whatever the result size.
+        Arguments are validated before the first row is read.
+        """
+        sort_key, descending = parse_sort(sort, has_query=bool(query))
+        tasks, _ = order_queryset(
+            TaskServices._search_queryset(query, status, priority, tags, include_archived), sort_key, descending
+        )
+        chunk_size = getattr(settings, "SEARCH_STREAM_CHUNK_SIZE", 500)
+        rows = tasks.values_list(*EXPORT_TASK_COLUMNS).iterator(chunk_size=chunk_size)
+
+        def _lines():
+            while True:
+                # the rows are read while the response is sent, after this call returned
+                with read_only():
+                    chunk = list(islice(rows, chunk_size))
+                    if not chunk:
+                        return
+                    lines = TaskServices._ndjson_lines(TaskServices._export_rows(chunk))
+                yield lines
+
+        return _lines()
+
+    # -------------------------------------------------------------------------
+    # async variants for the ASGI views (tasks/views/async_task.py): reads use the
+    # async ORM, model-backed work runs on the bounded inference pool
+    # -------------------------------------------------------------------------
+    @staticmethod
+    async def acreate_new_task_service(request_data: AddTaskRequestType) -> dict:
+        # validation, enrichment, INSERT and embedding stay together on one pool thread
+        return await run_inference(TaskServices.create_new_task_service, request_data)
+
+    @staticmethod
+    async def abulk_create_task_service(request_data: BulkAddTaskRequestType) -> dict:
+        return await run_inference(TaskServices.bulk_create_task_service, request_data)
+
+    @staticmethod
+    async def aedit_task_service(request_data: EditTaskRequestType) -> ExportTask:
+        # a changed description is re-embedded
+        return await run_inference(TaskServices.edit_task_service, request_data)
+
+    @staticmethod
+    async def abulk_edit_task_service(request_data: BulkEditTaskRequestType) -> dict:
+        # several statements in one transaction, which the async ORM cannot express
+        return await sync_to_async(TaskServices.bulk_edit_task_service)(request_data)
+
+    @staticmethod
+    async def abulk_archive_task_service(request_data: BulkArchiveTaskRequestType) -> dict:
+        return await sync_to_async(TaskServices.bulk_archive_task_service)(request_data)
+
+    @staticmethod
+    async def _aexport_task(task: Task) -> dict:
+        row = tuple(getattr(task, column) for column in EXPORT_TASK_COLUMNS)
+        return (await TaskServices._aexport_rows([row]))[0]
+
+    @staticmethod
+    @read_only_service
+    async def aview_task_service(task_id: str) -> dict:
+        cache = TaskReadCache()
+        if cache.is_enabled():
+            try:
+                task_id, version = await (
+                    Task.objects.filter(id=task_id, is_active=True)
+                    .values_list("id", VERSION_FIELD)
+                    .aget()
+                )
+            except Exception:
+                raise DatabaseError()
+            cached = await cache.aget(task_id, version)
+            if cached is not None:
+                return cached
+
+        try:
+            task: Task = await Task.objects.aget(id=task_id, is_active=True)
+        except Exception:
+            raise DatabaseError()
+        result = {
+            "message": f"`{task.title}` is fetched",
+            "data": await TaskServices._aexport_task(task),
+        }
+        if cache.is_enabled():
+            await cache.aset(task.id, getattr(task, VERSION_FIELD), result)
+        return result
+
+    @staticmethod
+    async def aarchive_task_service(task_id: str) -> dict:
+        try:
+            archived = await Task.objects.filter(id=task_id, is_active=True).aupdate(
+                is_active=False, version=F("version") + 1, updated_at=timezone.now()
             )
-            return all_tasks
+            if not archived:
+                raise Task.DoesNotExist()
+            task: Task = await Task.objects.aget(id=task_id)
+        except Exception:
+            raise DatabaseError()
+        await TaskReadCache().ainvalidate([task.id])
+        return {
+            "message": f"`{task.title}` is fetched",
+            "data": await TaskServices._aexport_task(task),
+        }
+
+    @staticmethod
+    @read_only_service
+    async def asearch_task_service(
+        query: str,
+        status: str,
+        priority: str,
+        tags: Optional[List[str]] = None,
+        sort: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[str] = None,
+        include_archived: bool = True,
+    ) -> Optional[dict]:
+        """search_task_service() with the async ORM."""
+        sort_key, descending = parse_sort(sort, has_query=bool(query))
+        page_size = get_page_size(limit)
+        try:
+            tasks = TaskServices._search_queryset(query, status, priority, tags, include_archived)
+            rows, next_cursor = await apaginate(
+                tasks, sort_key, descending, cursor, page_size, fields=EXPORT_TASK_COLUMNS
+            )
+            task_list = await TaskServices._aexport_rows(rows)
+        except ValueError:
+            raise
+        except Exception:
+            raise DatabaseError()
+        if task_list:
+            return {"task_list": task_list, "next": next_cursor}
         else:
-            return None
\ No newline at end of file
+            return None
+
+    @staticmethod
+    def astream_search_task_service(
+        query: str,
+        status: str,
+        priority: str,
+        tags: Optional[List[str]] = None,
+        sort: Optional[str] = None,
+        include_archived: bool = True,
+    ) -> AsyncIterator[bytes]:
+        """stream_search_task_service() as an async iterator, for StreamingHttpResponse under ASGI."""
+        sort_key, descending = parse_sort(sort, has_query=bool(query))
+        tasks, _ = order_queryset(
+            TaskServices._search_queryset(query, status, priority, tags, include_archived), sort_key, descending
+        )
+        chunk_size = getattr(settings, "SEARCH_STREAM_CHUNK_SIZE", 500)
+        # QuerySet.aiterator() opens the cursor inside the event loop for values_list()
+        # querysets, so the chunks of the sync iterator are read via sync_to_async
+        rows = tasks.values_list(*EXPORT_TASK_COLUMNS).iterator(chunk_size=chunk_size)
+        next_chunk = sync_to_async(lambda: list(islice(rows, chunk_size)))
+
+        async def _lines():
+            while True:
+                with read_only():
+                    chunk = await next_chunk()
+                    if not chunk:
+                        return
+                    lines = TaskServices._ndjson_lines(await TaskServices._aexport_rows(chunk))
+                yield lines
+
+        return _lines()
@@ -0,0 +1,78 @@
+from django.test import TestCase
+
+from tasks.models.model.task_model import Task
+
+UPDATE_URL = "/api/v1/task/update"
+BULK_UPDATE_URL = "/api/v1/task/update/bulk"
+ARCHIVE_URL = "/api/v1/task/archive"
+
+
+class TaskVersionTests(TestCase):
+    def create_task(self, title):
+        return Task.objects.create(title=title, description="", is_active=True)
+
+    def post(self, url, data):
+        return self.client.post(url, data, content_type="application/json")
+
+    def test_edit_with_stale_version_is_rejected(self):
+        task = self.create_task("Prepare slides")
+        response = self.post(UPDATE_URL, {"id": str(task.id), "priority": "high", "version": 1})
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()["data"]["version"], 2)
+
+        response = self.post(UPDATE_URL, {"id": str(task.id), "priority": "low", "version": 1})
+        self.assertEqual(response.status_code, 409)
+        self.assertTrue(response.json()["message"].startswith("ConflictError"))
+        task.refresh_from_db()
+        self.assertEqual((task.priority, task.version), ("high", 2))
+
+    def test_archive_moves_the_stored_version(self):
+        task = self.create_task("Pay rent")
+        # changed by someone else after this `task` object was read
+        Task.objects.filter(id=task.id).update(version=5)
+
+        response = self.post(ARCHIVE_URL, {"id": str(task.id)})
+        self.assertEqual(response.status_code, 201)
+        task.refresh_from_db()
+        self.assertEqual((task.is_active, task.version), (False, 6))
+
+    def test_bulk_edit_reports_version_conflicts(self):
+        current, stale = self.create_task("Book flight"), self.create_task("Call bank")
+        Task.objects.filter(id=stale.id).update(version=2)
+
+        response = self.post(
+            BULK_UPDATE_URL,
+            {"versions": {str(current.id): 1, str(stale.id): 1}, "priority": "high"},
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()["data"], {"count": 1, "conflicts": [str(stale.id)]})
+        self.assertEqual(Task.objects.get(id=current.id).priority, "high")
+        self.assertEqual(Task.objects.get(id=stale.id).priority, "medium")
+
+    def test_bulk_edit_rejects_the_same_task_twice(self):
+        task = self.create_task("Water plants")
+        response = self.post(
+            BULK_UPDATE_URL,
+            {"versions": {str(task.id): 1, task.id.hex.upper(): 1}, "priority": "high"},
+        )
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(Task.objects.get(id=task.id).version, 1)
+
+
+class SearchTests(TestCase):
+    def test_relevance_cannot_be_reversed(self):
+        Task.objects.create(title="Quarterly report", description="", is_active=True)
+        response = self.client.get("/api/v1/task/search", {"q": "report", "sort": "-relevance"})
+        self.assertEqual(response.status_code, 422)
+
+        response = self.client.get("/api/v1/task/search", {"q": "report", "sort": "relevance"})
+        self.assertEqual(response.status_code, 200)
+
+    def test_archived_tasks_are_found_unless_excluded(self):
+        Task.objects.create(title="Old report", description="", is_active=False)
+        response = self.client.get("/api/v1/task/search", {"q": "report"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([task["title"] for task in response.json()["data"]["task_list"]], ["Old report"])
+
+        response = self.client.get("/api/v1/task/search", {"q": "report", "include_archived": "false"})
+        self.assertEqual(response.status_code, 404)
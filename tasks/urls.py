@@ -1,15 +1,45 @@
+from django.conf import settings
 from django.urls import path
 
 from tasks.views.add_task import AddTaskView
 from tasks.views.archive_task import ArchiveTaskView
+from tasks.views.async_task import (
+    AsyncAddTaskView,
+    AsyncArchiveTaskView,
+    AsyncBulkAddTaskView,
+    AsyncBulkArchiveTaskView,
+    AsyncBulkEditTaskView,
+    AsyncEditTaskView,
+    AsyncSearchTaskView,
+    AsyncViewTaskView,
+)
+from tasks.views.bulk_add_task import BulkAddTaskView
+from tasks.views.bulk_archive_task import BulkArchiveTaskView
+from tasks.views.bulk_edit_task import BulkEditTaskView
 from tasks.views.edit_task import EditTaskView
 from tasks.views.search_task import SearchTaskView
 from tasks.views.view_task import ViewTaskView
 
-urlpatterns = [
-    path("add", AddTaskView.as_view(), name="Create-Task"),
-    path("update", EditTaskView.as_view(), name="Edit-Task"),
-    path("read", ViewTaskView.as_view(), name="View-Task"),
-    path("archive", ArchiveTaskView.as_view(), name="Archive-Task"),
-    path("search", SearchTaskView.as_view(), name="Search-Task"),
-]
+if getattr(settings, "TASK_API_ASYNC", False):
+    # async views for ASGI servers, model calls run on the bounded inference pool
+    urlpatterns = [
+        path("add", AsyncAddTaskView.as_view(), name="Create-Task"),
+        path("add/bulk", AsyncBulkAddTaskView.as_view(), name="Bulk-Create-Task"),
+        path("update", AsyncEditTaskView.as_view(), name="Edit-Task"),
+        path("update/bulk", AsyncBulkEditTaskView.as_view(), name="Bulk-Edit-Task"),
+        path("read", AsyncViewTaskView.as_view(), name="View-Task"),
+        path("archive", AsyncArchiveTaskView.as_view(), name="Archive-Task"),
+        path("archive/bulk", AsyncBulkArchiveTaskView.as_view(), name="Bulk-Archive-Task"),
+        path("search", AsyncSearchTaskView.as_view(), name="Search-Task"),
+    ]
+else:
+    urlpatterns = [
+        path("add", AddTaskView.as_view(), name="Create-Task"),
+        path("add/bulk", BulkAddTaskView.as_view(), name="Bulk-Create-Task"),
+        path("update", EditTaskView.as_view(), name="Edit-Task"),
+        path("update/bulk", BulkEditTaskView.as_view(), name="Bulk-Edit-Task"),
+        path("read", ViewTaskView.as_view(), name="View-Task"),
+        path("archive", ArchiveTaskView.as_view(), name="Archive-Task"),
+        path("archive/bulk", BulkArchiveTaskView.as_view(), name="Bulk-Archive-Task"),
+        path("search", SearchTaskView.as_view(), name="Search-Task"),
+    ]
@@ -20,6 +20,7 @@ class AddTaskView(APIView):
                 data={
                     "message": (result.get("message")),
                     "data": result.get("data"),
+                    "enrichment_tiers": result.get("enrichment_tiers"),
                 },
                 status=status.HTTP_201_CREATED,
                 content_type="application/json",
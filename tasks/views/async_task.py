@@ -0,0 +1,226 @@
+import json
+
+from django.http import HttpResponse, StreamingHttpResponse
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import status
+
+from tasks.export_types.request_data_types.add_task import AddTaskRequestType
+from tasks.export_types.request_data_types.bulk_add_task import BulkAddTaskRequestType
+from tasks.export_types.request_data_types.bulk_archive_task import BulkArchiveTaskRequestType
+from tasks.export_types.request_data_types.bulk_edit_task import BulkEditTaskRequestType
+from tasks.export_types.request_data_types.edit_task import EditTaskRequestType
+from tasks.services.handlers.exception_handlers import ExceptionHandler
+from tasks.services.renderers import NDJSON_MEDIA_TYPE, NDJSONRenderer, dumps
+from tasks.services.task_service.task_service import TaskServices
+
+# Async counterparts of the task APIViews for ASGI deployments (TASK_API_ASYNC=true).
+# Same request and response bodies; DRF has no async APIView, so these are plain
+# Django async views that parse JSON and render with the same encoder.
+
+
+class AsyncTaskView(View):
+    @classmethod
+    def as_view(cls, **initkwargs):
+        # like APIView: the API is not protected by CSRF
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    @staticmethod
+    def request_data(request) -> dict:
+        if request.content_type == "application/json":
+            try:
+                return json.loads(request.body or b"{}")
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Malformed JSON: {e}")
+        return request.POST.dict()
+
+    @staticmethod
+    def respond(data: dict, status_code: int) -> HttpResponse:
+        return HttpResponse(dumps(data), status=status_code, content_type="application/json")
+
+    @staticmethod
+    def handle_exception(e: Exception) -> HttpResponse:
+        response = ExceptionHandler().handle_exception(e)
+        return AsyncTaskView.respond(response.data, response.status_code)
+
+
+class AsyncAddTaskView(AsyncTaskView):
+    async def post(self, request):
+        try:
+            result = await TaskServices.acreate_new_task_service(
+                request_data=AddTaskRequestType(**self.request_data(request))
+            )
+            return self.respond(
+                {
+                    "message": (result.get("message")),
+                    "data": result.get("data"),
+                    "enrichment_tiers": result.get("enrichment_tiers"),
+                },
+                status.HTTP_201_CREATED,
+            )
+        except Exception as e:
+            return self.handle_exception(e)
+
+
+class AsyncBulkAddTaskView(AsyncTaskView):
+    async def post(self, request):
+        try:
+            result = await TaskServices.abulk_create_task_service(
+                request_data=BulkAddTaskRequestType(**self.request_data(request))
+            )
+            return self.respond(
+                {
+                    "message": (result.get("message")),
+                    "data": result.get("data"),
+                    "errors": result.get("errors"),
+                },
+                (
+                    status.HTTP_201_CREATED
+                    if result.get("data")
+                    else status.HTTP_400_BAD_REQUEST
+                ),
+            )
+        except Exception as e:
+            return self.handle_exception(e)
+
+
+class AsyncEditTaskView(AsyncTaskView):
+    async def post(self, request):
+        try:
+            result = await TaskServices.aedit_task_service(
+                request_data=EditTaskRequestType(**self.request_data(request))
+            )
+            return self.respond(
+                {
+                    "message": "Task is updated.",
+                    "data": result.model_dump(),
+                },
+                status.HTTP_201_CREATED,
+            )
+        except Exception as e:
+            return self.handle_exception(e)
+
+
+class AsyncBulkEditTaskView(AsyncTaskView):
+    async def post(self, request):
+        try:
+            result = await TaskServices.abulk_edit_task_service(
+                request_data=BulkEditTaskRequestType(**self.request_data(request))
+            )
+            return self.respond(
+                {
+                    "message": (result.get("message")),
+                    "data": result.get("data"),
+                },
+                status.HTTP_201_CREATED,
+            )
+        except Exception as e:
+            return self.handle_exception(e)
+
+
+class AsyncBulkArchiveTaskView(AsyncTaskView):
+    async def post(self, request):
+        try:
+            result = await TaskServices.abulk_archive_task_service(
+                request_data=BulkArchiveTaskRequestType(**self.request_data(request))
+            )
+            return self.respond(
+                {
+                    "message": (result.get("message")),
+                    "data": result.get("data"),
+                },
+                status.HTTP_201_CREATED,
+            )
+        except Exception as e:
+            return self.handle_exception(e)
+
+
+class AsyncViewTaskView(AsyncTaskView):
+    async def post(self, request):
+        try:
+            result = await TaskServices.aview_task_service(
+                task_id=self.request_data(request).get("id")
+            )
+            return self.respond(
+                {
+                    "message": (result.get("message")),
+                    "data": result.get("data"),
+                },
+                status.HTTP_201_CREATED,
+            )
+        except Exception as e:
+            return self.handle_exception(e)
+
+
+class AsyncArchiveTaskView(AsyncTaskView):
+    async def post(self, request):
+        try:
+            result = await TaskServices.aarchive_task_service(
+                task_id=self.request_data(request).get("id")
+            )
+            return self.respond(
+                {
+                    "message": (result.get("message")),
+                    "data": result.get("data"),
+                },
+                status.HTTP_201_CREATED,
+            )
+        except Exception as e:
+            return self.handle_exception(e)
+
+
+class AsyncSearchTaskView(AsyncTaskView):
+    async def get(self, request):
+        try:
+            query = request.GET.get("q")  # free-text search
+            status_filter = request.GET.get("status")
+            priority_filter = request.GET.get("priority")
+            tags_filter = request.GET.get("tags")  # comma separated, all must match
+            sort = request.GET.get("sort")  # due_date, created_at, priority; `-` for descending
+            cursor = request.GET.get("cursor")  # `next` of the previous page
+            limit = request.GET.get("limit")
+            # archived tasks are returned unless include_archived=false
+            include_archived = request.GET.get("include_archived") not in ("0", "false")
+            # opt-in: every match as NDJSON, streamed row by row instead of one page
+            stream = (
+                request.GET.get("stream") in ("1", "true")
+                or request.GET.get("format") == NDJSONRenderer.format
+                or NDJSON_MEDIA_TYPE in request.headers.get("Accept", "")
+            )
+
+            if stream:
+                lines = TaskServices.astream_search_task_service(
+                    query=query,
+                    status=status_filter,
+                    priority=priority_filter,
+                    tags=tags_filter.split(",") if tags_filter else None,
+                    sort=sort,
+                    include_archived=include_archived,
+                )
+                return StreamingHttpResponse(lines, content_type=NDJSON_MEDIA_TYPE)
+
+            result = await TaskServices.asearch_task_service(
+                query=query,
+                status=status_filter,
+                priority=priority_filter,
+                tags=tags_filter.split(",") if tags_filter else None,
+                sort=sort,
+                cursor=cursor,
+                limit=limit,
+                include_archived=include_archived,
+            )
+            if result is None:
+                return self.respond(
+                    {"message": "No data found for the given criteria."},
+                    status.HTTP_404_NOT_FOUND,
+                )
+            else:
+                return self.respond(
+                    {
+                        "message": "Data is fetched`",
+                        "data": result,
+                    },
+                    status.HTTP_200_OK,
+                )
+        except Exception as e:
+            return self.handle_exception(e)
@@ -0,0 +1,33 @@
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from tasks.export_types.request_data_types.bulk_add_task import BulkAddTaskRequestType
+from tasks.services.handlers.exception_handlers import ExceptionHandler
+from tasks.services.task_service.task_service import TaskServices
+
+
+class BulkAddTaskView(APIView):
+    renderer_classes = [JSONRenderer]
+
+    def post(self, request):
+        try:
+            result = TaskServices.bulk_create_task_service(
+                request_data=BulkAddTaskRequestType(**request.data)
+            )
+            return Response(
+                data={
+                    "message": (result.get("message")),
+                    "data": result.get("data"),
+                    "errors": result.get("errors"),
+                },
+                status=(
+                    status.HTTP_201_CREATED
+                    if result.get("data")
+                    else status.HTTP_400_BAD_REQUEST
+                ),
+                content_type="application/json",
+            )
+        except Exception as e:
+            return ExceptionHandler().handle_exception(e)
@@ -0,0 +1,28 @@
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from tasks.export_types.request_data_types.bulk_edit_task import BulkEditTaskRequestType
+from tasks.services.handlers.exception_handlers import ExceptionHandler
+from tasks.services.task_service.task_service import TaskServices
+
+
+class BulkEditTaskView(APIView):
+    renderer_classes = [JSONRenderer]
+
+    def post(self, request):
+        try:
+            result = TaskServices.bulk_edit_task_service(
+                request_data=BulkEditTaskRequestType(**request.data)
+            )
+            return Response(
+                data={
+                    "message": (result.get("message")),
+                    "data": result.get("data"),
+                },
+                status=status.HTTP_201_CREATED,
+                content_type="application/json",
+            )
+        except Exception as e:
+            return ExceptionHandler().handle_exception(e)
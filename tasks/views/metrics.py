@@ -0,0 +1,10 @@
+from django.http import HttpResponse
+from django.views import View
+
+from tasks.services.metrics import CONTENT_TYPE, MetricsRegistry
+
+
+class MetricsView(View):
+    # Prometheus scrapes with GET, in the text exposition format
+    def get(self, request):
+        return HttpResponse(MetricsRegistry().render(), content_type=CONTENT_TYPE)
@@ -1,25 +1,50 @@
+from django.http import StreamingHttpResponse
 from rest_framework import status
-from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from tasks.services.handlers.exception_handlers import ExceptionHandler
+from tasks.services.renderers import NDJSON_MEDIA_TYPE, FastJSONRenderer, NDJSONRenderer
 from tasks.services.task_service.task_service import TaskServices
 
 
 class SearchTaskView(APIView):
-    renderer_classes = [JSONRenderer]
+    renderer_classes = [FastJSONRenderer, NDJSONRenderer]
 
     def get(self, request):
         try:
             query = request.query_params.get("q")  # free-text search
             status_filter = request.query_params.get("status")
             priority_filter = request.query_params.get("priority")
+            tags_filter = request.query_params.get("tags")  # comma separated, all must match
+            sort = request.query_params.get("sort")  # due_date, created_at, priority; `-` for descending
+            cursor = request.query_params.get("cursor")  # `next` of the previous page
+            limit = request.query_params.get("limit")
+            # archived tasks are returned unless include_archived=false
+            include_archived = request.query_params.get("include_archived") not in ("0", "false")
+            # opt-in: every match as NDJSON, streamed row by row instead of one page
+            stream = request.query_params.get("stream") in ("1", "true")
+
+            if stream or request.accepted_renderer.format == NDJSONRenderer.format:
+                lines = TaskServices.stream_search_task_service(
+                    query=query,
+                    status=status_filter,
+                    priority=priority_filter,
+                    tags=tags_filter.split(",") if tags_filter else None,
+                    sort=sort,
+                    include_archived=include_archived,
+                )
+                return StreamingHttpResponse(lines, content_type=NDJSON_MEDIA_TYPE)
 
             result = TaskServices.search_task_service(
                 query=query,
                 status=status_filter,
                 priority=priority_filter,
+                tags=tags_filter.split(",") if tags_filter else None,
+                sort=sort,
+                cursor=cursor,
+                limit=limit,
+                include_archived=include_archived,
             )
             if result is None:
                 return Response(
@@ -31,7 +56,7 @@ class SearchTaskView(APIView):
                 return Response(
                     data={
                         "message": "Data is fetched`",
-                        "data": result.model_dump(),
+                        "data": result,
                     },
                     status=status.HTTP_200_OK,
                     content_type="application/json",